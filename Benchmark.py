@@ -0,0 +1,313 @@
+# Creator: Aidan Scott
+# Date: 10/18/26
+# Description: Times inserting and finding the records of the ID files in
+# each data structure of the main program without the interactive menus,
+# and writes the results as JSON or CSV so they can be compared between releases
+
+from Linked_List import LinkedList
+from Trees import BinarySearchTree, AVLTree, ArrayAVLTree, BPlusTree
+from Hashing import HashTableChaining, HashTableProbing, PROBING_STRATEGIES
+from Data_Structures_Main import SHORT_LIST_FILENAME, SHORT_LOOKUP_FILENAME, MEDIUM_LIST_FILENAME, \
+    MEDIUM_LOOKUP_FILENAME, LONG_LIST_FILENAME, LONG_LOOKUP_FILENAME, DEFAULT_HASH_TABLE_SIZE, \
+    DEFAULT_PROBING_STRATEGY, LONG_FILE_WARNING
+from Id_File_Loader import loadIds, preferBinaryFile
+import argparse
+import csv
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+
+# structure names accepted on the command line
+STRUCTURES = ("linked-list", "bst", "avl", "array-avl", "bplus", "chaining", "probing", "probing-array")
+PROBING_STRUCTURES = ("probing", "probing-array")
+
+# file sizes accepted on the command line and their list and lookup files
+FILE_SIZES = {"short": (SHORT_LIST_FILENAME, SHORT_LOOKUP_FILENAME),
+              "medium": (MEDIUM_LIST_FILENAME, MEDIUM_LOOKUP_FILENAME),
+              "long": (LONG_LIST_FILENAME, LONG_LOOKUP_FILENAME)}
+
+DEFAULT_REPETITIONS = 5
+DEFAULT_WARMUP = 1
+OUTPUT_FORMATS = ("json", "csv")
+
+# columns of each result, in CSV column order
+RESULT_FIELDS = ("structure", "probing", "fileSize", "phase", "operations", "repetitions",
+                 "minNs", "medianNs", "p95Ns", "opsPerSecond")
+
+def createStructure(structure, tableSize, probing):
+    """
+    Creates an empty data structure
+    :param structure (string): One of STRUCTURES
+    :param tableSize (int): The starting size of the hash tables
+    :param probing (string): The probing strategy of the probing hash tables
+    :return: The empty data structure
+    """
+    if structure == "linked-list":
+        return LinkedList()
+    elif structure == "bst":
+        return BinarySearchTree()
+    elif structure == "avl":
+        return AVLTree()
+    elif structure == "array-avl":
+        return ArrayAVLTree()
+    elif structure == "bplus":
+        return BPlusTree()
+    elif structure == "chaining":
+        return HashTableChaining(tableSize)
+    elif structure == "probing":
+        return HashTableProbing(tableSize, probing=probing)
+
+    return HashTableProbing(tableSize, backend="array", probing=probing)
+
+def insertIds(dataStructure, ids):
+    """
+    Inserts IDs into a data structure one at a time the way the main program does
+    :param dataStructure: The empty data structure
+    :param ids (array): The IDs being inserted
+    :return: The data structure, a new root for AVL trees
+    """
+    if isinstance(dataStructure, LinkedList):
+        for value in ids:
+            dataStructure.append(value)
+
+    # AVL inserts return the new root of the tree
+    elif isinstance(dataStructure, AVLTree):
+        for value in ids:
+            dataStructure = dataStructure.insert(value)
+
+    else:
+        for value in ids:
+            dataStructure.insert(value)
+
+    return dataStructure
+
+def findIds(dataStructure, ids):
+    """
+    Looks up IDs in a data structure one at a time
+    :param dataStructure: The loaded data structure
+    :param ids (array): The IDs being looked up
+    :return (int): The number of IDs found
+    """
+    foundCount = 0
+    for value in ids:
+        if dataStructure.find(value) is not None:
+            foundCount += 1
+
+    return foundCount
+
+def runRepetition(structure, existingIds, lookupIds, tableSize, probing):
+    """
+    Builds a data structure from the existing IDs and looks up the lookup IDs,
+        timing each phase with the garbage collector paused
+    :param structure (string): One of STRUCTURES
+    :param existingIds (array): The IDs inserted into the data structure
+    :param lookupIds (array): The IDs looked up in the data structure
+    :param tableSize (int): The starting size of the hash tables
+    :param probing (string): The probing strategy of the probing hash tables
+    :return (tuple): The insert and find times in nanoseconds
+    """
+    clock = time.perf_counter_ns
+    dataStructure = createStructure(structure, tableSize, probing)
+
+    gcWasEnabled = gc.isenabled()
+    gc.disable()
+
+    insertStartTime = clock()
+    dataStructure = insertIds(dataStructure, existingIds)
+    insertEndTime = clock()
+
+    findStartTime = clock()
+    findIds(dataStructure, lookupIds)
+    findEndTime = clock()
+
+    if gcWasEnabled:
+        gc.enable()
+
+    return insertEndTime - insertStartTime, findEndTime - findStartTime
+
+def percentile(sortedTimes, percent):
+    """
+    Finds the time below which a given percent of the times fall
+    :param sortedTimes (list): Times sorted from smallest to largest
+    :param percent (float): The percentile between 0 and 100
+    :return (int): The time at the percentile
+    """
+    index = int(round(percent / 100 * (len(sortedTimes) - 1)))
+
+    return sortedTimes[index]
+
+def summarizeTimes(times, operationCount):
+    """
+    Summarizes the times of the repetitions of one phase
+    :param times (list): The time of each repetition in nanoseconds
+    :param operationCount (int): The number of operations in each repetition
+    :return (dict): The min, median and p95 time in nanoseconds and the
+                    operations per second at the median time
+    """
+    sortedTimes = sorted(times)
+    median = statistics.median(sortedTimes)
+
+    if median > 0:
+        opsPerSecond = operationCount / (median / 1e9)
+    else:
+        opsPerSecond = 0.0
+
+    return {"minNs": sortedTimes[0],
+            "medianNs": median,
+            "p95Ns": percentile(sortedTimes, 95),
+            "opsPerSecond": opsPerSecond}
+
+def benchmarkStructure(structure, fileSize, existingIds, lookupIds, tableSize, probing, repetitions, warmup):
+    """
+    Runs the warmup and timed repetitions of one data structure on one file size
+    :param structure (string): One of STRUCTURES
+    :param fileSize (string): One of the keys of FILE_SIZES
+    :param existingIds (array): The IDs inserted into the data structure
+    :param lookupIds (array): The IDs looked up in the data structure
+    :param tableSize (int): The starting size of the hash tables
+    :param probing (string): The probing strategy, None for structures that do not probe
+    :param repetitions (int): The number of timed repetitions
+    :param warmup (int): The number of untimed repetitions run first
+    :return (list): A result dictionary for the insert phase and for the find phase
+    """
+    for i in range(warmup):
+        runRepetition(structure, existingIds, lookupIds, tableSize, probing)
+
+    insertTimes = []
+    findTimes = []
+    for i in range(repetitions):
+        insertTime, findTime = runRepetition(structure, existingIds, lookupIds, tableSize, probing)
+        insertTimes.append(insertTime)
+        findTimes.append(findTime)
+
+    results = []
+    for phase, times, operationCount in (("insert", insertTimes, len(existingIds)),
+                                         ("find", findTimes, len(lookupIds))):
+        result = {"structure": structure, "probing": probing, "fileSize": fileSize, "phase": phase,
+                  "operations": operationCount, "repetitions": repetitions}
+        result.update(summarizeTimes(times, operationCount))
+        results.append(result)
+
+    return results
+
+def runBenchmarks(structures, fileSizes, tableSize, probingStrategies, repetitions, warmup):
+    """
+    Benchmarks every chosen data structure on every chosen file size that exists.
+        Probing hash tables are run once for each chosen probing strategy.
+    :param structures (list): Names from STRUCTURES
+    :param fileSizes (list): Keys of FILE_SIZES
+    :param tableSize (int): The starting size of the hash tables
+    :param probingStrategies (list): Names from PROBING_STRATEGIES
+    :param repetitions (int): The number of timed repetitions
+    :param warmup (int): The number of untimed repetitions run first
+    :return (list): The result dictionaries
+    """
+    results = []
+
+    for fileSize in fileSizes:
+        listFileName, lookupFileName = FILE_SIZES[fileSize]
+        if not os.path.exists(listFileName) or not os.path.exists(lookupFileName):
+            print(f"{listFileName}: file not found, skipping", file=sys.stderr)
+            continue
+
+        existingIds = loadIds(preferBinaryFile(listFileName))
+        lookupIds = loadIds(preferBinaryFile(lookupFileName))
+
+        for structure in structures:
+            if structure == "linked-list" and fileSize == "long":
+                print(f"{LONG_FILE_WARNING}, skipping", file=sys.stderr)
+                continue
+
+            if structure in PROBING_STRUCTURES:
+                strategies = probingStrategies
+            else:
+                strategies = [None]
+
+            for probing in strategies:
+                print(f"{fileSize} {structure} {probing or ''}".rstrip(), file=sys.stderr)
+                results.extend(benchmarkStructure(structure, fileSize, existingIds, lookupIds, tableSize,
+                                                  probing, repetitions, warmup))
+
+    return results
+
+def writeResults(results, outputFormat, file):
+    """
+    Writes the result dictionaries as a JSON list or as CSV rows
+    :param results (list): The result dictionaries
+    :param outputFormat (string): One of OUTPUT_FORMATS
+    :param file: The file the results are written to
+    :return: None
+    """
+    if outputFormat == "json":
+        json.dump(results, file, indent=2)
+        file.write("\n")
+    else:
+        writer = csv.DictWriter(file, fieldnames=RESULT_FIELDS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(results)
+
+    return
+
+def parseArguments(arguments):
+    """
+    Parses the command line options of the benchmark
+    :param arguments (list): The command line arguments after the program name
+    :return (argparse.Namespace): The chosen options
+    """
+    parser = argparse.ArgumentParser(
+        description="Times inserting and finding the ID file records in each data structure. "
+                    "Results are written to standard output unless --output is given.")
+
+    parser.add_argument("--structures", nargs="+", choices=STRUCTURES, default=list(STRUCTURES),
+                        help="data structures to time (default all)")
+    parser.add_argument("--sizes", nargs="+", choices=tuple(FILE_SIZES), default=list(FILE_SIZES),
+                        help="file sizes to time, missing files are skipped (default all)")
+    parser.add_argument("--table-size", type=int, default=DEFAULT_HASH_TABLE_SIZE,
+                        help="starting size of the hash tables (default %(default)s)")
+    parser.add_argument("--probing", nargs="+", choices=PROBING_STRATEGIES, default=[DEFAULT_PROBING_STRATEGY],
+                        help="probing strategies of the probing hash tables (default %(default)s)")
+    parser.add_argument("--repetitions", type=int, default=DEFAULT_REPETITIONS,
+                        help="timed repetitions of each benchmark (default %(default)s)")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP,
+                        help="untimed repetitions run first (default %(default)s)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="json",
+                        help="output format (default %(default)s)")
+    parser.add_argument("--output", default=None,
+                        help="file to write the results to (default standard output)")
+
+    options = parser.parse_args(arguments)
+
+    if options.table_size < 1:
+        parser.error("the table size must be at least 1")
+    if options.repetitions < 1:
+        parser.error("there must be at least 1 repetition")
+    if options.warmup < 0:
+        parser.error("the warmup cannot be negative")
+
+    return options
+
+def main(arguments=None):
+    """
+    Runs the benchmarks chosen on the command line and writes the results
+    :param arguments (list): The command line arguments, None for sys.argv
+    """
+    if arguments is None:
+        arguments = sys.argv[1:]
+    options = parseArguments(arguments)
+
+    results = runBenchmarks(options.structures, options.sizes, options.table_size, options.probing,
+                            options.repetitions, options.warmup)
+
+    if options.output is None:
+        writeResults(results, options.format, sys.stdout)
+    else:
+        with open(options.output, "w", newline="") as outputFile:
+            writeResults(results, options.format, outputFile)
+
+    return
+
+if __name__ == "__main__":
+    main()
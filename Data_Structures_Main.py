@@ -14,22 +14,37 @@ SETTINGS_MENU_OPTION = "Settings"
 EXIT_MENU_OPTION = "Exit Program"
 SETTINGS_HASH_SIZE_OPTION = "Resize Hash Table"
 SETTINGS_PRINT_RECORDS_OPTION = "Toggle Printing Records"
+SETTINGS_PROBING_STRATEGY_OPTION = "Choose Probing Strategy"
+SETTINGS_BULK_LOAD_OPTION = "Toggle Bulk Loading Trees"
+SETTINGS_SAVED_INDEX_OPTION = "Toggle Saved Indexes"
+SETTINGS_INSTRUMENTATION_OPTION = "Toggle Latency Histograms"
+SETTINGS_MEMORY_TRACING_OPTION = "Toggle Peak Memory Tracing"
 SETTINGS_EXIT_OPTION = "Exit Settings Menu"
-HASH_SIZE_WARNING = "Warning: Prime numbers greater than the amount of records\nare recommended for the hash table size"
+HASH_SIZE_WARNING = "Note: Hash tables grow to a larger prime size automatically when they fill up,\nprime numbers are recommended for the starting hash table size"
 SHORT_FILE_OPTION = "Short File: 1,000 Records"
 MEDIUM_FILE_OPTION = "Medium File: 10,000 Records"
 LONG_FILE_OPTION = "Long File: 500,000 Records"
-LONG_FILE_WARNING = "WARNING: Long file should only be used for Hash Tables and AVL Trees"
+LONG_FILE_WARNING = "WARNING: Long file should not be used for Linked Lists"
 BINARY_SEARCH_TREE_OPTION = "Binary Search Tree"
 AVL_TREE_OPTION = "AVL Tree"
+ARRAY_AVL_TREE_OPTION = "AVL Tree (Typed Array Nodes)"
+BPLUS_TREE_OPTION = "B+ Tree"
 HASH_TABLE_CHAINING_OPTION = "Hash Table with Chaining"
 HASH_TABLE_PROBING_OPTION = "Hash Table with Probing"
+HASH_TABLE_PROBING_ARRAY_OPTION = "Hash Table with Probing (Typed Array Buckets)"
+# listed in the same order as Hashing.PROBING_STRATEGIES
+PROBING_STRATEGY_OPTIONS = ("Linear Probing", "Quadratic Probing", "Double Hashing", "Robin Hood Probing")
 
 PROMPT_MAIN_MENU_CHOICE = "Please enter an option (1, 2, S, etc.) or enter X to exit: "
 PROMPT_GENERAL_MENU_CHOICE = "Please enter an option (1, 2, etc.): "
 PROMPT_PRINT_TOGGLE_CHOICE = "Please enter 'Y' or 'N' to turn on or off record printing: "
 PROMPT_HASH_TABLE_SIZE = "Please enter a positive integer for the size of the hash table: "
 PROMPT_FILE_CHOICE = "Choose a file size to process: "
+PROMPT_PROBING_STRATEGY_CHOICE = "Choose the probing strategy for probing hash tables: "
+PROMPT_BULK_LOAD_CHOICE = "Please enter 'Y' or 'N' to turn on or off building trees from sorted records: "
+PROMPT_SAVED_INDEX_CHOICE = "Please enter 'Y' or 'N' to turn on or off saving and opening index files: "
+PROMPT_INSTRUMENTATION_CHOICE = "Please enter 'Y' or 'N' to turn on or off per-operation latency histograms: "
+PROMPT_MEMORY_TRACING_CHOICE = "Please enter 'Y' or 'N' to turn on or off tracing the peak memory of inserts and finds: "
 ERROR_INVALID_CHOICE = "Error: Invalid menu choice"
 
 # menu values
@@ -38,10 +53,18 @@ VALUE_TREES = "2"
 VALUE_HASH_TABLE = "3"
 VALUE_PRINT_TOGGLE = "1"
 VALUE_HASH_TABLE_SIZE = "2"
+VALUE_PROBING_STRATEGY = "3"
+VALUE_BULK_LOAD = "4"
+VALUE_SAVED_INDEX = "5"
+VALUE_INSTRUMENTATION = "6"
+VALUE_MEMORY_TRACING = "7"
 VALUE_BINARY_SEARCH_TREE = "1"
 VALUE_AVL_TREE = "2"
+VALUE_ARRAY_AVL_TREE = "3"
+VALUE_BPLUS_TREE = "4"
 VALUE_HASH_TABLE_CHAINING = "1"
 VALUE_HASH_TABLE_PROBING = "2"
+VALUE_HASH_TABLE_PROBING_ARRAY = "3"
 VALUE_SHORT_SIZE = "1"
 VALUE_MEDIUM_SIZE = "2"
 VALUE_LONG_SIZE = "3"
@@ -50,11 +73,11 @@ VALUE_LONG_SIZE = "3"
 LOW_BOUND_MAIN_MENU = 1
 HIGH_BOUND_MAIN_MENU = 3
 LOW_BOUND_SETTINGS_MENU = 1
-HIGH_BOUND_SETTINGS_MENU = 2
+HIGH_BOUND_SETTINGS_MENU = 7
 LOW_BOUND_FILE_MENU = 1
 HIGH_BOUND_FILE_MENU = 3
 LOW_BOUND_STRUCTURE_TYPE_MENU = 1
-HIGH_BOUND_STRUCTURE_TYPE_MENU = 2
+LOW_BOUND_PROBING_STRATEGY_MENU = 1
 
 # filenames
 SHORT_LIST_FILENAME = "listOfIdsShort.txt"
@@ -67,13 +90,28 @@ LONG_LOOKUP_FILENAME = "lookupListLong.txt"
 # other values
 DEFAULT_PRINT_TOGGLE = True
 DEFAULT_HASH_TABLE_SIZE = 1000003
+DEFAULT_PROBING_STRATEGY = "linear"
+DEFAULT_BULK_LOAD = False
+DEFAULT_SAVED_INDEX = False
+DEFAULT_INSTRUMENTATION = False
+DEFAULT_MEMORY_TRACING = False
 INDEX_PRINT_TOGGLE = 0
 INDEX_HASH_TABLE = 1
+INDEX_PROBING_STRATEGY = 2
+INDEX_BULK_LOAD = 3
+INDEX_SAVED_INDEX = 4
+INDEX_INSTRUMENTATION = 5
+INDEX_MEMORY_TRACING = 6
 
 from Linked_List import LinkedList
-from Trees import BinaryTree, BinarySearchTree, AVLTree
-from Hashing import HashTableProbing, HashTableChaining
+from Trees import BinaryTree, BinarySearchTree, AVLTree, ArrayAVLTree, BPlusTree
+from Hashing import HashTableProbing, HashTableChaining, PROBING_STRATEGIES
+from Id_File_Loader import loadIds, preferBinaryFile
+from Mapped_Index import saveHashIndex, saveSortedIndex, openIndex, getIndexFileName, isIndexCurrent, \
+    HASH_INDEX_EXTENSION, SORTED_INDEX_EXTENSION
+from Instrumentation import Instrumentation
 import time
+import tracemalloc
 
 def settingsMenu(settingsList):
     """
@@ -117,6 +155,26 @@ def settingsMenu(settingsList):
                 hashTableSize = getHashTableSize()
                 settingsList[INDEX_HASH_TABLE] = hashTableSize
 
+            elif menuChoice == VALUE_PROBING_STRATEGY:
+                probingStrategy = getProbingStrategy()
+                settingsList[INDEX_PROBING_STRATEGY] = probingStrategy
+
+            elif menuChoice == VALUE_BULK_LOAD:
+                bulkLoad = getBulkLoadChoice()
+                settingsList[INDEX_BULK_LOAD] = bulkLoad
+
+            elif menuChoice == VALUE_SAVED_INDEX:
+                savedIndex = getSavedIndexChoice()
+                settingsList[INDEX_SAVED_INDEX] = savedIndex
+
+            elif menuChoice == VALUE_INSTRUMENTATION:
+                instrumentationToggle = getInstrumentationChoice()
+                settingsList[INDEX_INSTRUMENTATION] = instrumentationToggle
+
+            elif menuChoice == VALUE_MEMORY_TRACING:
+                memoryTracing = getMemoryTracingChoice()
+                settingsList[INDEX_MEMORY_TRACING] = memoryTracing
+
 
     return
 
@@ -140,6 +198,11 @@ def printSettingsMenu():
     """
     print("\n1. " + SETTINGS_PRINT_RECORDS_OPTION)
     print("2. " + SETTINGS_HASH_SIZE_OPTION)
+    print("3. " + SETTINGS_PROBING_STRATEGY_OPTION)
+    print("4. " + SETTINGS_BULK_LOAD_OPTION)
+    print("5. " + SETTINGS_SAVED_INDEX_OPTION)
+    print("6. " + SETTINGS_INSTRUMENTATION_OPTION)
+    print("7. " + SETTINGS_MEMORY_TRACING_OPTION)
     print("X. " + SETTINGS_EXIT_OPTION)
 
     return
@@ -161,8 +224,9 @@ def printStructureTypeMenu(choices):
     Prints the contents of the structure type choice menu.
     :param choices (tuple): a tuple containing strings of the menu options
     """
-    print("\n1. " + choices[0])
-    print("2. " + choices[1])
+    print()
+    for i in range(len(choices)):
+        print(str(i + 1) + ". " + choices[i])
 
     return
 
@@ -192,6 +256,111 @@ def getPrintToggleChoice():
 
     return toggle
 
+def getBulkLoadChoice():
+    """
+    Displays interactive menu where user chooses to toggle building trees
+        from the sorted records at once instead of inserting them one at a time
+    :return (boolean): True if trees are chosen to be bulk loaded, False otherwise
+    """
+    validChoice = False
+    # user input validation loop
+    while not validChoice:
+        # collect user input
+        choice = input("\n" + PROMPT_BULK_LOAD_CHOICE)
+
+        # check if the choice is within the bounds of the menu choice
+        if choice.upper() == "Y":
+            toggle = True
+            validChoice = True
+
+        elif choice.upper() == "N":
+            toggle = False
+            validChoice = True
+
+        else:
+            print(ERROR_INVALID_CHOICE)
+
+    return toggle
+
+def getSavedIndexChoice():
+    """
+    Displays interactive menu where user chooses to toggle saving the built
+        hash tables and trees to index files and opening them on later runs
+    :return (boolean): True if indexes are chosen to be saved and opened, False otherwise
+    """
+    validChoice = False
+    # user input validation loop
+    while not validChoice:
+        # collect user input
+        choice = input("\n" + PROMPT_SAVED_INDEX_CHOICE)
+
+        # check if the choice is within the bounds of the menu choice
+        if choice.upper() == "Y":
+            toggle = True
+            validChoice = True
+
+        elif choice.upper() == "N":
+            toggle = False
+            validChoice = True
+
+        else:
+            print(ERROR_INVALID_CHOICE)
+
+    return toggle
+
+def getInstrumentationChoice():
+    """
+    Displays interactive menu where user chooses to toggle recording the
+        latency of each insert and find and what each find visits
+    :return (boolean): True if the operations are chosen to be recorded, False otherwise
+    """
+    validChoice = False
+    # user input validation loop
+    while not validChoice:
+        # collect user input
+        choice = input("\n" + PROMPT_INSTRUMENTATION_CHOICE)
+
+        # check if the choice is within the bounds of the menu choice
+        if choice.upper() == "Y":
+            toggle = True
+            validChoice = True
+
+        elif choice.upper() == "N":
+            toggle = False
+            validChoice = True
+
+        else:
+            print(ERROR_INVALID_CHOICE)
+
+    return toggle
+
+def getMemoryTracingChoice():
+    """
+    Displays interactive menu where user chooses to toggle tracing the peak
+        memory allocated while inserting and finding records. Tracing slows
+        down every allocation, so the times are longer while it is on.
+    :return (boolean): True if the peak memory is chosen to be traced, False otherwise
+    """
+    validChoice = False
+    # user input validation loop
+    while not validChoice:
+        # collect user input
+        choice = input("\n" + PROMPT_MEMORY_TRACING_CHOICE)
+
+        # check if the choice is within the bounds of the menu choice
+        if choice.upper() == "Y":
+            toggle = True
+            validChoice = True
+
+        elif choice.upper() == "N":
+            toggle = False
+            validChoice = True
+
+        else:
+            print(ERROR_INVALID_CHOICE)
+
+    return toggle
+
 def getHashTableSize():
     """
     Displays interactive menu where user chooses the hash table size
@@ -214,6 +383,34 @@ def getHashTableSize():
 
     return size
 
+def getProbingStrategy():
+    """
+    Displays interactive menu where user chooses the probing strategy
+        used by the probing hash tables
+    :return (string): The name of the probing strategy
+    """
+    validChoice = False
+    # user input validation loop
+    while not validChoice:
+        # print the probing strategies
+        print()
+        for i in range(len(PROBING_STRATEGIES)):
+            print(str(i + 1) + ". " + PROBING_STRATEGY_OPTIONS[i])
+
+        # collect user input
+        choice = input(PROMPT_PROBING_STRATEGY_CHOICE)
+
+        # check if the choice is within the bounds of the menu choice
+        if choice.isnumeric():
+            if LOW_BOUND_PROBING_STRATEGY_MENU <= int(choice) <= len(PROBING_STRATEGIES):
+                validChoice = True
+            else:
+                print(ERROR_INVALID_CHOICE)
+        else:
+            print(ERROR_INVALID_CHOICE)
+
+    return PROBING_STRATEGIES[int(choice) - 1]
+
 def getFileSize():
     """
     Displays interactive menu where user chooses the file size
@@ -243,7 +440,8 @@ def getFileNames(fileSize):
     """
     Gets the names of the files given a file size and returns names
         in the form of a tuple where the existing ID's are first
-        and the lookup ID's are second
+        and the lookup ID's are second. The binary version of a file
+        is used instead when it is up to date.
     :param fileSize: String indicating the size of the file
     :return (tuple): Tuple containing the existing and lookup file names
     """
@@ -256,7 +454,7 @@ def getFileNames(fileSize):
     elif fileSize == VALUE_LONG_SIZE:
         fileNames = tuple([LONG_LIST_FILENAME, LONG_LOOKUP_FILENAME])
 
-    return fileNames
+    return tuple([preferBinaryFile(fileName) for fileName in fileNames])
 
 def getStructureType(category):
     """
@@ -266,9 +464,11 @@ def getStructureType(category):
     :return (string): A value associated with the user's choice of data structure
     """
     if category == VALUE_TREES:
-        choices = tuple([BINARY_SEARCH_TREE_OPTION, AVL_TREE_OPTION])
+        choices = tuple([BINARY_SEARCH_TREE_OPTION, AVL_TREE_OPTION, ARRAY_AVL_TREE_OPTION,
+                         BPLUS_TREE_OPTION])
     elif category == VALUE_HASH_TABLE:
-        choices = tuple([HASH_TABLE_CHAINING_OPTION, HASH_TABLE_PROBING_OPTION])
+        choices = tuple([HASH_TABLE_CHAINING_OPTION, HASH_TABLE_PROBING_OPTION,
+                         HASH_TABLE_PROBING_ARRAY_OPTION])
 
     validChoice = False
     # user input validation loop
@@ -281,7 +481,7 @@ def getStructureType(category):
 
         # check if the choice is within the bounds of the menu choice
         if choice.isnumeric():
-            if LOW_BOUND_STRUCTURE_TYPE_MENU <= int(choice) <= HIGH_BOUND_STRUCTURE_TYPE_MENU:
+            if LOW_BOUND_STRUCTURE_TYPE_MENU <= int(choice) <= len(choices):
                 validChoice = True
             else:
                 print(ERROR_INVALID_CHOICE)
@@ -303,9 +503,6 @@ def runDemo(structureChoice, settingsList):
     fileSize = getFileSize()
     fileNameTuple = getFileNames(fileSize)
 
-    existingIds = open(fileNameTuple[0], "r")
-    lookupIds = open(fileNameTuple[1], "r")
-
     if structureChoice == VALUE_LINKED_LIST:
         dataStructure = LinkedList()
 
@@ -314,50 +511,134 @@ def runDemo(structureChoice, settingsList):
 
         if treeChoice == VALUE_BINARY_SEARCH_TREE:
             dataStructure = BinarySearchTree()
+            structureName = "bst"
 
         elif treeChoice == VALUE_AVL_TREE:
             dataStructure = AVLTree()
+            structureName = "avl"
+
+        elif treeChoice == VALUE_ARRAY_AVL_TREE:
+            dataStructure = ArrayAVLTree()
+            structureName = "array-avl"
+
+        elif treeChoice == VALUE_BPLUS_TREE:
+            dataStructure = BPlusTree()
+            structureName = "bplus"
 
     elif structureChoice == VALUE_HASH_TABLE:
         hashChoice = getStructureType(structureChoice)
 
         hashTableSize = settingsList[1]
+        probingStrategy = settingsList[INDEX_PROBING_STRATEGY]
 
         if hashChoice == VALUE_HASH_TABLE_CHAINING:
             dataStructure = HashTableChaining(hashTableSize)
+            structureName = "chaining"
 
         elif hashChoice == VALUE_HASH_TABLE_PROBING:
-            dataStructure = HashTableProbing(hashTableSize)
+            dataStructure = HashTableProbing(hashTableSize, probing=probingStrategy)
+            structureName = f"probing-{probingStrategy}"
+
+        elif hashChoice == VALUE_HASH_TABLE_PROBING_ARRAY:
+            dataStructure = HashTableProbing(hashTableSize, backend="array", probing=probingStrategy)
+            structureName = f"probing-array-{probingStrategy}"
+
+    # hash tables are saved as a hash table image and trees as a sorted array image
+    indexFileName = None
+    if settingsList[INDEX_SAVED_INDEX]:
+        if structureChoice == VALUE_HASH_TABLE:
+            indexFileName = getIndexFileName(fileNameTuple[0], structureName, HASH_INDEX_EXTENSION)
+        elif structureChoice == VALUE_TREES:
+            indexFileName = getIndexFileName(fileNameTuple[0], structureName, SORTED_INDEX_EXTENSION)
+
+    openedIndex = indexFileName is not None and isIndexCurrent(indexFileName, fileNameTuple[0])
+    if openedIndex:
+        print(f"\nUsing the saved index {indexFileName} instead of building the {structureName} structure")
+
+    loadStartTime = time.time()
+
+    # parse the ID files into typed arrays before timing the data structure
+    lookupIds = loadIds(fileNameTuple[1])
+    loadedIdCount = len(lookupIds)
+    if not openedIndex:
+        existingIds = loadIds(fileNameTuple[0])
+        loadedIdCount += len(existingIds)
+
+    loadEndTime = time.time()
+
+    # only the instrumented runs time each operation, the others run unchanged
+    instrumentation = None
+    if settingsList[INDEX_INSTRUMENTATION]:
+        instrumentation = Instrumentation()
+
+    # trace the memory allocated while building and searching the data structure
+    memoryTracing = settingsList[INDEX_MEMORY_TRACING]
+    if memoryTracing:
+        tracemalloc.start()
 
     insertStartTime = time.time()
 
     existingIdCount = 0
+    # map the saved index instead of building the data structure
+    if openedIndex:
+        dataStructure = openIndex(indexFileName)
+        existingIdCount = len(dataStructure)
+
+    # build the whole tree from the sorted ID's at once
+    elif structureChoice == VALUE_TREES and settingsList[INDEX_BULK_LOAD]:
+        dataStructure = type(dataStructure).fromSorted(existingIds)
+        existingIdCount = len(existingIds)
+
+    # time each insert of the existing ID's
+    elif instrumentation is not None:
+        dataStructure = instrumentation.insertAll(dataStructure, existingIds)
+        existingIdCount = len(existingIds)
+
     # insert existing ID's into data structure
-    for line in existingIds:
-        id = line.strip()
-        if structureChoice == VALUE_LINKED_LIST:
-            dataStructure.append(int(id))
+    else:
+        for id in existingIds:
+            if structureChoice == VALUE_LINKED_LIST:
+                dataStructure.append(id)
 
-        elif dataStructure is AVLTree:
-            dataStructure = dataStructure.insert(int(id))
+            # AVL inserts return the new root of the tree
+            elif isinstance(dataStructure, AVLTree):
+                dataStructure = dataStructure.insert(id)
 
-        else:
-            dataStructure.insert(int(id))
+            else:
+                dataStructure.insert(id)
 
-        existingIdCount += 1
+            existingIdCount += 1
 
     insertEndTime = time.time()
 
+    if memoryTracing:
+        insertPeakBytes = tracemalloc.get_traced_memory()[1]
+
+    # save the built data structure so later runs can open it instead
+    if indexFileName is not None and not openedIndex:
+        if structureChoice == VALUE_HASH_TABLE:
+            saveHashIndex(dataStructure, indexFileName)
+        else:
+            saveSortedIndex(dataStructure, indexFileName)
+        print(f"\nSaved the index to {indexFileName}")
+
+    find = dataStructure.find
+    if instrumentation is not None:
+        find = instrumentation.wrapFind(dataStructure)
+
+    # the find peak only counts memory allocated after the data structure was built
+    if memoryTracing:
+        tracemalloc.reset_peak()
+        findBaseBytes = tracemalloc.get_traced_memory()[0]
+
     findStartTime = time.time()
 
     printToggle = settingsList[0]
 
     lookupIdCount = 0
     # search for lookup ID's
-    for record in lookupIds:
-        lookup = record.strip()
-
-        result = dataStructure.find(int(lookup))
+    for lookup in lookupIds:
+        result = find(lookup)
 
         if fileSize != VALUE_LONG_SIZE and printToggle:
             if result is not None:
@@ -370,9 +651,35 @@ def runDemo(structureChoice, settingsList):
 
     findEndTime = time.time()
 
-    # print out time it takes to insert and find records
-    print(f"\nTime to insert {existingIdCount} records is: {insertEndTime - insertStartTime} seconds")
-    print(f"Time to insert {lookupIdCount} records is: {findEndTime - findStartTime} seconds")
+    if memoryTracing:
+        findPeakBytes = tracemalloc.get_traced_memory()[1] - findBaseBytes
+        tracemalloc.stop()
+
+    # walk the data structure for its size after the timed work is done
+    structureBytes = dataStructure.memoryUsage()
+    bytesPerKey = structureBytes / max(existingIdCount, 1)
+
+    if openedIndex:
+        dataStructure.close()
+
+    # print out time it takes to load, insert and find records
+    print(f"\nTime to load {loadedIdCount} records from the files is: {loadEndTime - loadStartTime} seconds")
+    if openedIndex:
+        print(f"Time to open the saved index of {existingIdCount} records is: {insertEndTime - insertStartTime} seconds, "
+              f"using {structureBytes} bytes ({bytesPerKey:.1f} bytes per key)")
+    else:
+        print(f"Time to insert {existingIdCount} records is: {insertEndTime - insertStartTime} seconds, "
+              f"using {structureBytes} bytes ({bytesPerKey:.1f} bytes per key)")
+    if memoryTracing:
+        print(f"Peak memory traced while inserting is: {insertPeakBytes} bytes "
+              f"({insertPeakBytes / max(existingIdCount, 1):.1f} bytes per key)")
+
+    print(f"Time to find {lookupIdCount} records is: {findEndTime - findStartTime} seconds")
+    if memoryTracing:
+        print(f"Peak memory traced while finding is: {findPeakBytes} bytes")
+
+    if instrumentation is not None:
+        print("\n" + instrumentation.report())
 
 
     return
@@ -385,7 +692,13 @@ def main():
     # set default settings values
     printToggle = DEFAULT_PRINT_TOGGLE
     hashTableSize = DEFAULT_HASH_TABLE_SIZE
-    settingsList = [printToggle, hashTableSize]
+    probingStrategy = DEFAULT_PROBING_STRATEGY
+    bulkLoad = DEFAULT_BULK_LOAD
+    savedIndex = DEFAULT_SAVED_INDEX
+    instrumentationToggle = DEFAULT_INSTRUMENTATION
+    memoryTracing = DEFAULT_MEMORY_TRACING
+    settingsList = [printToggle, hashTableSize, probingStrategy, bulkLoad, savedIndex, instrumentationToggle,
+                    memoryTracing]
 
     # print welcome message
     input(WELCOME_MESSAGE)
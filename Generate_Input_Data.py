@@ -3,6 +3,7 @@
 # Description: Generates the data that is used for the
 # existing set of data in the main program.
 # ONLY RUN ONE TIME TO GET THE DATA, IT WILL OVERRIDE THE EXISTING TEXT FILES
+# Run with command line options (see --help) to stream a custom dataset instead
 
 # global constants
 ID_LOWER_BOUND = 10000000
@@ -14,6 +15,44 @@ MEDIUM_ID_COUNT = 10000
 LONG_ID_COUNT = 500000
 LIST_SIZE_DIVISOR = 100
 
+# also write each list as a binary ID file next to its text file,
+# which the main program loads instead of the text file
+WRITE_BINARY_FILES = False
+
+# seed for the random number generator, None gives different files each run
+DEFAULT_SEED = None
+
+# lists of at least this many IDs are sampled with NumPy when it is
+# installed, which is faster and uses less memory for millions of IDs
+NUMPY_SAMPLE_THRESHOLD = 1000000
+
+# number of IDs joined into one string per write
+WRITE_BLOCK_SIZE = 100000
+
+# options of the command line generator
+DISTRIBUTIONS = ("uniform", "sequential", "clustered")
+LOOKUP_DISTRIBUTIONS = ("uniform", "zipf")
+DEFAULT_HIT_RATIO = LIST_SIZE_DIVISOR / (LIST_SIZE_DIVISOR + 1)
+DEFAULT_ZIPF_EXPONENT = 1.0
+DEFAULT_CLUSTER_SIZE = 1000
+CUSTOM_LIST_FILENAME = "listOfIdsCustom.txt"
+CUSTOM_LOOKUP_FILENAME = "lookupListCustom.txt"
+
+# number of IDs made and written at a time when streaming a dataset
+STREAM_BLOCK_SIZE = 1 << 16
+
+# a streamed dataset is split into parts of this many IDs that worker
+# processes write at the same time, None workers uses one per CPU
+PART_SIZE = 1 << 20
+DEFAULT_WORKERS = None
+
+# the Feistel network that shuffles the ID range mixes each half of
+# a number with a 64-bit multiply and shift in every round
+FEISTEL_ROUNDS = 4
+ROUND_MULTIPLIER = 0x9E3779B97F4A7C15
+ROUND_SHIFT = 29
+UINT64_MASK = 2 ** 64 - 1
+
 SHORT_LIST_FILENAME = "listOfIdsShort.txt"
 SHORT_LOOKUP_FILENAME = "lookupListShort.txt"
 MEDIUM_LIST_FILENAME = "listOfIdsMedium.txt"
@@ -21,54 +60,77 @@ MEDIUM_LOOKUP_FILENAME = "lookupListMedium.txt"
 LONG_LIST_FILENAME = "listOfIdsLong.txt"
 LONG_LOOKUP_FILENAME = "lookupListLong.txt"
 
+from Id_File_Loader import writeBinaryIds, writeBinaryIdChunks, getBinaryFileName, concatenateIdFiles, \
+    BINARY_EXTENSION
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import os
 import random
+import sys
+import tempfile
+import time
+
+# NumPy is optional, large lists are sampled with the random module without it
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def sampleUniqueIds(lowerBound, upperBound, size, generator=random):
+    """
+    Picks unique random ID's between two bounds in linear time
+        by sampling the range without replacement
+    :param lowerBound (int): The smallest ID that can be picked
+    :param upperBound (int): The largest ID that can be picked
+    :param size (int): The amount of IDs to pick
+    :param generator (random.Random): The random number generator
+    :return (list): The unique IDs in random order
+    :raises: ValueError if the range has fewer than size IDs
+    """
+    if numpy is not None and size >= NUMPY_SAMPLE_THRESHOLD:
+        # seed NumPy from the generator so a seeded run is reproducible
+        numpyGenerator = numpy.random.default_rng(generator.getrandbits(64))
+        offsets = numpyGenerator.choice(upperBound - lowerBound + 1, size, replace=False)
+
+        return (offsets + lowerBound).tolist()
+
+    return generator.sample(range(lowerBound, upperBound + 1), size)
 
-def generateIdList(idList, size):
+def generateIdList(idList, size, generator=random):
     """
     Generate a list of unique ID's given a list size
     :param idList (list): list for the IDs to be added to
     :param size (int): the amount of IDs to be added to the list
+    :param generator (random.Random): The random number generator
     :return: None
     """
-    for i in range(size):
-        numberUsed = False
-        while not numberUsed:
-            randomId = random.randint(ID_LOWER_BOUND, ID_UPPER_BOUND)
-
-            if randomId not in idList:
-                idList.append(randomId)
-                numberUsed = True
+    idList.extend(sampleUniqueIds(ID_LOWER_BOUND, ID_UPPER_BOUND, size, generator))
 
     return
 
-def generateFalseIdList(someList, size):
+def generateFalseIdList(someList, size, generator=random):
     """
     Generates a list of false ID's one digit longer than real ID's
     given the size of the original list of ID's
     :param someList: The list for the false ID's to be added to the text file
     :param size: The size of the original list of ID's
+    :param generator (random.Random): The random number generator
     :return: None
     """
     # generate one false ID for every LIST_SIZE_DIVISOR real ID's
-    for i in range(size // LIST_SIZE_DIVISOR):
-        numberUsed = False
-        while not numberUsed:
-
-            randomId = random.randint(FALSE_ID_LOWER_BOUND, FALSE_ID_UPPER_BOUND)
-
-            if randomId not in someList:
-                someList.append(randomId)
-                numberUsed = True
+    someList.extend(sampleUniqueIds(FALSE_ID_LOWER_BOUND, FALSE_ID_UPPER_BOUND,
+                                    size // LIST_SIZE_DIVISOR, generator))
 
     return
 
-def mergeLists(someList, otherList):
+def mergeLists(someList, otherList, generator=random):
     """
     Merges two lists by placing the contents of
         the smaller list at somewhat regular intervals
         between the items in the larger list in a new list.
     :param someList: A nonempty list
     :param otherList: A nonempty list
+    :param generator (random.Random): The random number generator
     :return: Merged List
     """
     # swap lists to ensure someList is larger
@@ -87,14 +149,13 @@ def mergeLists(someList, otherList):
 
     while finalListLength < len(someList) + len(otherList):
 
-        insertIndex = random.randint(0, interval)
+        insertIndex = generator.randint(0, interval)
 
         # append values up to the insert index
-        for i in range(0, insertIndex - 1):
-            if someListLength < len(someList):
-                mergedList.append(someList[someListLength])
-                someListLength += 1
-                finalListLength += 1
+        count = min(max(insertIndex - 1, 0), len(someList) - someListLength)
+        mergedList.extend(someList[someListLength:someListLength + count])
+        someListLength += count
+        finalListLength += count
 
         # append the value from the smaller list
         if otherListLength < len(otherList):
@@ -103,11 +164,10 @@ def mergeLists(someList, otherList):
             finalListLength += 1
 
         # append the values up to the end of the interval
-        for i in range(insertIndex, interval):
-            if someListLength < len(someList):
-                mergedList.append(someList[someListLength])
-                someListLength += 1
-                finalListLength += 1
+        count = min(max(interval - insertIndex, 0), len(someList) - someListLength)
+        mergedList.extend(someList[someListLength:someListLength + count])
+        someListLength += count
+        finalListLength += count
 
     return mergedList
 
@@ -119,15 +179,460 @@ def writeListToFile(someList, file):
     :param file: The file for the list to be written to
     :return: None
     """
-    for element in someList:
-        file.write(str(element) + "\n")
+    # join blocks of lines so there are few large writes
+    for start in range(0, len(someList), WRITE_BLOCK_SIZE):
+        block = someList[start:start + WRITE_BLOCK_SIZE]
+        file.write("\n".join(map(str, block)) + "\n")
+
+    return
+
+class IndexPermutation:
+    def __init__(self, size, generator=random):
+        """
+        Constructor: a random order of the numbers from 0 to size - 1 that
+            is never stored. Each position is mapped to its number on its
+            own by a keyed Feistel network over the smallest even number of
+            bits that holds size - 1, walking the cycle until the result is
+            below size, so any range of positions can be made independently.
+        :param size (int): The amount of numbers being shuffled
+        :param generator (random.Random): The random number generator for the keys
+        """
+        self.__size = size
+        self.__halfBits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self.__halfMask = (1 << self.__halfBits) - 1
+        self.__keys = [generator.getrandbits(32) for i in range(FEISTEL_ROUNDS)]
+
+        return
+
+    def __len__(self):
+        """
+        Gets the amount of numbers being shuffled
+        :return (int): The size of the permutation
+        """
+        return self.__size
+
+    def __encrypt(self, value):
+        """
+        Runs one pass of the Feistel network, a shuffle of every number
+            that fits in twice the half width, on one number or a NumPy array
+        :param value (int or numpy array): The numbers being shuffled
+        :return (int or numpy array): The shuffled numbers
+        """
+        left = value >> self.__halfBits
+        right = value & self.__halfMask
+
+        for key in self.__keys:
+            # the 64-bit multiply wraps the same way for ints and NumPy arrays
+            mixed = ((right ^ key) * ROUND_MULTIPLIER) & UINT64_MASK
+            left, right = right, left ^ ((mixed ^ (mixed >> ROUND_SHIFT)) & self.__halfMask)
+
+        return (left << self.__halfBits) | right
+
+    def at(self, position):
+        """
+        Gets the number at a position of the permutation
+        :param position (int): The position, from 0 to size - 1
+        :return (int): The number at the position
+        """
+        value = self.__encrypt(position)
+        while value >= self.__size:
+            value = self.__encrypt(value)
+
+        return value
+
+    def atMany(self, positions):
+        """
+        Gets the numbers at many positions of the permutation at once
+        :param positions (numpy array): The positions as unsigned 64-bit ints
+        :return (numpy array): The numbers at the positions
+        """
+        values = self.__encrypt(positions)
+
+        outside = values >= self.__size
+        while outside.any():
+            values[outside] = self.__encrypt(values[outside])
+            outside = values >= self.__size
+
+        return values
+
+class IdSequence:
+    def __init__(self, count, distribution="uniform", clusterSize=DEFAULT_CLUSTER_SIZE, generator=random):
+        """
+        Constructor: the unique IDs of a dataset in file order, where the
+            ID at any index can be made without making the ones before it
+        :param count (int): The amount of IDs
+        :param distribution (string): How the IDs are spread over the ID range,
+                                      one of DISTRIBUTIONS. "uniform" picks IDs
+                                      anywhere in the range in random order,
+                                      "sequential" counts up from the lowest ID
+                                      and "clustered" places runs of consecutive
+                                      IDs at random spots in the range.
+        :param clusterSize (int): The amount of consecutive IDs in each cluster
+        :param generator (random.Random): The random number generator
+        :raises: ValueError if the distribution is unknown or the ID range
+                 cannot hold count unique IDs
+        """
+        idRangeSize = ID_UPPER_BOUND - ID_LOWER_BOUND + 1
+
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution: {distribution}")
+        if clusterSize < 1:
+            raise ValueError("Cluster size must be at least 1")
+
+        self.__count = count
+        self.__distribution = distribution
+        self.__clusterSize = clusterSize
+        self.__permutation = None
+
+        if distribution == "uniform":
+            self.__permutation = IndexPermutation(idRangeSize, generator)
+        elif distribution == "clustered":
+            self.__permutation = IndexPermutation(idRangeSize // clusterSize, generator)
+            idRangeSize = len(self.__permutation) * clusterSize
+
+        if count > idRangeSize:
+            raise ValueError(f"The ID range only holds {idRangeSize} unique {distribution} IDs")
+
+        return
+
+    def __len__(self):
+        """
+        Gets the amount of IDs in the sequence
+        :return (int): The amount of IDs
+        """
+        return self.__count
+
+    def getId(self, index):
+        """
+        Gets the ID at an index of the sequence
+        :param index (int): The index, from 0 to count - 1
+        :return (int): The ID at the index
+        """
+        if self.__distribution == "sequential":
+            return ID_LOWER_BOUND + index
+
+        elif self.__distribution == "uniform":
+            return ID_LOWER_BOUND + self.__permutation.at(index)
+
+        # consecutive IDs within a cluster placed at a shuffled cluster slot
+        slot = self.__permutation.at(index // self.__clusterSize)
+        return ID_LOWER_BOUND + slot * self.__clusterSize + index % self.__clusterSize
+
+    def getIds(self, indexes):
+        """
+        Gets the IDs at many indexes of the sequence
+        :param indexes (list): The indexes, each from 0 to count - 1
+        :return (list): The IDs at the indexes
+        """
+        if numpy is None:
+            return [self.getId(index) for index in indexes]
+
+        indexes = numpy.asarray(indexes, dtype=numpy.uint64)
+
+        if self.__distribution == "sequential":
+            ids = indexes
+        elif self.__distribution == "uniform":
+            ids = self.__permutation.atMany(indexes)
+        else:
+            clusterSize = numpy.uint64(self.__clusterSize)
+            ids = self.__permutation.atMany(indexes // clusterSize) * clusterSize + indexes % clusterSize
+
+        return (ids.astype(numpy.int64) + ID_LOWER_BOUND).tolist()
+
+    def iterBlocks(self, start=0, stop=None, blockSize=STREAM_BLOCK_SIZE):
+        """
+        Streams the IDs between two indexes a block at a time
+        :param start (int): The index of the first ID
+        :param stop (int): The index after the last ID, None for the end of the sequence
+        :param blockSize (int): The amount of IDs in each block
+        :return (generator): A list of IDs for each block, in order
+        """
+        if stop is None:
+            stop = self.__count
+
+        for blockStart in range(start, stop, blockSize):
+            yield self.getIds(range(blockStart, min(blockStart + blockSize, stop)))
+
+        return
+
+def sampleZipfRanks(uniforms, count, exponent):
+    """
+    Turns uniform random numbers into ranks from 0 to count - 1 where rank r
+        is picked about as often as 1 / (r + 1) ** exponent, using the inverse
+        of the cumulative distribution of a bounded power law
+    :param uniforms (float or numpy array): Uniform random numbers in [0, 1)
+    :param count (int): The amount of ranks
+    :param exponent (float): How skewed the ranks are, 0 is uniform
+    :return (int or numpy array): The ranks
+    """
+    if exponent == 1:
+        ranks = (count + 1) ** uniforms
+    else:
+        power = 1 - exponent
+        ranks = (1 + uniforms * ((count + 1) ** power - 1)) ** (1 / power)
+
+    # rounding can reach count at the top of the range
+    if numpy is None:
+        return min(int(ranks) - 1, count - 1)
+
+    return numpy.minimum(ranks.astype(numpy.int64) - 1, count - 1)
+
+def iterLookupBlocks(sequence, lookupCount, hitRatio, lookupDistribution="uniform",
+                     zipfExponent=DEFAULT_ZIPF_EXPONENT, generator=random, blockSize=STREAM_BLOCK_SIZE):
+    """
+    Streams lookups for a sequence of IDs a block at a time. Each lookup is
+        an ID in the sequence with a chance of hitRatio and otherwise a
+        false ID one digit longer than the real ones.
+    :param sequence (IdSequence): The IDs stored in the data structure
+    :param lookupCount (int): The amount of lookups
+    :param hitRatio (float): The chance that a lookup is a stored ID, from 0 to 1
+    :param lookupDistribution (string): One of LOOKUP_DISTRIBUTIONS. "uniform"
+                                        looks every stored ID up equally often,
+                                        "zipf" looks the first IDs of the
+                                        sequence up much more often than the rest.
+    :param zipfExponent (float): How skewed the zipf lookups are
+    :param generator (random.Random): The random number generator
+    :param blockSize (int): The amount of lookups in each block
+    :return (generator): A list of lookup IDs for each block
+    :raises: ValueError if the lookup distribution is unknown
+    """
+    if lookupDistribution not in LOOKUP_DISTRIBUTIONS:
+        raise ValueError(f"Unknown lookup distribution: {lookupDistribution}")
+
+    # every lookup misses when nothing is stored
+    if len(sequence) == 0:
+        hitRatio = 0
+
+    if numpy is not None:
+        numpyGenerator = numpy.random.default_rng(generator.getrandbits(64))
+
+    for blockStart in range(0, lookupCount, blockSize):
+        size = min(blockSize, lookupCount - blockStart)
+
+        if numpy is None:
+            block = []
+            for i in range(size):
+                if generator.random() < hitRatio:
+                    if lookupDistribution == "zipf":
+                        index = sampleZipfRanks(generator.random(), len(sequence), zipfExponent)
+                    else:
+                        index = generator.randrange(len(sequence))
+                    block.append(sequence.getId(index))
+                else:
+                    block.append(generator.randint(FALSE_ID_LOWER_BOUND, FALSE_ID_UPPER_BOUND))
+
+        else:
+            hits = numpyGenerator.random(size) < hitRatio
+            hitCount = int(hits.sum())
+
+            if lookupDistribution == "zipf":
+                indexes = sampleZipfRanks(numpyGenerator.random(hitCount), len(sequence), zipfExponent)
+            else:
+                indexes = numpyGenerator.integers(0, max(len(sequence), 1), hitCount)
+
+            block = numpyGenerator.integers(FALSE_ID_LOWER_BOUND, FALSE_ID_UPPER_BOUND + 1, size)
+            block[hits] = sequence.getIds(indexes)
+            block = block.tolist()
+
+        yield block
 
     return
 
-def main():
+def writeIdBlocks(blocks, fileName):
+    """
+    Writes blocks of IDs to a file as they are made, as a binary ID file
+        when the name ends in the binary extension and as text otherwise
+    :param blocks (iterable): Lists of IDs in file order
+    :param fileName (string): The name of the file
+    :return (int): The amount of IDs written
+    """
+    if fileName.endswith(BINARY_EXTENSION):
+        return writeBinaryIdChunks(blocks, fileName)
+
+    count = 0
+    file = open(fileName, "w")
+    for block in blocks:
+        writeListToFile(block, file)
+        count += len(block)
+    file.close()
+
+    return count
+
+def writeDatasetPart(sequenceOptions, start, stop, fileName, lookupOptions=None):
+    """
+    Writes one part of a dataset to its own file. Each part is run by a
+        worker process, which rebuilds the ID sequence from its seed, so
+        the parts never share state and every worker count gives the same files.
+    :param sequenceOptions (tuple): The count, distribution, cluster size and
+                                    seed of the ID sequence
+    :param start (int): The index of the first stored ID or lookup of the part
+    :param stop (int): The index after the last stored ID or lookup of the part
+    :param fileName (string): The name of the part file
+    :param lookupOptions (tuple): The hit ratio, lookup distribution, zipf
+                                  exponent and seed of a part of the lookups,
+                                  None for a part of the stored IDs
+    :return (int): The amount of IDs written
+    """
+    count, distribution, clusterSize, sequenceSeed = sequenceOptions
+    sequence = IdSequence(count, distribution, clusterSize, random.Random(sequenceSeed))
+
+    if lookupOptions is None:
+        return writeIdBlocks(sequence.iterBlocks(start, stop), fileName)
+
+    hitRatio, lookupDistribution, zipfExponent, partSeed = lookupOptions
+    lookupBlocks = iterLookupBlocks(sequence, stop - start, hitRatio, lookupDistribution,
+                                    zipfExponent, random.Random(partSeed))
+
+    return writeIdBlocks(lookupBlocks, fileName)
+
+def generateDataset(listFileName, lookupFileName, count, lookupCount=None, hitRatio=DEFAULT_HIT_RATIO,
+                    distribution="uniform", lookupDistribution="uniform",
+                    zipfExponent=DEFAULT_ZIPF_EXPONENT, clusterSize=DEFAULT_CLUSTER_SIZE, seed=DEFAULT_SEED,
+                    workers=DEFAULT_WORKERS):
+    """
+    Streams a list of unique IDs and a list of lookups to files a block at a
+        time, so datasets larger than memory can be made. Both lists are split
+        into parts of PART_SIZE IDs that a pool of worker processes writes to
+        part files at the same time, which are then joined in order.
+    :param listFileName (string): The name of the file of stored IDs
+    :param lookupFileName (string): The name of the file of lookup IDs
+    :param count (int): The amount of stored IDs
+    :param lookupCount (int): The amount of lookups, None for one per stored ID
+                              plus one per LIST_SIZE_DIVISOR stored IDs
+    :param hitRatio (float): The chance that a lookup is a stored ID
+    :param distribution (string): How the stored IDs are spread, one of DISTRIBUTIONS
+    :param lookupDistribution (string): How the lookups pick stored IDs,
+                                        one of LOOKUP_DISTRIBUTIONS
+    :param zipfExponent (float): How skewed the zipf lookups are
+    :param clusterSize (int): The amount of consecutive IDs in each cluster
+    :param seed: The seed for the random number generator, None for a random seed
+    :param workers (int): The amount of worker processes, None for one per CPU
+    :return: None
+    :raises: ValueError if the options cannot make a dataset
+    """
+    generator = random.Random(seed)
+
+    if lookupCount is None:
+        lookupCount = count + count // LIST_SIZE_DIVISOR
+    if lookupDistribution not in LOOKUP_DISTRIBUTIONS:
+        raise ValueError(f"Unknown lookup distribution: {lookupDistribution}")
+
+    # build the sequence once here so bad options fail before any worker starts
+    sequenceOptions = (count, distribution, clusterSize, generator.getrandbits(64))
+    IdSequence(count, distribution, clusterSize, random.Random(sequenceOptions[3]))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # each part of the lookups gets its own seed, drawn in order
+    listParts = [(start, min(start + PART_SIZE, count), None)
+                 for start in range(0, count, PART_SIZE)]
+    lookupParts = [(start, min(start + PART_SIZE, lookupCount),
+                    (hitRatio, lookupDistribution, zipfExponent, generator.getrandbits(64)))
+                   for start in range(0, lookupCount, PART_SIZE)]
+
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(listFileName))) as partDirectory:
+        tasks = []
+        for fileName, parts in ((listFileName, listParts), (lookupFileName, lookupParts)):
+            # parts are written in the format of the file they are joined into
+            extension = BINARY_EXTENSION if fileName.endswith(BINARY_EXTENSION) else ".txt"
+            for start, stop, lookupOptions in parts:
+                partFileName = os.path.join(partDirectory, f"part{len(tasks)}{extension}")
+                tasks.append((start, stop, partFileName, lookupOptions))
+
+        if workers <= 1 or len(tasks) <= 1:
+            for task in tasks:
+                writeDatasetPart(sequenceOptions, *task)
+        else:
+            with ProcessPoolExecutor(min(workers, len(tasks))) as pool:
+                futures = [pool.submit(writeDatasetPart, sequenceOptions, *task) for task in tasks]
+                for future in futures:
+                    future.result()
+
+        concatenateIdFiles([task[2] for task in tasks[:len(listParts)]], listFileName)
+        concatenateIdFiles([task[2] for task in tasks[len(listParts):]], lookupFileName)
+
+    return
+
+def parseArguments(arguments):
+    """
+    Parses the command line options of the dataset generator
+    :param arguments (list): The command line arguments after the program name
+    :return (argparse.Namespace): The chosen options
+    """
+    parser = argparse.ArgumentParser(
+        description="Generates a list of unique IDs and a list of lookups. "
+                    "Files ending in " + BINARY_EXTENSION + " are written as binary ID files. "
+                    "Run without options to generate the short, medium and long files.")
+
+    parser.add_argument("--count", type=int, default=MEDIUM_ID_COUNT,
+                        help="amount of unique IDs to store (default %(default)s)")
+    parser.add_argument("--lookups", type=int, default=None,
+                        help="amount of lookups (default one per ID plus one per "
+                             f"{LIST_SIZE_DIVISOR} IDs)")
+    parser.add_argument("--hit-ratio", type=float, default=DEFAULT_HIT_RATIO,
+                        help="chance that a lookup is a stored ID (default %(default).3f)")
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="uniform",
+                        help="how the stored IDs are spread over the ID range (default %(default)s)")
+    parser.add_argument("--lookup-distribution", choices=LOOKUP_DISTRIBUTIONS, default="uniform",
+                        help="how the lookups pick stored IDs (default %(default)s)")
+    parser.add_argument("--zipf-exponent", type=float, default=DEFAULT_ZIPF_EXPONENT,
+                        help="skew of the zipf lookups (default %(default)s)")
+    parser.add_argument("--cluster-size", type=int, default=DEFAULT_CLUSTER_SIZE,
+                        help="consecutive IDs in each cluster (default %(default)s)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED,
+                        help="seed for reproducible files (default random)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="worker processes writing parts of the files (default one per CPU)")
+    parser.add_argument("--list-file", default=CUSTOM_LIST_FILENAME,
+                        help="file of stored IDs (default %(default)s)")
+    parser.add_argument("--lookup-file", default=CUSTOM_LOOKUP_FILENAME,
+                        help="file of lookup IDs (default %(default)s)")
+
+    options = parser.parse_args(arguments)
+
+    if options.count < 0 or (options.lookups is not None and options.lookups < 0):
+        parser.error("counts cannot be negative")
+    if not 0 <= options.hit_ratio <= 1:
+        parser.error("the hit ratio must be between 0 and 1")
+    if options.zipf_exponent < 0:
+        parser.error("the zipf exponent cannot be negative")
+    if options.cluster_size < 1:
+        parser.error("the cluster size must be at least 1")
+    if options.workers is not None and options.workers < 1:
+        parser.error("there must be at least 1 worker")
+
+    return options
+
+def runCommandLine(arguments):
+    """
+    Generates one dataset from command line options
+    :param arguments (list): The command line arguments after the program name
+    :return: None
+    """
+    options = parseArguments(arguments)
+
+    startTime = time.time()
+    try:
+        generateDataset(options.list_file, options.lookup_file, options.count, options.lookups,
+                        options.hit_ratio, options.distribution, options.lookup_distribution,
+                        options.zipf_exponent, options.cluster_size, options.seed, options.workers)
+    except ValueError as error:
+        print(f"Error: {error}")
+        return
+    endTime = time.time()
+
+    print(f"Wrote {options.count} IDs to {options.list_file} and the lookups to "
+          f"{options.lookup_file} in {endTime - startTime:.2f} seconds")
+
+    return
+
+def main(seed=DEFAULT_SEED):
     """
     Generate the text files for the existing set of ID's in the main program
+    :param seed: The seed for the random number generator, None for a random seed
     """
+    generator = random.Random(seed)
 
     shortFile = open(SHORT_LIST_FILENAME, "w")
     mediumFile = open(MEDIUM_LIST_FILENAME, "w")
@@ -138,9 +643,9 @@ def main():
     longList = []
 
     # generate lists of unique 8-digit ID's given the amount of ID's
-    generateIdList(shortList, SHORT_ID_COUNT)
-    generateIdList(mediumList, MEDIUM_ID_COUNT)
-    generateIdList(longList, LONG_ID_COUNT)
+    generateIdList(shortList, SHORT_ID_COUNT, generator)
+    generateIdList(mediumList, MEDIUM_ID_COUNT, generator)
+    generateIdList(longList, LONG_ID_COUNT, generator)
 
     # write the contents of each list to all three respective files
     writeListToFile(shortList, shortFile)
@@ -156,14 +661,14 @@ def main():
     longFalseIdList = []
 
     # generate lists of 9-digit false ID's
-    generateFalseIdList(shortFalseIdList, SHORT_ID_COUNT)
-    generateFalseIdList(mediumFalseIdList, MEDIUM_ID_COUNT)
-    generateFalseIdList(longFalseIdList, LONG_ID_COUNT)
+    generateFalseIdList(shortFalseIdList, SHORT_ID_COUNT, generator)
+    generateFalseIdList(mediumFalseIdList, MEDIUM_ID_COUNT, generator)
+    generateFalseIdList(longFalseIdList, LONG_ID_COUNT, generator)
 
     # merge the list of real and false ID's
-    shortLookupList = mergeLists(shortList, shortFalseIdList)
-    mediumLookupList = mergeLists(mediumList, mediumFalseIdList)
-    longLookupList = mergeLists(longList, longFalseIdList)
+    shortLookupList = mergeLists(shortList, shortFalseIdList, generator)
+    mediumLookupList = mergeLists(mediumList, mediumFalseIdList, generator)
+    longLookupList = mergeLists(longList, longFalseIdList, generator)
 
     shortLookup = open(SHORT_LOOKUP_FILENAME, "w")
     mediumLookup = open(MEDIUM_LOOKUP_FILENAME, "w")
@@ -177,7 +682,19 @@ def main():
     mediumLookup.close()
     longLookup.close()
 
+    # write the compact binary versions after the text files so they are newer
+    if WRITE_BINARY_FILES:
+        writeBinaryIds(shortList, getBinaryFileName(SHORT_LIST_FILENAME))
+        writeBinaryIds(mediumList, getBinaryFileName(MEDIUM_LIST_FILENAME))
+        writeBinaryIds(longList, getBinaryFileName(LONG_LIST_FILENAME))
+        writeBinaryIds(shortLookupList, getBinaryFileName(SHORT_LOOKUP_FILENAME))
+        writeBinaryIds(mediumLookupList, getBinaryFileName(MEDIUM_LOOKUP_FILENAME))
+        writeBinaryIds(longLookupList, getBinaryFileName(LONG_LOOKUP_FILENAME))
+
     return
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        runCommandLine(sys.argv[1:])
+    else:
+        main()
\ No newline at end of file
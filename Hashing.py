@@ -3,17 +3,235 @@
 # Description: Implements and tests a hash table class
 
 from Linked_List import LinkedList
+from array import array
 import random
+import sys
+
+# NumPy is optional, the batch operations fall back to
+# inserting and finding one value at a time without it
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# marks an empty bucket in array backed probing tables,
+# the smallest 64-bit int so it never collides with an ID
+EMPTY_KEY = -2 ** 63
+
+# marks a bucket whose value was removed from a probing table so later
+# probe sequences continue past it, the array backend stores TOMBSTONE_KEY
+# and the list backend stores TOMBSTONE
+TOMBSTONE_KEY = -2 ** 63 + 1
+TOMBSTONE = object()
+
+# tables grow once the number of values per bucket passes these ratios
+DEFAULT_MAX_LOAD_FACTOR_CHAINING = 1.0
+DEFAULT_MAX_LOAD_FACTOR_PROBING = 0.5
+
+# tables grow to the next prime at least this many times their current size
+GROWTH_FACTOR = 2
+
+# number of old buckets moved on each insert or find during an incremental rehash
+DEFAULT_MIGRATION_STEP = 16
+
+# probe sequences a probing hash table can follow after a collision
+PROBING_STRATEGIES = ("linear", "quadratic", "double", "robinhood")
+
+# probing tables are rebuilt once this fraction of their buckets are tombstones
+DEFAULT_MAX_TOMBSTONE_RATIO = 0.25
+
+# quadratic probing is only sure to reach an empty bucket of a
+# prime sized table while at most half of the buckets are full
+QUADRATIC_MAX_LOAD_FACTOR = 0.5
+
+def isPrime(n):
+    """
+    Checks if a number is prime
+    :param n (int): The number being checked
+    :return (bool): True if n is prime, False otherwise
+    """
+    if n < 2:
+        return False
+    if n < 4:
+        return True
+    if n % 2 == 0 or n % 3 == 0:
+        return False
+
+    # check divisors of the form 6k - 1 and 6k + 1
+    divisor = 5
+    while divisor * divisor <= n:
+        if n % divisor == 0 or n % (divisor + 2) == 0:
+            return False
+        divisor += 6
+
+    return True
+
+def nextPrime(n):
+    """
+    Finds the smallest prime number greater than or equal to n
+    :param n (int): The lower bound for the prime
+    :return (int): The smallest prime >= n
+    """
+    while not isPrime(n):
+        n += 1
+
+    return n
+
+def addCluster(clusterSizes, length):
+    """
+    Counts a run of consecutive non-empty buckets in a histogram of run lengths
+    :param clusterSizes (dict): The number of runs of each length
+    :param length (int): The length of the run, runs of 0 are not counted
+    :return: None
+    """
+    if length > 0:
+        clusterSizes[length] = clusterSizes.get(length, 0) + 1
+
+    return
+
+def linearMissProbes(clusterSizes, emptyBuckets, size):
+    """
+    Finds the average number of buckets a linear probe examines for a value
+        that is not in the table, over every home bucket. A miss starting at
+        an empty bucket examines 1 bucket, and a miss starting i buckets into
+        a cluster of length C examines the C - i buckets left in the cluster
+        and the empty bucket after it.
+    :param clusterSizes (dict): The number of clusters of each length
+    :param emptyBuckets (int): The number of empty buckets
+    :param size (int): The number of buckets
+    :return (float): The expected number of buckets examined
+    """
+    total = emptyBuckets
+    for length, clusters in clusterSizes.items():
+        total += clusters * (length * (length + 1) // 2 + length)
+
+    return total / size
+
 class HashTableChaining:
-    def __init__(self, size=101):
+    def __init__(self, size=101, maxLoadFactor=DEFAULT_MAX_LOAD_FACTOR_CHAINING,
+                 incremental=False, migrationStep=DEFAULT_MIGRATION_STEP):
         """
         Constructor:
         :param size (int): The size of the table. Should be a prime number,
         default is 101.
+        :param maxLoadFactor (float): The average chain length that causes the
+        table to be rehashed into a larger prime size. None keeps the table
+        at its starting size, default is DEFAULT_MAX_LOAD_FACTOR_CHAINING.
+        :param incremental (bool): True moves the values into the larger table
+        a few buckets at a time on each insert and find instead of all at
+        once, default is False.
+        :param migrationStep (int): The number of old buckets moved on each
+        insert or find during an incremental rehash, default is
+        DEFAULT_MIGRATION_STEP.
         """
-        self.__buckets = []
-        for i in range(size):
-            self.__buckets.append(LinkedList())
+        self.__buckets = self.__makeBuckets(size)
+        self.__count = 0
+        self.__maxLoadFactor = maxLoadFactor
+        self.__incremental = incremental
+        self.__migrationStep = migrationStep
+
+        # buckets of the smaller table while an incremental rehash is running
+        self.__oldBuckets = None
+        self.__migrateIndex = 0
+
+        # what the last find visited, only counted once turned on
+        self.__countVisits = False
+        self.__visits = 0
+
+        return
+
+    def __makeBuckets(self, size):
+        """
+        Creates a given number of empty buckets. A bucket holds None
+            until the first value is added to it, then a linked list.
+        :param size (int): The number of buckets
+        :return (list): A list of empty buckets
+        """
+        return [None] * size
+
+    def __append(self, value):
+        """
+        Adds a value to the end of the chain of its bucket,
+            creating the chain if the bucket is empty
+        :param value (int): The value being added
+        :return: None
+        """
+        bucketNum = self.__hash(value)
+
+        if self.__buckets[bucketNum] is None:
+            self.__buckets[bucketNum] = LinkedList()
+
+        self.__buckets[bucketNum].append(value)
+
+        return
+
+    def __len__(self):
+        """
+        Returns the number of values stored in the hash table
+        :return (int): The number of values in the table
+        """
+        return self.__count
+
+    def getTableSize(self):
+        """
+        Gets the number of buckets in the hash table
+        :return (int): The number of buckets
+        """
+        return len(self.__buckets)
+
+    def isMigrating(self):
+        """
+        Checks if an incremental rehash is still moving values
+        :return (bool): True if values remain in the old table, False otherwise
+        """
+        return self.__oldBuckets is not None
+
+    def __resize(self, size):
+        """
+        Rehashes every value in the table into a new set of buckets.
+            Incremental tables only swap in the new buckets and leave the
+            values to be moved by later inserts and finds.
+        :param size (int): The number of buckets in the new table
+        :return: None
+        """
+        # a rehash that is still running has to finish first
+        if self.__oldBuckets is not None:
+            self.__migrate(len(self.__oldBuckets))
+
+        oldBuckets = self.__buckets
+        self.__buckets = self.__makeBuckets(size)
+
+        if self.__incremental:
+            self.__oldBuckets = oldBuckets
+            self.__migrateIndex = 0
+        else:
+            for bucket in oldBuckets:
+                if bucket is not None:
+                    for value in bucket:
+                        self.__append(value)
+
+        return
+
+    def __migrate(self, steps):
+        """
+        Moves the values of the next few old buckets into the new table
+        :param steps (int): The number of old buckets to move
+        :return: None
+        """
+        oldBuckets = self.__oldBuckets
+        stop = min(self.__migrateIndex + steps, len(oldBuckets))
+
+        for i in range(self.__migrateIndex, stop):
+            if oldBuckets[i] is not None:
+                for value in oldBuckets[i]:
+                    self.__append(value)
+                oldBuckets[i] = None
+
+        self.__migrateIndex = stop
+
+        # drop the old table once every bucket has been moved
+        if stop == len(oldBuckets):
+            self.__oldBuckets = None
 
         return
 
@@ -31,8 +249,16 @@ class HashTableChaining:
         :param value (int):
         :return: None
         """
-        bucketNum = self.__hash(value)
-        self.__buckets[bucketNum].append(value)
+        if self.__oldBuckets is not None:
+            self.__migrate(self.__migrationStep)
+
+        self.__append(value)
+        self.__count += 1
+
+        # grow the table once the chains get too long on average
+        if self.__maxLoadFactor is not None and \
+                self.__count > self.__maxLoadFactor * len(self.__buckets):
+            self.__resize(nextPrime(GROWTH_FACTOR * len(self.__buckets)))
 
         return
 
@@ -43,51 +269,514 @@ class HashTableChaining:
         :param value (int): The value being searched for
         :return: The value in the table, returns None if not found
         """
-        bucketNum = self.__hash(value)
-        result = self.__buckets[bucketNum].find(value)
+        if self.__oldBuckets is not None:
+            self.__migrate(self.__migrationStep)
+
+        countVisits = self.__countVisits
+        if countVisits:
+            self.__visits = 0
+
+        result = None
+        bucket = self.__buckets[self.__hash(value)]
+        if bucket is not None:
+            if countVisits:
+                result = self.__countedChainFind(bucket, value)
+            else:
+                result = bucket.find(value)
+
+        # values in buckets that have not been moved yet are in the old table
+        if result is None and self.__oldBuckets is not None:
+            oldBucketNum = value % len(self.__oldBuckets)
+            if oldBucketNum >= self.__migrateIndex and self.__oldBuckets[oldBucketNum] is not None:
+                if countVisits:
+                    result = self.__countedChainFind(self.__oldBuckets[oldBucketNum], value)
+                else:
+                    result = self.__oldBuckets[oldBucketNum].find(value)
+
+        return result
+
+    def __countedChainFind(self, chain, value):
+        """
+        Searches a chain for a value like LinkedList.find, adding each
+            chain node examined to the visits of the current find
+        :param chain (LinkedList): The chain being searched
+        :param value (int): The value being searched for
+        :return: The value in the chain, returns None if not found
+        """
+        for item in chain:
+            self.__visits += 1
+            if item == value:
+                return item
+
+        return None
+
+    def setVisitCounting(self, enabled):
+        """
+        Turns on or off counting what each find visits
+        :param enabled (bool): True counts the visits of every later find
+        :return: None
+        """
+        self.__countVisits = enabled
+        self.__visits = 0
+
+        return
+
+    def getLastVisits(self):
+        """
+        Gets what the last find visited while visit counting was on
+        :return (int): The number of chain nodes examined
+        """
+        return self.__visits
+
+    def remove(self, value):
+        """
+        Removes one copy of a value from the hash table
+        :param value (int): The value being removed
+        :return: The value removed from the table, returns None if not found
+        """
+        if self.__oldBuckets is not None:
+            self.__migrate(self.__migrationStep)
+
+        result = None
+        bucket = self.__buckets[self.__hash(value)]
+        if bucket is not None:
+            result = bucket.remove(value)
+
+        # values in buckets that have not been moved yet are in the old table
+        if result is None and self.__oldBuckets is not None:
+            oldBucketNum = value % len(self.__oldBuckets)
+            if oldBucketNum >= self.__migrateIndex and self.__oldBuckets[oldBucketNum] is not None:
+                result = self.__oldBuckets[oldBucketNum].remove(value)
+
+        if result is not None:
+            self.__count -= 1
 
         return result
 
+    def __reserve(self, count):
+        """
+        Grows the table in one step so it can hold a number of values
+            without passing the maximum load factor, and finishes any
+            incremental rehash so batch operations see a single table
+        :param count (int): The number of values the table must hold
+        :return: None
+        """
+        if self.__maxLoadFactor is not None and \
+                count > self.__maxLoadFactor * len(self.__buckets):
+            self.__resize(nextPrime(max(GROWTH_FACTOR * len(self.__buckets),
+                                        int(count / self.__maxLoadFactor) + 1)))
+
+        if self.__oldBuckets is not None:
+            self.__migrate(len(self.__oldBuckets))
+
+        return
+
+    def insertMany(self, values):
+        """
+        Inserts a batch of values into the hash table. With NumPy the bucket
+            numbers of the whole batch are computed at once and each chain is
+            extended with all of its new values in one pass.
+        :param values (iterable of int): The values being inserted
+        :return: None
+        """
+        if numpy is None:
+            for value in values:
+                self.insert(value)
+            return
+
+        keys = numpy.asarray(values, dtype=numpy.int64).ravel()
+        if len(keys) == 0:
+            return
+
+        self.__reserve(self.__count + len(keys))
+
+        # sort the batch by bucket so each bucket's values are next to each other
+        bucketNums = keys % len(self.__buckets)
+        order = numpy.argsort(bucketNums, kind="stable")
+        keys = keys[order].tolist()
+        bucketNums = bucketNums[order]
+
+        # the position where each run of equal bucket numbers starts
+        starts = numpy.flatnonzero(numpy.diff(bucketNums)) + 1
+        starts = [0] + starts.tolist()
+        ends = starts[1:] + [len(keys)]
+
+        buckets = self.__buckets
+        for start, end in zip(starts, ends):
+            bucketNum = int(bucketNums[start])
+
+            if buckets[bucketNum] is None:
+                buckets[bucketNum] = LinkedList()
+
+            buckets[bucketNum].extend(keys[start:end])
+
+        self.__count += len(keys)
+
+        return
+
+    def findMany(self, values):
+        """
+        Finds a batch of values in the hash table. Chaining gets no batch
+            speed-up, since every value still walks its own chain, so this
+            calls find for each value and gives the same result type as
+            HashTableProbing.findMany. Incremental rehashes keep moving a few
+            buckets per find instead of being finished all at once.
+        :param values (iterable of int): The values being searched for
+        :return (numpy array or list of bool): True for each value that is in
+                the table, a NumPy array when NumPy is installed
+        """
+        if numpy is None:
+            return [self.find(value) is not None for value in values]
+
+        # plain ints compare and hash faster than NumPy scalars
+        keys = numpy.asarray(values, dtype=numpy.int64).ravel().tolist()
+
+        return numpy.array([self.find(value) is not None for value in keys], dtype=bool)
+
+    def __iter__(self):
+        """
+        Iterates over every value in the hash table in bucket order
+        :return (generator): The values in the table
+        """
+        for bucket in self.__buckets:
+            if bucket is not None:
+                yield from bucket
+
+        # values in buckets that have not been moved yet are in the old table
+        if self.__oldBuckets is not None:
+            for i in range(self.__migrateIndex, len(self.__oldBuckets)):
+                if self.__oldBuckets[i] is not None:
+                    yield from self.__oldBuckets[i]
+
+        return
+
+    def memoryUsage(self):
+        """
+        Adds up the bytes used by the table object, its bucket lists and
+            every chain with its nodes and values, including the old table
+            of an incremental rehash
+        :return (int): The number of bytes used by the table
+        """
+        total = sys.getsizeof(self)
+
+        for buckets in (self.__buckets, self.__oldBuckets):
+            if buckets is not None:
+                total += sys.getsizeof(buckets)
+                for bucket in buckets:
+                    if bucket is not None:
+                        total += bucket.memoryUsage()
+
+        return total
+
+    def stats(self):
+        """
+        Describes how the values are spread over the buckets of the current
+            table in one pass over the buckets. Values waiting in the old
+            table of an incremental rehash are not included.
+        :return (dict): "size" buckets holding "count" values at "loadFactor"
+                values per bucket, "emptyBuckets", "chainLengths" mapping each
+                chain length to its number of buckets, "longestChain",
+                "clusterSizes" mapping each length of a run of non-empty
+                buckets to its number of runs, "largestCluster", and the
+                "expectedHitProbes" and "expectedMissProbes" chain nodes a
+                find examines for a stored value and for a missing value
+        """
+        buckets = self.__buckets
+        size = len(buckets)
+
+        count = 0
+        emptyBuckets = 0
+        chainLengths = {}
+        hitProbes = 0
+        clusterSizes = {}
+        firstRun = None
+        run = 0
+
+        for i in range(size):
+            if buckets[i] is None:
+                length = 0
+            else:
+                length = len(buckets[i])
+
+            chainLengths[length] = chainLengths.get(length, 0) + 1
+            count += length
+            # the value at position p of a chain is found after p + 1 nodes
+            hitProbes += length * (length + 1) // 2
+
+            if length > 0:
+                run += 1
+                continue
+
+            emptyBuckets += 1
+            # a run starting at the first bucket may continue from the last bucket
+            if firstRun is None and run == i:
+                firstRun = run
+            else:
+                addCluster(clusterSizes, run)
+            run = 0
+
+        if run == size:
+            addCluster(clusterSizes, run)
+        else:
+            addCluster(clusterSizes, run + (firstRun or 0))
+
+        return {"size": size,
+                "count": count,
+                "loadFactor": count / size,
+                "emptyBuckets": emptyBuckets,
+                "chainLengths": chainLengths,
+                "longestChain": max(chainLengths),
+                "clusterSizes": clusterSizes,
+                "largestCluster": max(clusterSizes, default=0),
+                "expectedHitProbes": hitProbes / count if count > 0 else 0,
+                # a missing value is compared with every node of its chain
+                "expectedMissProbes": count / size}
+
     def __str__(self):
         """
         Generates a string representation of the hash table
         :return (string): A string representation of the hash table
         """
-        result = ""
+        lines = []
         for i in range(len(self.__buckets)):
             # print out each bucket on separate lines
-            result += "bucket" + str[i] + ": " + str(len(self.__buckets[i])) + ": "
-            result += str(self.__buckets[i]) + "\n"
+            if self.__buckets[i] is None:
+                lines.append("bucket" + str(i) + ": 0: \n")
+            else:
+                lines.append("bucket" + str(i) + ": " + str(len(self.__buckets[i])) + ": " +
+                             str(self.__buckets[i]) + "\n")
 
-        return result
+        return "".join(lines)
 
 class HashTableProbing:
-    def __init__(self, size=101):
+    def __init__(self, size=101, backend="list", maxLoadFactor=DEFAULT_MAX_LOAD_FACTOR_PROBING,
+                 incremental=False, migrationStep=DEFAULT_MIGRATION_STEP, probing="linear",
+                 maxTombstoneRatio=DEFAULT_MAX_TOMBSTONE_RATIO):
         """
         Constructor:
         :param size (int): The size of the table. Should be a prime number,
-        default is 101.
+        quadratic, double and Robin Hood tables round it up to the next
+        prime, default is 101.
+        :param backend (string): How the buckets are stored. "list" keeps the
+        values in a Python list, "array" keeps them in a typed array of
+        64-bit ints with EMPTY_KEY marking the empty buckets. The array
+        backend can only store ints, default is "list".
+        :param maxLoadFactor (float): The fraction of full buckets that causes
+        the table to be rehashed into a larger prime size. None keeps the
+        table at its starting size, default is DEFAULT_MAX_LOAD_FACTOR_PROBING.
+        :param incremental (bool): True moves the values into the larger table
+        a few buckets at a time on each insert and find instead of all at
+        once, default is False.
+        :param migrationStep (int): The number of old buckets moved on each
+        insert or find during an incremental rehash, default is
+        DEFAULT_MIGRATION_STEP.
+        :param probing (string): The probe sequence used after a collision,
+        one of PROBING_STRATEGIES, default is "linear". Quadratic probing
+        keeps the load factor at or below QUADRATIC_MAX_LOAD_FACTOR so an
+        empty bucket can always be reached.
+        :param maxTombstoneRatio (float): The fraction of buckets marked as
+        removed that causes the table to be compacted. None never compacts,
+        default is DEFAULT_MAX_TOMBSTONE_RATIO.
         """
-        self.__buckets = [None] * size
-        self.__skip = 1
+        if backend == "list":
+            self.__empty = None
+            self.__deleted = TOMBSTONE
+        elif backend == "array":
+            self.__empty = EMPTY_KEY
+            self.__deleted = TOMBSTONE_KEY
+        else:
+            raise ValueError("Unknown backend: " + str(backend))
+
+        if probing not in PROBING_STRATEGIES:
+            raise ValueError("Unknown probing strategy: " + str(probing))
+
+        if probing == "quadratic" and maxLoadFactor is not None:
+            maxLoadFactor = min(maxLoadFactor, QUADRATIC_MAX_LOAD_FACTOR)
+
+        # quadratic and double hashing only reach every bucket of a prime sized table
+        if probing != "linear":
+            size = nextPrime(size)
+
+        self.__backend = backend
+        self.__probing = probing
+        self.__buckets = self.__makeBuckets(size)
+        self.__count = 0
+        self.__maxLoadFactor = maxLoadFactor
+        self.__incremental = incremental
+        self.__migrationStep = migrationStep
+        self.__tombstones = 0
+        self.__maxTombstoneRatio = maxTombstoneRatio
+
+        # buckets of the smaller table while an incremental rehash is running.
+        # moved values are left in place so the old probe sequences stay intact
+        self.__oldBuckets = None
+        self.__migrateIndex = 0
+
+        # what the last find visited, only counted once turned on
+        self.__countVisits = False
+        self.__visits = 0
 
         return
 
-    def __hash(self, value):
+    def __makeBuckets(self, size):
+        """
+        Creates the storage for a given number of empty buckets
+        :param size (int): The number of buckets
+        :return (list or array): The empty buckets
+        """
+        if self.__backend == "array":
+            return array("q", [EMPTY_KEY]) * size
+        else:
+            return [None] * size
+
+    def __len__(self):
+        """
+        Returns the number of values stored in the hash table
+        :return (int): The number of values in the table
+        """
+        return self.__count
+
+    def getTableSize(self):
+        """
+        Gets the number of buckets in the hash table
+        :return (int): The number of buckets
+        """
+        return len(self.__buckets)
+
+    def isMigrating(self):
+        """
+        Checks if an incremental rehash is still moving values
+        :return (bool): True if values remain in the old table, False otherwise
+        """
+        return self.__oldBuckets is not None
+
+    def getTombstoneCount(self):
+        """
+        Gets the number of buckets in the current table marked as removed
+        :return (int): The number of tombstones
+        """
+        return self.__tombstones
+
+    def __resize(self, size):
+        """
+        Rehashes every value in the table into a new set of buckets,
+            leaving the tombstones behind. Incremental tables only swap in
+            the new buckets and leave the values to be moved by later
+            inserts and finds.
+        :param size (int): The number of buckets in the new table
+        :return: None
+        """
+        # a rehash that is still running has to finish first
+        if self.__oldBuckets is not None:
+            self.__migrate(len(self.__oldBuckets))
+
+        oldBuckets = self.__buckets
+        self.__buckets = self.__makeBuckets(size)
+        self.__tombstones = 0
+
+        if self.__incremental:
+            self.__oldBuckets = oldBuckets
+            self.__migrateIndex = 0
+        else:
+            for value in oldBuckets:
+                if value != self.__empty and value != self.__deleted:
+                    self.__place(value)
+
+        return
+
+    def compact(self):
+        """
+        Rebuilds the table at its current size without its tombstones
+            so probe sequences no longer pass over removed values
+        :return: None
+        """
+        self.__resize(len(self.__buckets))
+
+        return
+
+    def __migrate(self, steps):
+        """
+        Moves the values of the next few old buckets into the new table
+        :param steps (int): The number of old buckets to move
+        :return: None
+        """
+        oldBuckets = self.__oldBuckets
+        stop = min(self.__migrateIndex + steps, len(oldBuckets))
+
+        for i in range(self.__migrateIndex, stop):
+            if oldBuckets[i] != self.__empty and oldBuckets[i] != self.__deleted:
+                self.__place(oldBuckets[i])
+
+        self.__migrateIndex = stop
+
+        # drop the old table once every bucket has been moved
+        if stop == len(oldBuckets):
+            self.__oldBuckets = None
+
+        return
+
+    def getBackend(self):
+        """
+        Gets the name of the storage backend used by the table
+        :return (string): "list" or "array"
+        """
+        return self.__backend
+
+    def getProbingStrategy(self):
+        """
+        Gets the name of the probe sequence used by the table
+        :return (string): One of PROBING_STRATEGIES
+        """
+        return self.__probing
+
+    def __hash(self, value, size):
         """
         Hash function
         :param value (any comparable value):
+        :param size (int): The number of buckets in the table
         :return (int): The bucket number for the value
         """
-        return value % len(self.__buckets)
+        return value % size
+
+    def __skip(self, value, size):
+        """
+        Second hash function, gives the distance between the buckets in a
+            value's probe sequence for double hashing and 1 otherwise.
+            Any distance from 1 to size - 1 reaches every bucket of a prime sized table.
+        :param value (int): The value being probed for
+        :param size (int): The number of buckets in the table
+        :return (int): The distance between buckets
+        """
+        if self.__probing == "double" and size > 1:
+            return 1 + (value // size) % (size - 1)
+        else:
+            return 1
 
-    def __rehash(self, bucketNum):
+    def __rehash(self, bucketNum, attempt, skip, size):
         """
         Rehash function
         :param bucketNum (int): The last bucket number attempted
+        :param attempt (int): The number of buckets already tried, starting at 1
+        :param skip (int): The distance between buckets from the second hash function
+        :param size (int): The number of buckets in the table
         :return: The next bucket number to try
         """
-        return (bucketNum + self.__skip) % len(self.__buckets)
+        # home + 1, home + 4, home + 9, ... for quadratic probing
+        if self.__probing == "quadratic":
+            return (bucketNum + 2 * attempt - 1) % size
+        else:
+            return (bucketNum + skip) % size
+
+    def __distance(self, value, bucketNum, size):
+        """
+        Finds how far a value is stored from its home bucket in a
+            linear probe sequence, used by Robin Hood probing
+        :param value (int): A value stored in the table
+        :param bucketNum (int): The bucket the value is stored in
+        :param size (int): The number of buckets in the table
+        :return (int): The number of buckets between the home bucket and bucketNum
+        """
+        return (bucketNum - value % size) % size
 
     def insert(self, value):
         """
@@ -95,27 +784,84 @@ class HashTableProbing:
         :param value (int):
         :return: None
         """
-        # hash the value for the bucket number
-        bucketNum = self.__hash(value)
+        # the empty and tombstone markers cannot be stored as values
+        if self.__backend == "array" and (value == EMPTY_KEY or value == TOMBSTONE_KEY):
+            raise ValueError("Value is reserved for empty and removed buckets")
 
-        # keep original bucket number to keep track of when to stop searching
-        originalBucketNum = bucketNum
+        if self.__oldBuckets is not None:
+            self.__migrate(self.__migrationStep)
 
-        # initial rehash
-        if self.__buckets is not None:
-            bucketNum = self.__rehash(bucketNum)
+        # grow the table before it gets too full
+        if self.__maxLoadFactor is not None and \
+                self.__count + 1 > self.__maxLoadFactor * len(self.__buckets):
+            self.__resize(nextPrime(GROWTH_FACTOR * len(self.__buckets)))
 
-        # loop rehashes until an empty bucket is found
-        # or the original bucket is found
-        while self.__buckets[bucketNum] is not None and bucketNum != originalBucketNum:
-            bucketNum = self.__rehash(bucketNum)
+        self.__place(value)
+        self.__count += 1
 
-        # insert value if bucket is empty, otherwise raise exception
-        if self.__buckets[bucketNum] is None:
-            self.__buckets[bucketNum] = value
-        else:
+        return
+
+    def __place(self, value):
+        """
+        Stores a value in the first empty or removed bucket of its probe
+            sequence. Robin Hood probing instead takes the bucket of any
+            value that is closer to its home bucket and carries that value on.
+        :param value (int): The value being stored
+        :return: None
+        :raises: Exception if every bucket is full
+        """
+        buckets = self.__buckets
+        empty = self.__empty
+        deleted = self.__deleted
+        size = len(buckets)
+
+        # a Robin Hood swap would carry off a stored value before the
+        # probe sequence ran out, so a full table is refused up front
+        if self.__count >= size:
             raise Exception("Table Full")
 
+        # hash the value for the bucket number
+        bucketNum = self.__hash(value, size)
+
+        # linear probing steps to the next bucket without the generic rehash
+        if self.__probing == "linear":
+            while buckets[bucketNum] != empty and buckets[bucketNum] != deleted:
+                bucketNum = (bucketNum + 1) % size
+
+            if buckets[bucketNum] == deleted:
+                self.__tombstones -= 1
+
+            buckets[bucketNum] = value
+
+            return
+
+        skip = self.__skip(value, size)
+        robinHood = self.__probing == "robinhood"
+        attempt = 0
+
+        # loop rehashes until an empty or removed bucket is found
+        # or every bucket in the sequence has been tried
+        while buckets[bucketNum] != empty and buckets[bucketNum] != deleted:
+            # swap with a value that sits closer to its home bucket
+            if robinHood:
+                residentDistance = self.__distance(buckets[bucketNum], bucketNum, size)
+                if residentDistance < attempt:
+                    resident = buckets[bucketNum]
+                    buckets[bucketNum] = value
+                    value = resident
+                    attempt = residentDistance
+
+            attempt += 1
+            if attempt >= size:
+                raise Exception("Table Full")
+
+            bucketNum = self.__rehash(bucketNum, attempt, skip, size)
+
+        if buckets[bucketNum] == deleted:
+            self.__tombstones -= 1
+
+        buckets[bucketNum] = value
+
         return
 
     def find(self, value):
@@ -125,42 +871,524 @@ class HashTableProbing:
         :param value (int): The value being searched for
         :return: The value in the table, returns None if not found
         """
+        if self.__oldBuckets is not None:
+            self.__migrate(self.__migrationStep)
+
+        if self.__countVisits:
+            self.__visits = 0
+
+        result = self.__search(self.__buckets, value)
+
+        # values that have not been moved yet are still in the old table
+        if result is None and self.__oldBuckets is not None:
+            result = self.__search(self.__oldBuckets, value)
+
+        return result
+
+    def setVisitCounting(self, enabled):
+        """
+        Turns on or off counting what each find visits
+        :param enabled (bool): True counts the visits of every later find
+        :return: None
+        """
+        self.__countVisits = enabled
+        self.__visits = 0
+
+        return
+
+    def getLastVisits(self):
+        """
+        Gets what the last find visited while visit counting was on
+        :return (int): The number of buckets examined
+        """
+        return self.__visits
+
+    def remove(self, value):
+        """
+        Removes one copy of a value from the hash table. The bucket is
+            marked with a tombstone so the probe sequences of other values
+            continue past it, and the table is compacted once too many
+            buckets are tombstones. Robin Hood probing instead shifts the
+            values after the removed one back a bucket. During an incremental
+            rehash the old table is searched the way find does, and its
+            copy of the value is marked with a tombstone.
+        :param value (int): The value being removed
+        :return: The value removed from the table, returns None if not found
+        """
+        if self.__oldBuckets is not None:
+            self.__migrate(self.__migrationStep)
+
+        removed = None
+        bucketNum = self.__locate(self.__buckets, value)[0]
+        if bucketNum is not None:
+            removed = self.__buckets[bucketNum]
+            self.__delete(bucketNum)
+
+        # a value that has not been moved yet is only in the old table, and a
+        # moved value leaves a copy there that find would return once the
+        # new copy is gone. the old table is never probed for a place, so a
+        # tombstone keeps its probe sequences intact under every strategy
+        oldBuckets = self.__oldBuckets
+        if oldBuckets is not None:
+            oldBucketNum = self.__locate(oldBuckets, value)[0]
+
+            if oldBucketNum is not None:
+                moved = oldBucketNum < self.__migrateIndex
+
+                if removed is None and not moved:
+                    removed = oldBuckets[oldBucketNum]
+                    oldBuckets[oldBucketNum] = self.__deleted
+                    self.__count -= 1
+                elif removed is not None and moved:
+                    oldBuckets[oldBucketNum] = self.__deleted
+
+        return removed
+
+    def __delete(self, bucketNum):
+        """
+        Empties a bucket of the current table, leaving a tombstone or
+            shifting the following values back for Robin Hood probing
+        :param bucketNum (int): The bucket holding the value being removed
+        :return: None
+        """
+        buckets = self.__buckets
+        empty = self.__empty
+        size = len(buckets)
+
+        if self.__probing != "robinhood":
+            buckets[bucketNum] = self.__deleted
+            self.__count -= 1
+            self.__tombstones += 1
+
+            # rebuild the table once tombstones make probe sequences too long
+            if self.__maxTombstoneRatio is not None and \
+                    self.__tombstones >= self.__maxTombstoneRatio * size:
+                self.compact()
+
+            return
+
+        # shift back every following value that is not in its home bucket
+        nextBucketNum = (bucketNum + 1) % size
+        while buckets[nextBucketNum] != empty and \
+                self.__distance(buckets[nextBucketNum], nextBucketNum, size) > 0:
+            buckets[bucketNum] = buckets[nextBucketNum]
+            bucketNum = nextBucketNum
+            nextBucketNum = (nextBucketNum + 1) % size
+
+        buckets[bucketNum] = empty
+        self.__count -= 1
+
+        return
+
+    def __search(self, buckets, value):
+        """
+        Follows the probe sequence of a value through a set of buckets,
+            adding the buckets examined to the visits of the current find
+            when visit counting is on
+        :param buckets (list or array): The buckets being searched
+        :param value (int): The value being searched for
+        :return: The value in the buckets, returns None if not found
+        """
+        # an uncounted linear search is the default find, so it steps
+        # through the buckets here instead of through __locate
+        if self.__probing == "linear" and not self.__countVisits:
+            empty = self.__empty
+            size = len(buckets)
+            bucketNum = self.__hash(value, size)
+
+            attempt = 0
+            while buckets[bucketNum] != empty:
+                if buckets[bucketNum] == value:
+                    return buckets[bucketNum]
+
+                attempt += 1
+                if attempt >= size:
+                    return None
+
+                bucketNum = (bucketNum + 1) % size
+
+            return None
+
+        bucketNum, attempts = self.__locate(buckets, value)
+        if self.__countVisits:
+            self.__visits += attempts
+
+        if bucketNum is None:
+            return None
+        else:
+            return buckets[bucketNum]
+
+    def __locate(self, buckets, value):
+        """
+        Follows the probe sequence of a value through a set of buckets
+            until the value, an empty bucket, or for Robin Hood probing a
+            value closer to its home bucket than the search is found
+        :param buckets (list or array): The buckets being searched
+        :param value (int): The value being searched for
+        :return (tuple): The bucket number holding the value or None if the
+                value was not found, and the number of buckets examined
+        """
+        empty = self.__empty
+        deleted = self.__deleted
+        size = len(buckets)
+
         # hash the value for the bucket number
-        bucketNum = self.__hash(value)
+        bucketNum = self.__hash(value, size)
+        attempt = 0
 
-        # keep original bucket number to keep track of when to stop searching
-        originalBucketNum = bucketNum
+        # linear probing steps to the next bucket without the generic rehash
+        if self.__probing == "linear":
+            while buckets[bucketNum] != empty:
+                if buckets[bucketNum] == value:
+                    return bucketNum, attempt + 1
 
-        # initial rehash
-        if self.__buckets[bucketNum] is not None and self.__buckets[bucketNum] == value:
-            return self.__buckets[bucketNum]
+                attempt += 1
+                if attempt >= size:
+                    return None, attempt
+
+                bucketNum = (bucketNum + 1) % size
+
+            return None, attempt + 1
+
+        skip = self.__skip(value, size)
+        robinHood = self.__probing == "robinhood"
+
+        # loop rehashes until the value or an empty bucket is found
+        # or every bucket in the sequence has been tried
+        while buckets[bucketNum] != empty:
+            if buckets[bucketNum] == value:
+                return bucketNum, attempt + 1
+
+            # the value would have taken this bucket if it were in the table.
+            # only the old table of an incremental rehash holds tombstones
+            if robinHood and buckets[bucketNum] != deleted and \
+                    self.__distance(buckets[bucketNum], bucketNum, size) < attempt:
+                break
+
+            attempt += 1
+            if attempt >= size:
+                return None, attempt
+
+            bucketNum = self.__rehash(bucketNum, attempt, skip, size)
+
+        return None, attempt + 1
+
+    def probeLength(self, value):
+        """
+        Counts the buckets a find for a value examines, including the old
+            table while an incremental rehash is running
+        :param value (int): The value being searched for
+        :return (int): The number of buckets examined
+        """
+        bucketNum, length = self.__locate(self.__buckets, value)
+
+        # the old table is only searched when the value is not in the new one
+        if bucketNum is None and self.__oldBuckets is not None:
+            length += self.__locate(self.__oldBuckets, value)[1]
+
+        return length
+
+    def probeStats(self):
+        """
+        Finds the average and maximum number of buckets examined when
+            finding each value stored in the current table
+        :return (dict): The "average" and "maximum" probe lengths, both 0
+                for an empty table
+        """
+        total = 0
+        maximum = 0
+        count = 0
+
+        for value in self.__buckets:
+            if value != self.__empty and value != self.__deleted:
+                length = self.__locate(self.__buckets, value)[1]
+                total += length
+                maximum = max(maximum, length)
+                count += 1
+
+        if count == 0:
+            return {"average": 0, "maximum": 0}
+
+        return {"average": total / count, "maximum": maximum}
+
+    def __reserve(self, count):
+        """
+        Grows the table in one step so it can hold a number of values
+            without passing the maximum load factor, and finishes any
+            incremental rehash so batch operations see a single table
+        :param count (int): The number of values the table must hold
+        :return: None
+        :raises: Exception if the table cannot grow and is too small
+        """
+        if self.__maxLoadFactor is not None and \
+                count > self.__maxLoadFactor * len(self.__buckets):
+            self.__resize(nextPrime(max(GROWTH_FACTOR * len(self.__buckets),
+                                        int(count / self.__maxLoadFactor) + 1)))
+
+        if self.__oldBuckets is not None:
+            self.__migrate(len(self.__oldBuckets))
+
+        if count > len(self.__buckets):
+            raise Exception("Table Full")
+
+        return
+
+    def __nextSlots(self, slots, keys, attempt, size):
+        """
+        Vectorized rehash function, moves a batch of probes to the next
+            bucket of their sequences
+        :param slots (numpy array): The last bucket number attempted for each key
+        :param keys (numpy array): The values being probed for
+        :param attempt (int): The number of buckets already tried, starting at 1
+        :param size (int): The number of buckets in the table
+        :return (numpy array): The next bucket number to try for each key
+        """
+        if self.__probing == "quadratic":
+            return (slots + 2 * attempt - 1) % size
+        elif self.__probing == "double" and size > 1:
+            return (slots + 1 + (keys // size) % (size - 1)) % size
         else:
-            bucketNum = self.__rehash(bucketNum)
-
-        # loop rehashes until an empty bucket is found
-        # or the original bucket is found
-        while self.__buckets[bucketNum] is not None and \
-                self.__buckets[bucketNum] != value and \
-                bucketNum != originalBucketNum:
-            bucketNum = self.__rehash(bucketNum)
-
-        # insert value if bucket is empty, otherwise raise exception
-        if self.__buckets[bucketNum] is not None and self.__buckets[bucketNum] == value:
-            return self.__buckets[bucketNum]
+            return (slots + 1) % size
+
+    def insertMany(self, values):
+        """
+        Inserts a batch of values into the hash table. With NumPy and the
+            array backend the probes of the whole batch run in vectorized
+            rounds: every value that reaches an empty bucket is stored, with
+            the first value winning when several reach the same bucket, and
+            the rest move on to their next bucket. Robin Hood probing moves
+            values that are already stored, so it inserts one value at a time.
+        :param values (iterable of int): The values being inserted
+        :return: None
+        """
+        if numpy is None or self.__backend != "array" or self.__probing == "robinhood":
+            for value in values:
+                self.insert(value)
+            return
+
+        keys = numpy.asarray(values, dtype=numpy.int64).ravel()
+        if ((keys == EMPTY_KEY) | (keys == TOMBSTONE_KEY)).any():
+            raise ValueError("Value is reserved for empty and removed buckets")
+
+        batchSize = len(keys)
+        self.__reserve(self.__count + batchSize)
+
+        table = numpy.frombuffer(self.__buckets, dtype=numpy.int64)
+        size = len(table)
+        slots = keys % size
+        attempt = 0
+
+        while len(keys) > 0:
+            # the first value to reach each empty or removed bucket claims it
+            contents = table[slots]
+            emptyIndexes = numpy.flatnonzero((contents == EMPTY_KEY) | (contents == TOMBSTONE_KEY))
+            firstIndexes = numpy.unique(slots[emptyIndexes], return_index=True)[1]
+            placed = emptyIndexes[firstIndexes]
+            self.__tombstones -= int(numpy.count_nonzero(contents[placed] == TOMBSTONE_KEY))
+            table[slots[placed]] = keys[placed]
+
+            # every other value moves on to the next bucket in its sequence
+            waiting = numpy.ones(len(keys), dtype=bool)
+            waiting[placed] = False
+            keys = keys[waiting]
+
+            attempt += 1
+            if len(keys) > 0 and attempt >= size:
+                # the values already stored stay in the table
+                self.__count += batchSize - len(keys)
+                raise Exception("Table Full")
+
+            slots = self.__nextSlots(slots[waiting], keys, attempt, size)
+
+        self.__count += batchSize
+
+        return
+
+    def findMany(self, values):
+        """
+        Finds a batch of values in the hash table. With NumPy and the array
+            backend the probes of the whole batch run in vectorized rounds
+            until each value reaches itself or an empty bucket.
+        :param values (iterable of int): The values being searched for
+        :return (numpy array or list of bool): True for each value that is in
+                the table, a NumPy array when NumPy is installed
+        """
+        if numpy is None:
+            return [self.find(value) is not None for value in values]
+
+        if self.__backend != "array":
+            return numpy.array([self.find(value) is not None for value in values], dtype=bool)
+
+        keys = numpy.asarray(values, dtype=numpy.int64).ravel()
+        self.__reserve(self.__count)
+
+        table = numpy.frombuffer(self.__buckets, dtype=numpy.int64)
+        size = len(table)
+        found = numpy.zeros(len(keys), dtype=bool)
+        indexes = numpy.arange(len(keys))
+        slots = keys % size
+        attempt = 0
+
+        # a full table without the value would probe forever,
+        # so stop after every bucket has been visited
+        while len(keys) > 0 and attempt < size:
+            contents = table[slots]
+            hits = contents == keys
+            found[indexes[hits]] = True
+
+            # keep probing for values that reached neither themselves nor an empty bucket
+            searching = ~hits & (contents != EMPTY_KEY)
+
+            # with Robin Hood probing a value closer to its home bucket ends the search
+            if self.__probing == "robinhood":
+                searching &= (slots - contents % size) % size >= attempt
+
+            keys = keys[searching]
+            indexes = indexes[searching]
+            attempt += 1
+            slots = self.__nextSlots(slots[searching], keys, attempt, size)
+
+        return found
+
+    def __iter__(self):
+        """
+        Iterates over every value in the hash table in bucket order,
+            skipping empty buckets and tombstones
+        :return (generator): The values in the table
+        """
+        empty = self.__empty
+        deleted = self.__deleted
+
+        for value in self.__buckets:
+            if value != empty and value != deleted:
+                yield value
+
+        # values in buckets that have not been moved yet are in the old table
+        if self.__oldBuckets is not None:
+            for i in range(self.__migrateIndex, len(self.__oldBuckets)):
+                value = self.__oldBuckets[i]
+                if value != empty and value != deleted:
+                    yield value
+
+        return
+
+    def memoryUsage(self):
+        """
+        Adds up the bytes used by the table object and its buckets, including
+            the old table of an incremental rehash. The list backend also
+            holds a value object for each full bucket, while the array
+            backend stores the values unboxed.
+        :return (int): The number of bytes used by the table
+        """
+        total = sys.getsizeof(self)
+
+        for buckets in (self.__buckets, self.__oldBuckets):
+            if buckets is None:
+                continue
+
+            total += sys.getsizeof(buckets)
+            if self.__backend == "list":
+                for value in buckets:
+                    if value is not None and value is not TOMBSTONE:
+                        total += sys.getsizeof(value)
+
+        return total
+
+    def stats(self):
+        """
+        Describes how the values are spread over the buckets of the current
+            table in one pass over the buckets. Values waiting in the old
+            table of an incremental rehash are not included.
+            The chain of a stored value is the probe sequence a find follows
+            to reach it. Linear and Robin Hood probe lengths come from the
+            distance to the home bucket, the other strategies follow the
+            probe sequence of each value. Misses are exact for linear probing
+            and estimated as 1 / (1 - fraction of non-empty buckets) otherwise.
+        :return (dict): "size" buckets holding "count" values at "loadFactor"
+                values per bucket, "emptyBuckets", "tombstones", "chainLengths"
+                mapping each probe length to its number of values,
+                "longestChain", "clusterSizes" mapping each length of a run of
+                full or removed buckets to its number of runs, "largestCluster",
+                and the "expectedHitProbes" and "expectedMissProbes" buckets a
+                find examines for a stored value and for a missing value
+        """
+        buckets = self.__buckets
+        empty = self.__empty
+        deleted = self.__deleted
+        size = len(buckets)
+        linear = self.__probing in ("linear", "robinhood")
+
+        count = 0
+        emptyBuckets = 0
+        tombstones = 0
+        chainLengths = {}
+        hitProbes = 0
+        clusterSizes = {}
+        firstRun = None
+        run = 0
+
+        for i in range(size):
+            value = buckets[i]
+
+            if value == empty:
+                emptyBuckets += 1
+                # a run starting at the first bucket may continue from the last bucket
+                if firstRun is None and run == i:
+                    firstRun = run
+                else:
+                    addCluster(clusterSizes, run)
+                run = 0
+                continue
+
+            run += 1
+            if value == deleted:
+                tombstones += 1
+                continue
+
+            if linear:
+                length = self.__distance(value, i, size) + 1
+            else:
+                length = self.__locate(buckets, value)[1]
+
+            count += 1
+            hitProbes += length
+            chainLengths[length] = chainLengths.get(length, 0) + 1
+
+        if run == size:
+            addCluster(clusterSizes, run)
         else:
-            return None
+            addCluster(clusterSizes, run + (firstRun or 0))
+
+        if emptyBuckets == 0:
+            missProbes = size
+        elif self.__probing == "linear":
+            missProbes = linearMissProbes(clusterSizes, emptyBuckets, size)
+        else:
+            missProbes = size / emptyBuckets
+
+        return {"size": size,
+                "count": count,
+                "loadFactor": count / size,
+                "emptyBuckets": emptyBuckets,
+                "tombstones": tombstones,
+                "chainLengths": chainLengths,
+                "longestChain": max(chainLengths, default=0),
+                "clusterSizes": clusterSizes,
+                "largestCluster": max(clusterSizes, default=0),
+                "expectedHitProbes": hitProbes / count if count > 0 else 0,
+                "expectedMissProbes": missProbes}
 
     def __str__(self):
         """
         Generates a string representation of the hash table
         :return (string): A string representation of the hash table
         """
-        result = ""
+        lines = []
         for i in range(len(self.__buckets)):
             # print each bucket on a separate line
-            result += "bucket" + str[i] + ": " + str(self.__buckets[i]) + "\n"
+            lines.append("bucket" + str(i) + ": " + str(self.__buckets[i]) + "\n")
 
-        return result
+        return "".join(lines)
 
 def main():
     """
@@ -174,14 +1402,17 @@ def main():
     # print the list of values
     print(values)
 
-    # create two hash tables, one using chaining and one using probing
+    # create three hash tables, one using chaining and two using probing
+    # where the second probing table stores its values in a typed array
     myChainingHashTable = HashTableChaining()
     myProbingHashTable = HashTableProbing()
+    myArrayProbingHashTable = HashTableProbing(backend="array")
 
-    # insert the values into both tables
+    # insert the values into all three tables
     for value in values:
         myChainingHashTable.insert(value)
         myProbingHashTable.insert(value)
+        myArrayProbingHashTable.insert(value)
 
     # create a list of values to lookup
     # should likely return value not found on the last three values
@@ -205,6 +1436,49 @@ def main():
         else:
             print("Value not found")
 
+    for k in values:
+        result = myArrayProbingHashTable.find(k)
+        if result is not None:
+            print(f"{result} found in array probing hash table")
+        else:
+            print("Value not found")
+
+    # start two tables far too small for the values so they have to grow
+    myGrowingChainingHashTable = HashTableChaining(3)
+    myGrowingProbingHashTable = HashTableProbing(3)
+
+    for value in range(1000):
+        myGrowingChainingHashTable.insert(value)
+        myGrowingProbingHashTable.insert(value)
+
+    print(f"\nChaining table grew from 3 to {myGrowingChainingHashTable.getTableSize()} "
+          f"buckets for {len(myGrowingChainingHashTable)} values")
+    print(f"Probing table grew from 3 to {myGrowingProbingHashTable.getTableSize()} "
+          f"buckets for {len(myGrowingProbingHashTable)} values")
+    print(f"999 found in both grown tables == "
+          f"{myGrowingChainingHashTable.find(999) == myGrowingProbingHashTable.find(999) == 999}")
+
+    # remove every even value, the probing table leaves tombstones behind
+    for value in range(0, 1000, 2):
+        myGrowingChainingHashTable.remove(value)
+        myGrowingProbingHashTable.remove(value)
+
+    print(f"\nAfter removing the even values the tables hold "
+          f"{len(myGrowingChainingHashTable)} and {len(myGrowingProbingHashTable)} values")
+    print(f"998 found in either table == "
+          f"{myGrowingChainingHashTable.find(998) is not None or myGrowingProbingHashTable.find(998) is not None}")
+    print(f"999 found in both tables == "
+          f"{myGrowingChainingHashTable.find(999) == myGrowingProbingHashTable.find(999) == 999}")
+    print(f"The probing table has {myGrowingProbingHashTable.getTombstoneCount()} tombstones")
+
+    # summarize how the values are spread over the buckets
+    for name, table in (("Chaining", myGrowingChainingHashTable), ("Probing", myGrowingProbingHashTable)):
+        stats = table.stats()
+        print(f"\n{name} table: load factor {stats['loadFactor']:.2f}, "
+              f"{stats['emptyBuckets']} empty buckets, longest chain {stats['longestChain']}, "
+              f"largest cluster {stats['largestCluster']}, expected probes "
+              f"{stats['expectedHitProbes']:.2f} for hits and {stats['expectedMissProbes']:.2f} for misses")
+
     return
 
 if __name__ == "__main__":
@@ -0,0 +1,371 @@
+# Creator: Aidan Scott
+# Date: 10/18/26
+# Description: Loads the ID files used by the main program into typed
+# arrays by reading them in large chunks instead of parsing line by line,
+# and reads and writes the binary version of the ID files
+
+from array import array
+import os
+import shutil
+import sys
+import tempfile
+import time
+import warnings
+
+# NumPy is optional, the IDs are parsed with int() without it
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# number of bytes read at a time when streaming a file
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# small chunks so the demo streams the short files in several pieces
+DEMO_CHUNK_SIZE = 1 << 12
+
+# binary ID files start with this magic followed by the number of IDs and
+# the smallest and largest ID, then hold the IDs in file order, all as
+# little-endian 64-bit ints
+BINARY_ID_MAGIC = b"IDLIST01"
+BINARY_HEADER_SIZE = 32
+BINARY_EXTENSION = ".bin"
+
+# NumPy saturates IDs that do not fit in 64 bits at these limits
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+def parseIds(data):
+    """
+    Parses a block of text holding one ID per line
+    :param data (bytes): Whole lines of the ID file
+    :return (array): The IDs as 64-bit ints
+    :raises: ValueError if a line does not hold exactly one integer,
+             OverflowError if an ID does not fit in 64 bits
+    """
+    if len(data) == 0:
+        return array("q")
+
+    # NumPy reads a block of only whitespace as a single 0
+    if numpy is not None and not data.isspace():
+        # NumPy parses the whole block at once, but it skips blank lines and
+        # saturates large IDs without an error, so its result is only used
+        # when it has one ID per line and none at the limits
+        lineCount = data.count(b"\n")
+        if not data.endswith(b"\n"):
+            lineCount += 1
+
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", DeprecationWarning)
+                parsed = numpy.fromstring(data, dtype=numpy.int64, sep=" ")
+        except (ValueError, DeprecationWarning):
+            parsed = None
+
+        if parsed is not None and len(parsed) == lineCount and \
+                not ((parsed == INT64_MIN) | (parsed == INT64_MAX)).any():
+            ids = array("q")
+            ids.frombytes(parsed.tobytes())
+            return ids
+
+    ids = array("q")
+    for line in data.splitlines():
+        fields = line.split()
+        if len(fields) != 1:
+            raise ValueError(f"Expected one ID on the line {line!r}")
+
+        ids.append(int(fields[0]))
+
+    return ids
+
+def parseBinaryHeader(header, fileName):
+    """
+    Parses the header of a binary ID file
+    :param header (bytes): The first BINARY_HEADER_SIZE bytes of the file
+    :param fileName (string): The name of the file, used in error messages
+    :return (tuple): The number of IDs, the smallest ID and the largest ID
+    :raises: ValueError if the header is not a binary ID file header
+    """
+    if len(header) < BINARY_HEADER_SIZE or header[:8] != BINARY_ID_MAGIC:
+        raise ValueError(f"{fileName} is not a binary ID file")
+
+    fields = array("q")
+    fields.frombytes(header[8:BINARY_HEADER_SIZE])
+    if sys.byteorder == "big":
+        fields.byteswap()
+
+    return tuple(fields)
+
+def parseBinaryIds(data):
+    """
+    Converts the little-endian 64-bit ints of a binary ID file to a typed array
+    :param data (bytes): The IDs, a multiple of 8 bytes long
+    :return (array): The IDs as 64-bit ints
+    """
+    ids = array("q")
+    ids.frombytes(data)
+    if sys.byteorder == "big":
+        ids.byteswap()
+
+    return ids
+
+def readBinaryHeader(fileName):
+    """
+    Reads the number of IDs and the smallest and largest ID of a binary
+        ID file without reading the IDs
+    :param fileName (string): The name of the binary ID file
+    :return (tuple): The number of IDs, the smallest ID and the largest ID
+    :raises: ValueError if the file is not a binary ID file
+    """
+    idFile = open(fileName, "rb")
+    header = idFile.read(BINARY_HEADER_SIZE)
+    idFile.close()
+
+    return parseBinaryHeader(header, fileName)
+
+def packBinaryHeader(count, smallest, largest):
+    """
+    Builds the header of a binary ID file
+    :param count (int): The number of IDs in the file
+    :param smallest (int): The smallest ID, None if the file is empty
+    :param largest (int): The largest ID, None if the file is empty
+    :return (bytes): The BINARY_HEADER_SIZE bytes of the header
+    """
+    if count == 0:
+        fields = array("q", [0, 0, 0])
+    else:
+        fields = array("q", [count, smallest, largest])
+
+    # the file is little-endian whatever the byte order of the machine
+    if sys.byteorder == "big":
+        fields.byteswap()
+
+    return BINARY_ID_MAGIC + fields.tobytes()
+
+def writeBinaryIds(ids, fileName):
+    """
+    Writes IDs to a binary ID file, keeping their order
+    :param ids (iterable): The IDs being written
+    :param fileName (string): The name of the binary ID file
+    :return: None
+    """
+    writeBinaryIdChunks([ids], fileName)
+
+    return
+
+def writeBinaryIdChunks(chunks, fileName):
+    """
+    Writes chunks of IDs to a binary ID file one chunk at a time, so the
+        IDs do not all have to be in memory. The header is filled in
+        once the last chunk has been written.
+    :param chunks (iterable): Iterables of the IDs being written, in order
+    :param fileName (string): The name of the binary ID file
+    :return (int): The number of IDs written
+    """
+    count = 0
+    smallest = None
+    largest = None
+
+    idFile = open(fileName, "wb")
+    idFile.write(bytes(BINARY_HEADER_SIZE))
+
+    for chunk in chunks:
+        values = array("q", chunk)
+        if len(values) == 0:
+            continue
+
+        count += len(values)
+        if smallest is None or min(values) < smallest:
+            smallest = min(values)
+        if largest is None or max(values) > largest:
+            largest = max(values)
+
+        # the file is little-endian whatever the byte order of the machine
+        if sys.byteorder == "big":
+            values.byteswap()
+        idFile.write(values.tobytes())
+
+    idFile.seek(0)
+    idFile.write(packBinaryHeader(count, smallest, largest))
+    idFile.close()
+
+    return count
+
+def concatenateIdFiles(partFileNames, fileName):
+    """
+    Joins ID files into one file, keeping the order of the files and of the
+        IDs in them. The parts must all be binary ID files when the joined
+        file name ends in the binary extension and text files otherwise.
+    :param partFileNames (list): The names of the ID files being joined, in order
+    :param fileName (string): The name of the joined ID file
+    :return: None
+    :raises: ValueError if a part is not a binary ID file when one is expected
+    """
+    if not fileName.endswith(BINARY_EXTENSION):
+        idFile = open(fileName, "wb")
+        for partFileName in partFileNames:
+            with open(partFileName, "rb") as partFile:
+                shutil.copyfileobj(partFile, idFile)
+        idFile.close()
+
+        return
+
+    # the joined header comes from the headers of the parts
+    count = 0
+    smallest = None
+    largest = None
+    for partFileName in partFileNames:
+        partCount, partSmallest, partLargest = readBinaryHeader(partFileName)
+        if partCount == 0:
+            continue
+
+        count += partCount
+        if smallest is None or partSmallest < smallest:
+            smallest = partSmallest
+        if largest is None or partLargest > largest:
+            largest = partLargest
+
+    idFile = open(fileName, "wb")
+    idFile.write(packBinaryHeader(count, smallest, largest))
+    for partFileName in partFileNames:
+        with open(partFileName, "rb") as partFile:
+            partFile.seek(BINARY_HEADER_SIZE)
+            shutil.copyfileobj(partFile, idFile)
+    idFile.close()
+
+    return
+
+def getBinaryFileName(fileName):
+    """
+    Gets the name of the binary version of a text ID file
+    :param fileName (string): The name of the text ID file
+    :return (string): The name of the binary ID file
+    """
+    return os.path.splitext(fileName)[0] + BINARY_EXTENSION
+
+def preferBinaryFile(fileName):
+    """
+    Chooses the binary version of a text ID file when it exists and is
+        at least as new as the text file, since it loads without parsing
+    :param fileName (string): The name of the text ID file
+    :return (string): The name of the file to load
+    """
+    binaryFileName = getBinaryFileName(fileName)
+
+    if not os.path.exists(binaryFileName):
+        return fileName
+    if os.path.exists(fileName) and os.path.getmtime(binaryFileName) < os.path.getmtime(fileName):
+        return fileName
+
+    return binaryFileName
+
+def loadIds(fileName):
+    """
+    Reads every ID in a text or binary ID file into a typed array in one read
+    :param fileName (string): The name of the file of IDs
+    :return (array): The IDs in the file as 64-bit ints
+    :raises: ValueError if a binary ID file is not the size its header describes
+    """
+    idFile = open(fileName, "rb")
+    data = idFile.read()
+    idFile.close()
+
+    if not data.startswith(BINARY_ID_MAGIC):
+        return parseIds(data)
+
+    count = parseBinaryHeader(data[:BINARY_HEADER_SIZE], fileName)[0]
+    if len(data) != BINARY_HEADER_SIZE + 8 * count:
+        raise ValueError(f"{fileName} is not the size its header describes")
+
+    return parseBinaryIds(data[BINARY_HEADER_SIZE:])
+
+def iterIdChunks(fileName, chunkSize=DEFAULT_CHUNK_SIZE):
+    """
+    Streams the IDs in a text or binary ID file a chunk at a time so files
+        larger than memory can be processed. A line cut off at the end of
+        a chunk of a text file is carried over to the next chunk.
+    :param fileName (string): The name of the file of IDs
+    :param chunkSize (int): The number of bytes read at a time
+    :return (generator): A typed array of 64-bit ints for each chunk
+    """
+    with open(fileName, "rb") as idFile:
+        header = idFile.read(BINARY_HEADER_SIZE)
+
+        # binary files are read in whole IDs
+        if header.startswith(BINARY_ID_MAGIC):
+            count = parseBinaryHeader(header, fileName)[0]
+            chunkSize = max(8, chunkSize - chunkSize % 8)
+
+            while count > 0:
+                chunk = idFile.read(min(chunkSize, 8 * count))
+                if len(chunk) == 0 or len(chunk) % 8 != 0:
+                    raise ValueError(f"{fileName} is not the size its header describes")
+
+                count -= len(chunk) // 8
+                yield parseBinaryIds(chunk)
+
+            return
+
+        idFile.seek(0)
+        remainder = b""
+        chunk = idFile.read(chunkSize)
+
+        while len(chunk) > 0:
+            data = remainder + chunk
+
+            # only parse up to the last whole line
+            end = data.rfind(b"\n") + 1
+            remainder = data[end:]
+            if end > 0:
+                yield parseIds(data[:end])
+
+            chunk = idFile.read(chunkSize)
+
+        # the last line may not end with a newline
+        if len(remainder) > 0 and not remainder.isspace():
+            yield parseIds(remainder)
+
+    return
+
+def main():
+    """
+    Main function loads each ID file whole and streams it in small chunks
+    """
+    # imported here since the main program imports this module
+    from Data_Structures_Main import SHORT_LIST_FILENAME, SHORT_LOOKUP_FILENAME, MEDIUM_LIST_FILENAME, \
+        MEDIUM_LOOKUP_FILENAME, LONG_LIST_FILENAME, LONG_LOOKUP_FILENAME
+
+    for fileName in (SHORT_LIST_FILENAME, SHORT_LOOKUP_FILENAME, MEDIUM_LIST_FILENAME,
+                     MEDIUM_LOOKUP_FILENAME, LONG_LIST_FILENAME, LONG_LOOKUP_FILENAME):
+        if not os.path.exists(fileName):
+            print(f"\n{fileName}: file not found, skipping")
+            continue
+
+        startTime = time.time()
+        ids = loadIds(fileName)
+        endTime = time.time()
+
+        # write the binary version of the file and check it loads the same IDs
+        binaryFileName = os.path.join(tempfile.gettempdir(), getBinaryFileName(os.path.basename(fileName)))
+        writeBinaryIds(ids, binaryFileName)
+        binaryStartTime = time.time()
+        binaryIds = loadIds(binaryFileName)
+        binaryEndTime = time.time()
+        os.remove(binaryFileName)
+
+        streamedIds = array("q")
+        chunkCount = 0
+        for chunk in iterIdChunks(fileName, DEMO_CHUNK_SIZE):
+            streamedIds.extend(chunk)
+            chunkCount += 1
+
+        print(f"\n{fileName}: {len(ids)} IDs loaded in {endTime - startTime} seconds")
+        print(f"Streamed in {chunkCount} chunks of {DEMO_CHUNK_SIZE} bytes, "
+              f"matching the whole file == {streamedIds == ids}")
+        print(f"Binary version loaded in {binaryEndTime - binaryStartTime} seconds, "
+              f"matching the text file == {binaryIds == ids}")
+
+    return
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+# Creator: Aidan Scott
+# Date: 10/18/26
+# Description: Records the latency of each insert and find into histograms
+# along with the probes, chain nodes or tree nodes each find visits. Nothing
+# here is called unless instrumentation is turned on, so the data structures
+# only check a flag when it is off.
+
+from Linked_List import LinkedList
+from Trees import BinarySearchTree, AVLTree, ArrayAVLTree
+from Hashing import HashTableChaining, HashTableProbing
+import random
+import time
+
+# values below 2 ** SUB_BUCKET_BITS get a bucket each, larger values share
+# buckets that are 1 / 2 ** (SUB_BUCKET_BITS - 1) of their size wide, so
+# every recorded value is kept to within about 3 percent
+SUB_BUCKET_BITS = 6
+
+# percentiles shown in the report of each histogram
+REPORT_PERCENTILES = (50, 90, 99, 99.9)
+
+class LatencyHistogram:
+    def __init__(self):
+        """
+        Constructor: an empty histogram with log-linear buckets like an HDR
+            histogram, which keeps a fixed relative precision from
+            nanoseconds to seconds in a few hundred buckets
+        """
+        self.__counts = {}
+        self.__count = 0
+        self.__total = 0
+        self.__minimum = None
+        self.__maximum = None
+
+        return
+
+    def __bucketStart(self, value):
+        """
+        Finds the smallest value sharing a bucket with a value
+        :param value (int): A value of at least 0
+        :return (int): The first value of its bucket
+        """
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        if shift <= 0:
+            return value
+
+        return (value >> shift) << shift
+
+    def __bucketEnd(self, start):
+        """
+        Finds the largest value of the bucket starting at a value
+        :param start (int): The first value of the bucket
+        :return (int): The last value of the bucket
+        """
+        shift = start.bit_length() - SUB_BUCKET_BITS
+        if shift <= 0:
+            return start
+
+        return start + (1 << shift) - 1
+
+    def record(self, value):
+        """
+        Adds a value to the histogram
+        :param value (int): The value, negative values are counted as 0
+        :return: None
+        """
+        value = max(value, 0)
+        start = self.__bucketStart(value)
+        self.__counts[start] = self.__counts.get(start, 0) + 1
+
+        self.__count += 1
+        self.__total += value
+        if self.__minimum is None or value < self.__minimum:
+            self.__minimum = value
+        if self.__maximum is None or value > self.__maximum:
+            self.__maximum = value
+
+        return
+
+    def __len__(self):
+        """
+        Returns the number of values recorded
+        :return (int): The number of values recorded
+        """
+        return self.__count
+
+    def getMinimum(self):
+        """
+        Gets the smallest value recorded
+        :return (int): The smallest value, None if nothing was recorded
+        """
+        return self.__minimum
+
+    def getMaximum(self):
+        """
+        Gets the largest value recorded
+        :return (int): The largest value, None if nothing was recorded
+        """
+        return self.__maximum
+
+    def getMean(self):
+        """
+        Gets the exact average of the values recorded
+        :return (float): The average value, 0 if nothing was recorded
+        """
+        if self.__count == 0:
+            return 0
+
+        return self.__total / self.__count
+
+    def valueAtPercentile(self, percent):
+        """
+        Finds the value that a given percent of the recorded values are at
+            or below, reported as the largest value of its bucket
+        :param percent (float): The percentile between 0 and 100
+        :return (int): The value at the percentile, 0 if nothing was recorded
+        """
+        if self.__count == 0:
+            return 0
+
+        # the rank of the value at the percentile, at least the first value
+        rank = max(1, -(-self.__count * percent // 100))
+
+        seen = 0
+        for start in sorted(self.__counts):
+            seen += self.__counts[start]
+            if seen >= rank:
+                return min(self.__bucketEnd(start), self.__maximum)
+
+        return self.__maximum
+
+    def getBuckets(self):
+        """
+        Gets the bucket ranges that hold values and how many values each holds
+        :return (list): Tuples of the first value, last value and count of
+                        each bucket, from smallest to largest
+        """
+        return [(start, self.__bucketEnd(start), self.__counts[start]) for start in sorted(self.__counts)]
+
+    def summary(self, unit=""):
+        """
+        Generates a one line summary of the histogram
+        :param unit (string): The unit written after each value
+        :return (string): The count, mean, percentiles and maximum
+        """
+        parts = [f"count {self.__count}", f"mean {self.getMean():.1f}{unit}"]
+        for percent in REPORT_PERCENTILES:
+            parts.append(f"p{percent:g} {self.valueAtPercentile(percent)}{unit}")
+        parts.append(f"max {self.__maximum or 0}{unit}")
+
+        return ", ".join(parts)
+
+def getVisitCounter(dataStructure):
+    """
+    Gets the method that counts what a find in a data structure visits.
+        Hash tables count the probes or chain nodes inside each find, since
+        an incremental rehash moves values on every find. A tree find
+        changes nothing, so its path is walked again after the find.
+    :param dataStructure: The data structure being instrumented
+    :return (tuple): The name of what is counted and the method giving the
+                     count for the value just found, or None for both if
+                     nothing is counted
+    """
+    if isinstance(dataStructure, (HashTableChaining, HashTableProbing)):
+        dataStructure.setVisitCounting(True)
+        lastVisits = dataStructure.getLastVisits
+
+        if isinstance(dataStructure, HashTableProbing):
+            return "probes", lambda value: lastVisits()
+        else:
+            return "chain nodes", lambda value: lastVisits()
+
+    elif isinstance(dataStructure, (BinarySearchTree, ArrayAVLTree)):
+        return "tree depth", dataStructure.findDepth
+
+    return None, None
+
+class Instrumentation:
+    def __init__(self):
+        """
+        Constructor: empty latency and visit histograms for each operation
+        """
+        self.__latencies = {}
+        self.__visits = {}
+        self.__visitNames = {}
+
+        return
+
+    def getLatencies(self, operation):
+        """
+        Gets the latency histogram of an operation, creating it if needed
+        :param operation (string): The name of the operation
+        :return (LatencyHistogram): The latencies in nanoseconds
+        """
+        if operation not in self.__latencies:
+            self.__latencies[operation] = LatencyHistogram()
+
+        return self.__latencies[operation]
+
+    def getVisits(self, operation):
+        """
+        Gets the histogram of what each call of an operation visited
+        :param operation (string): The name of the operation
+        :return (LatencyHistogram): The visit counts, None if they were not counted
+        """
+        return self.__visits.get(operation)
+
+    def insertAll(self, dataStructure, values):
+        """
+        Inserts values one at a time, timing each insert
+        :param dataStructure: The data structure the values are inserted into
+        :param values (iterable): The values being inserted
+        :return: The data structure, a new root for AVL trees
+        """
+        latencies = self.getLatencies("insert")
+        clock = time.perf_counter_ns
+
+        for value in values:
+            if isinstance(dataStructure, LinkedList):
+                start = clock()
+                dataStructure.append(value)
+                latencies.record(clock() - start)
+
+            # AVL inserts return the new root of the tree
+            elif isinstance(dataStructure, AVLTree):
+                start = clock()
+                dataStructure = dataStructure.insert(value)
+                latencies.record(clock() - start)
+
+            else:
+                start = clock()
+                dataStructure.insert(value)
+                latencies.record(clock() - start)
+
+        return dataStructure
+
+    def wrapFind(self, dataStructure):
+        """
+        Wraps the find method of a data structure so each call is timed.
+            What the find visited is recorded after the clock stops.
+        :param dataStructure: The data structure being searched
+        :return (function): A find function taking a value and returning its result
+        """
+        latencies = self.getLatencies("find")
+        visitName, countVisits = getVisitCounter(dataStructure)
+        clock = time.perf_counter_ns
+        find = dataStructure.find
+
+        if countVisits is None:
+            def timedFind(value):
+                start = clock()
+                result = find(value)
+                latencies.record(clock() - start)
+                return result
+
+            return timedFind
+
+        if "find" not in self.__visits:
+            self.__visits["find"] = LatencyHistogram()
+        visits = self.__visits["find"]
+        self.__visitNames["find"] = visitName
+
+        def timedFind(value):
+            start = clock()
+            result = find(value)
+            latencies.record(clock() - start)
+            visits.record(countVisits(value))
+            return result
+
+        return timedFind
+
+    def report(self):
+        """
+        Generates the summary of every latency and visit histogram
+        :return (string): A line for each histogram
+        """
+        lines = []
+        for operation, latencies in self.__latencies.items():
+            lines.append(f"{operation} latency: {latencies.summary(' ns')}")
+            if operation in self.__visits:
+                lines.append(f"{operation} {self.__visitNames[operation]}: {self.__visits[operation].summary()}")
+
+        return "\n".join(lines)
+
+def main():
+    """
+    Main function instruments a few data structures loaded with random values
+    """
+    generator = random.Random(0)
+    values = generator.sample(range(10000000, 99999999), 5000)
+    lookups = values[:2500] + generator.sample(range(100000000, 999999999), 2500)
+
+    for name, dataStructure in (("Binary Search Tree", BinarySearchTree()), ("AVL Tree", AVLTree()),
+                                ("Hash Table with Chaining", HashTableChaining(1009, maxLoadFactor=None)),
+                                ("Hash Table with Probing", HashTableProbing(1009))):
+        instrumentation = Instrumentation()
+        dataStructure = instrumentation.insertAll(dataStructure, values)
+
+        find = instrumentation.wrapFind(dataStructure)
+        for value in lookups:
+            find(value)
+
+        print(f"\n{name}:")
+        print(instrumentation.report())
+
+    return
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Creator: Aidan Scott
+# Date: 10/18/26
+# Description: Reports the per-insert latency of the hash tables when they
+# grow with a bulk rehash compared to an incremental rehash
+
+from Hashing import HashTableChaining, HashTableProbing
+from Data_Structures_Main import SHORT_LIST_FILENAME, MEDIUM_LIST_FILENAME, LONG_LIST_FILENAME
+from Id_File_Loader import loadIds
+from Benchmark import percentile
+import gc
+import os
+import time
+
+REPORT_FILENAMES = (SHORT_LIST_FILENAME, MEDIUM_LIST_FILENAME, LONG_LIST_FILENAME)
+
+# tables start small so the load exercises several rehashes
+STARTING_TABLE_SIZE = 101
+
+def measureLatencies(operation, values):
+    """
+    Times a single-value operation once for every value
+    :param operation (function): The operation being timed, called with one value
+    :param values (list): The values passed to the operation
+    :return (list): The latency of each call in nanoseconds, in call order
+    """
+    latencies = []
+    clock = time.perf_counter_ns
+
+    # pause the garbage collector like timeit does so its
+    # collection pauses do not hide the cost of the rehash
+    gcWasEnabled = gc.isenabled()
+    gc.disable()
+
+    for value in values:
+        start = clock()
+        operation(value)
+        latencies.append(clock() - start)
+
+    if gcWasEnabled:
+        gc.enable()
+
+    return latencies
+
+def summarize(latencies):
+    """
+    Summarizes a list of latencies
+    :param latencies (list): Latencies in nanoseconds
+    :return (dict): The mean, p50, p99 and max latency in nanoseconds
+    """
+    sortedLatencies = sorted(latencies)
+
+    return {"mean": sum(sortedLatencies) / len(sortedLatencies),
+            "p50": percentile(sortedLatencies, 50),
+            "p99": percentile(sortedLatencies, 99),
+            "max": sortedLatencies[-1]}
+
+def printReport(fileName, ids):
+    """
+    Prints the insert latency of each hash table loaded with a file of IDs,
+        once with a bulk rehash and once with an incremental rehash
+    :param fileName (string): The name of the file the IDs were read from
+    :param ids (array): The IDs read from the file
+    :return: None
+    """
+    print(f"\n{fileName}: {len(ids)} inserts starting from {STARTING_TABLE_SIZE} buckets")
+
+    tables = (("Chaining", HashTableChaining), ("Probing", HashTableProbing))
+
+    for name, tableClass in tables:
+        for incremental in (False, True):
+            table = tableClass(STARTING_TABLE_SIZE, incremental=incremental)
+            summary = summarize(measureLatencies(table.insert, ids))
+
+            if incremental:
+                mode = "incremental rehash"
+            else:
+                mode = "bulk rehash"
+
+            print(f"\t{name}, {mode}: mean {summary['mean'] / 1000:.2f} us, "
+                  f"p50 {summary['p50'] / 1000:.2f} us, p99 {summary['p99'] / 1000:.2f} us, "
+                  f"max {summary['max'] / 1000:.2f} us")
+
+    return
+
+def main():
+    """
+    Prints the insert latency report for each ID file that exists
+    """
+    for fileName in REPORT_FILENAMES:
+        if os.path.exists(fileName):
+            printReport(fileName, loadIds(fileName))
+        else:
+            print(f"\n{fileName}: file not found, skipping")
+
+    return
+
+if __name__ == "__main__":
+    main()
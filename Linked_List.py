@@ -2,7 +2,12 @@
 # Date: 6/10/24
 # Description: This program stores and tests a linked list class
 
+import sys
+
 class listNode:
+    # fixed attribute layout so nodes do not carry a per-instance __dict__
+    __slots__ = ("__payload", "__next")
+
     def __init__(self, payload=None, next=None):
         """
         Constructor: creates an empty listNode as the default
@@ -152,6 +157,21 @@ class LinkedList:
         """
         return self.__size
 
+    def __iter__(self):
+        """
+        Iterates over the payloads of the linked list from front to back
+        :return: A generator of the values stored in the list
+        """
+        current = self.__head
+
+        while current is not None:
+            yield current.getPayload()
+
+            # set current to the next listNode
+            current = current.getNext()
+
+        return
+
     def isEmpty(self):
         """
         Checks if the list is empty and returns the associated boolean
@@ -165,6 +185,21 @@ class LinkedList:
 
         return empty
 
+    def memoryUsage(self):
+        """
+        Adds up the bytes used by the list object, its nodes and the values
+            they hold, walking the nodes from front to back
+        :return (int): The number of bytes used by the list
+        """
+        total = sys.getsizeof(self)
+
+        current = self.__head
+        while current is not None:
+            total += sys.getsizeof(current) + sys.getsizeof(current.getPayload())
+            current = current.getNext()
+
+        return total
+
     def __str__(self):
         """
         Returns the string representation of the linked list
@@ -200,7 +235,54 @@ class LinkedList:
         :param x: Any comparable type
         :return: None
         """
-        self.insert(len(self) - 1, x)
+        # link the new node directly after the tail so appending
+        # never traverses the list
+        newNode = listNode(x)
+
+        if self.isEmpty():
+            self.__head = newNode
+        else:
+            self.__tail.setNext(newNode)
+
+        self.__tail = newNode
+        self.__size += 1
+
+        return
+
+    def extend(self, iterable):
+        """
+        Adds every item of an iterable to the end of the linked list.
+            The new nodes are linked together in one pass and then
+            attached after the tail.
+        :param iterable: Any iterable of comparable types
+        :return: None
+        """
+        first = None
+        last = None
+        count = 0
+
+        # build a chain of the new nodes
+        for x in iterable:
+            newNode = listNode(x)
+            if first is None:
+                first = newNode
+            else:
+                last.setNext(newNode)
+            last = newNode
+            count += 1
+
+        # nothing to attach for an empty iterable
+        if first is None:
+            return
+
+        # attach the chain after the tail
+        if self.isEmpty():
+            self.__head = first
+        else:
+            self.__tail.setNext(first)
+
+        self.__tail = last
+        self.__size += count
 
         return
 
@@ -257,6 +339,40 @@ class LinkedList:
 
             return value
 
+    def remove(self, item):
+        """
+        Removes the first node in the linked list that holds an item.
+            Returns None if item is not found.
+        :param item: Any comparable type that is being removed from the list.
+        :return: The value stored in the list node that was removed,
+                returns None if the item is not found
+        """
+        previous = None
+        current = self.__head
+
+        # find the node holding the item and the node before it
+        while current is not None and current.getPayload() != item:
+            previous = current
+            current = current.getNext()
+
+        if current is None:
+            return None
+
+        # skip over the node being removed
+        if previous is None:
+            self.__head = current.getNext()
+        else:
+            previous.setNext(current.getNext())
+
+        # change the tail attribute if the tail is being deleted
+        if self.__tail is current:
+            self.__tail = previous
+
+        # decrement the size
+        self.__size -= 1
+
+        return current.getPayload()
+
     def find(self, item):
         """
         Finds an element in the linked list. Returns None if item is not found.
@@ -349,6 +465,18 @@ def main():
     # try to pop from an empty list (should return None)
     print(myLinkedList.pop())
 
+    # add several values to the end of the list at once
+    myLinkedList.extend([4, "five", 6.0])
+    print(myLinkedList)
+    print(f"The item at the back of the list is: {myLinkedList.back()}")
+
+    # remove values by their contents
+    print(f"Removed {myLinkedList.remove('five')} from the list")
+    print(f"Removed {myLinkedList.remove(6.0)} from the list")
+    print(f"Removed {myLinkedList.remove(value4)} from the list")
+    print(myLinkedList)
+    print(f"The item at the back of the list is: {myLinkedList.back()}")
+
     return
 
 if __name__ == "__main__":
@@ -0,0 +1,349 @@
+# Creator: Aidan Scott
+# Date: 10/18/26
+# Description: Saves the IDs of a built data structure to a binary index
+# file and opens the file with mmap, so lookups read the mapped pages
+# directly instead of rebuilding the structure from the text files
+
+from Hashing import EMPTY_KEY, TOMBSTONE_KEY, nextPrime
+from array import array
+from bisect import bisect_left
+import mmap
+import os
+import sys
+
+# the first 8 bytes of an index file name the layout of its slots
+HASH_INDEX_MAGIC = b"IDXHASH1"
+SORTED_INDEX_MAGIC = b"IDXSORT1"
+
+# the magic is followed by the number of IDs and the number of slots,
+# then by the slots, all as little-endian 64-bit ints
+HEADER_SIZE = 24
+
+# the hash image leaves at least half of its buckets empty so misses stop quickly
+HASH_INDEX_LOAD_FACTOR = 0.5
+
+HASH_INDEX_EXTENSION = ".hash.idx"
+SORTED_INDEX_EXTENSION = ".sorted.idx"
+
+def writeIndex(fileName, magic, count, slots):
+    """
+    Writes the header and slots of an index to a file
+    :param fileName (string): The name of the index file
+    :param magic (bytes): The magic naming the layout of the slots
+    :param count (int): The number of IDs in the index
+    :param slots (array): The slots of the index as 64-bit ints
+    :return: None
+    """
+    header = array("q", [count, len(slots)])
+
+    # the file is little-endian whatever the byte order of the machine
+    if sys.byteorder == "big":
+        header.byteswap()
+        slots.byteswap()
+
+    indexFile = open(fileName, "wb")
+    indexFile.write(magic)
+    indexFile.write(header.tobytes())
+    indexFile.write(slots.tobytes())
+    indexFile.close()
+
+    return
+
+def saveHashIndex(structure, fileName):
+    """
+    Saves the IDs of a data structure as a linear probing hash table image
+    :param structure (iterable): The data structure holding the IDs, or any iterable of IDs
+    :param fileName (string): The name of the index file
+    :return (int): The number of IDs saved
+    :raises: ValueError if an ID is one of the values that marks an empty bucket
+    """
+    ids = array("q", structure)
+    size = nextPrime(max(3, int(len(ids) / HASH_INDEX_LOAD_FACTOR) + 1))
+    slots = array("q", [EMPTY_KEY]) * size
+
+    count = 0
+    for value in ids:
+        if value == EMPTY_KEY or value == TOMBSTONE_KEY:
+            raise ValueError(f"{value} is reserved to mark empty buckets")
+
+        # linear probing from the home bucket, storing each ID once
+        bucketNum = value % size
+        while slots[bucketNum] != EMPTY_KEY and slots[bucketNum] != value:
+            bucketNum = (bucketNum + 1) % size
+
+        if slots[bucketNum] == EMPTY_KEY:
+            slots[bucketNum] = value
+            count += 1
+
+    writeIndex(fileName, HASH_INDEX_MAGIC, count, slots)
+
+    return count
+
+def saveSortedIndex(structure, fileName):
+    """
+    Saves the IDs of a data structure as a sorted array image
+    :param structure (iterable): The data structure holding the IDs, or any iterable of IDs
+    :param fileName (string): The name of the index file
+    :return (int): The number of IDs saved
+    """
+    slots = array("q", sorted(set(structure)))
+
+    writeIndex(fileName, SORTED_INDEX_MAGIC, len(slots), slots)
+
+    return len(slots)
+
+class MappedIndex:
+    def __init__(self, fileName):
+        """
+        Constructor: maps an index file into memory and views its slots
+            as 64-bit ints without copying them
+        :param fileName (string): The name of the index file
+        :raises: ValueError if the file is not an index file
+        """
+        self.__file = open(fileName, "rb")
+        self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.__map) < HEADER_SIZE:
+            self.__map.close()
+            self.__file.close()
+            raise ValueError(f"{fileName} is too short to be an index file")
+
+        header = array("q")
+        header.frombytes(self.__map[8:HEADER_SIZE])
+        if sys.byteorder == "big":
+            header.byteswap()
+
+        self.__magic = self.__map[:8]
+        self.__count, size = header
+
+        if len(self.__map) != HEADER_SIZE + size * header.itemsize:
+            self.__map.close()
+            self.__file.close()
+            raise ValueError(f"{fileName} is not the size its header describes")
+
+        # big-endian machines read a swapped copy instead of the mapped pages
+        if sys.byteorder == "big":
+            self.__slots = array("q", self.__map[HEADER_SIZE:])
+            self.__slots.byteswap()
+        else:
+            self.__slots = memoryview(self.__map)[HEADER_SIZE:].cast("q")
+
+        return
+
+    def getMagic(self):
+        """
+        Gets the magic naming the layout of the slots
+        :return (bytes): HASH_INDEX_MAGIC or SORTED_INDEX_MAGIC
+        """
+        return self.__magic
+
+    def getSlots(self):
+        """
+        Gets the slots of the index
+        :return (memoryview or array): The slots as 64-bit ints
+        """
+        return self.__slots
+
+    def __len__(self):
+        """
+        Gets the number of IDs in the index
+        :return (int): The number of IDs in the index
+        """
+        return self.__count
+
+    def memoryUsage(self):
+        """
+        Adds up the bytes of the index object and of the mapped file, which
+            the operating system reads into memory as its pages are used
+        :return (int): The number of bytes used by the index
+        """
+        return sys.getsizeof(self) + len(self.__map)
+
+    def close(self):
+        """
+        Unmaps the index file and closes it
+        :return: None
+        """
+        if isinstance(self.__slots, memoryview):
+            self.__slots.release()
+        self.__map.close()
+        self.__file.close()
+
+        return
+
+    def __enter__(self):
+        """
+        Allows the index to be used in a with statement
+        :return (MappedIndex): The index
+        """
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        """
+        Closes the index at the end of a with statement
+        :return (bool): False so exceptions are not suppressed
+        """
+        self.close()
+
+        return False
+
+class MappedHashIndex(MappedIndex):
+    def find(self, value):
+        """
+        Finds an ID by linear probing the mapped hash table image
+        :param value (int): The ID being searched for
+        :return: The ID in the index, returns None if not found
+        """
+        slots = self.getSlots()
+        size = len(slots)
+
+        bucketNum = value % size
+        while slots[bucketNum] != EMPTY_KEY:
+            if slots[bucketNum] == value:
+                return value
+            bucketNum = (bucketNum + 1) % size
+
+        return None
+
+    def __iter__(self):
+        """
+        Iterates over the IDs of the index in bucket order
+        :return (generator): The IDs in the index
+        """
+        for value in self.getSlots():
+            if value != EMPTY_KEY:
+                yield value
+
+        return
+
+class MappedSortedIndex(MappedIndex):
+    def find(self, value):
+        """
+        Finds an ID by a binary search of the mapped sorted array image
+        :param value (int): The ID being searched for
+        :return: The ID in the index, returns None if not found
+        """
+        slots = self.getSlots()
+
+        index = bisect_left(slots, value)
+        if index < len(slots) and slots[index] == value:
+            return value
+
+        return None
+
+    def minValue(self):
+        """
+        Returns the smallest ID in the index.
+        Returns None if the index is empty
+        :return: the smallest ID
+        """
+        if len(self) == 0:
+            return None
+
+        return self.getSlots()[0]
+
+    def maxValue(self):
+        """
+        Returns the largest ID in the index.
+        Returns None if the index is empty
+        :return: the largest ID
+        """
+        if len(self) == 0:
+            return None
+
+        return self.getSlots()[-1]
+
+    def range(self, lo, hi):
+        """
+        Iterates in order over the IDs of the index between two bounds
+        :param lo (int): The smallest ID to include
+        :param hi (int): The largest ID to include
+        :return: A generator of the IDs x where lo <= x <= hi
+        """
+        slots = self.getSlots()
+
+        for i in range(bisect_left(slots, lo), len(slots)):
+            # every ID after this one is above the range
+            if slots[i] > hi:
+                return
+            yield slots[i]
+
+        return
+
+    def __iter__(self):
+        """
+        Iterates over the IDs of the index from smallest to largest
+        :return (generator): The IDs in order
+        """
+        yield from self.getSlots()
+
+        return
+
+def openIndex(fileName):
+    """
+    Opens an index file with the class that matches the layout of its slots
+    :param fileName (string): The name of the index file
+    :return (MappedHashIndex or MappedSortedIndex): The opened index
+    :raises: ValueError if the file is not an index file
+    """
+    indexFile = open(fileName, "rb")
+    magic = indexFile.read(8)
+    indexFile.close()
+
+    if magic == HASH_INDEX_MAGIC:
+        return MappedHashIndex(fileName)
+    elif magic == SORTED_INDEX_MAGIC:
+        return MappedSortedIndex(fileName)
+
+    raise ValueError(f"{fileName} is not an index file")
+
+def getIndexFileName(idFileName, structureName, extension):
+    """
+    Gets the name of the index file saved for an ID file by one kind of
+        data structure, so each structure and probing strategy keeps its own index
+    :param idFileName (string): The name of the text file of IDs
+    :param structureName (string): The data structure the index is saved from
+    :param extension (string): HASH_INDEX_EXTENSION or SORTED_INDEX_EXTENSION
+    :return (string): The name of the index file
+    """
+    return f"{os.path.splitext(idFileName)[0]}.{structureName}{extension}"
+
+def isIndexCurrent(indexFileName, idFileName):
+    """
+    Checks if an index file exists and was saved after its ID file last changed
+    :param indexFileName (string): The name of the index file
+    :param idFileName (string): The name of the text file of IDs
+    :return (bool): True if the index can be used, False otherwise
+    """
+    if not os.path.exists(indexFileName):
+        return False
+
+    return os.path.getmtime(indexFileName) >= os.path.getmtime(idFileName)
+
+def main():
+    """
+    Main function saves and opens both index layouts for a few IDs
+    """
+    ids = [41, 12, 2, -10, -15, 81, 89, 93, 4, 6, 20, 17, 23, 10]
+    lookups = [81, 93, 5, 4, 17, 100]
+
+    saveHashIndex(ids, "demo" + HASH_INDEX_EXTENSION)
+    saveSortedIndex(ids, "demo" + SORTED_INDEX_EXTENSION)
+
+    for fileName in ("demo" + HASH_INDEX_EXTENSION, "demo" + SORTED_INDEX_EXTENSION):
+        with openIndex(fileName) as index:
+            print(f"\n{fileName}: {len(index)} IDs in {os.path.getsize(fileName)} bytes")
+            print(f"IDs: {sorted(index)}")
+
+            for value in lookups:
+                print(f"{value} was found in the index == {index.find(value) is not None}")
+
+            if isinstance(index, MappedSortedIndex):
+                print(f"The values from 0 to 50 are {list(index.range(0, 50))}")
+
+        os.remove(fileName)
+
+    return
+
+if __name__ == "__main__":
+    main()
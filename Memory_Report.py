@@ -0,0 +1,214 @@
+# Creator: Aidan Scott
+# Date: 10/18/26
+# Description: Reports how much memory each node of the linked list
+# and tree classes uses when loading the ID files, compared to the same
+# nodes stored with a per-instance __dict__, how much memory the AVL
+# tree uses when its nodes are kept in typed arrays, and how much memory
+# the list and array backends of the probing hash table use per ID
+
+from Linked_List import LinkedList
+from Trees import AVLTree, ArrayAVLTree
+from Hashing import HashTableProbing, DEFAULT_MAX_LOAD_FACTOR_PROBING, nextPrime
+from Data_Structures_Main import SHORT_LIST_FILENAME, MEDIUM_LIST_FILENAME, LONG_LIST_FILENAME
+from Id_File_Loader import loadIds
+import os
+import tracemalloc
+
+REPORT_FILENAMES = (SHORT_LIST_FILENAME, MEDIUM_LIST_FILENAME, LONG_LIST_FILENAME)
+
+class dictListNode:
+    def __init__(self, payload=None, next=None):
+        """
+        Constructor: a list node that keeps its attributes in a __dict__,
+            used as the baseline for the memory comparison
+        :param payload: Any type that is comparable
+        :param next (dictListNode): the node after the current node
+        """
+        self.__payload = payload
+        self.__next = next
+
+        return
+
+class dictTreeNode:
+    def __init__(self, payload=None, leftChild=None, rightChild=None):
+        """
+        Constructor: an AVL tree node that keeps its attributes in a __dict__,
+            used as the baseline for the memory comparison
+        :param payload: Any type that is comparable
+        :param leftChild (dictTreeNode): the left subtree
+        :param rightChild (dictTreeNode): the right subtree
+        """
+        self.__payload = payload
+        self.__leftChild = leftChild
+        self.__rightChild = rightChild
+        self.__height = 0
+        self.__size = 1
+
+        return
+
+def measureBytes(build, ids):
+    """
+    Measures the memory allocated while building a structure from a list of IDs
+    :param build (function): Builds the structure from the list of IDs
+    :param ids (list): The IDs stored in the structure
+    :return (int): The number of bytes allocated and still in use by the structure
+    """
+    tracemalloc.start()
+    structure = build(ids)
+    usedBytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # keep the structure alive until the measurement is taken
+    del structure
+
+    return usedBytes
+
+def buildLinkedList(ids):
+    """
+    Builds a linked list of slotted nodes from a list of IDs
+    :param ids (list): The IDs stored in the list
+    :return (LinkedList): The populated linked list
+    """
+    linkedList = LinkedList()
+    linkedList.extend(ids)
+
+    return linkedList
+
+def buildDictList(ids):
+    """
+    Builds a chain of dictionary based list nodes from a list of IDs
+    :param ids (list): The IDs stored in the chain
+    :return (dictListNode): The head of the chain
+    """
+    head = None
+    for value in reversed(ids):
+        head = dictListNode(value, head)
+
+    return head
+
+def buildAVLTree(ids):
+    """
+    Builds an AVL tree of slotted nodes from a list of IDs
+    :param ids (list): The IDs stored in the tree
+    :return (AVLTree): The root of the populated tree
+    """
+    tree = AVLTree()
+    for value in ids:
+        tree = tree.insert(value)
+
+    return tree
+
+def buildArrayAVLTree(ids):
+    """
+    Builds an AVL tree that keeps its nodes in typed arrays from a list of IDs
+    :param ids (list): The IDs stored in the tree
+    :return (ArrayAVLTree): The populated tree
+    """
+    tree = ArrayAVLTree()
+    for value in ids:
+        tree.insert(value)
+
+    return tree
+
+def buildDictTree(ids):
+    """
+    Builds the same number of dictionary based tree nodes as an AVL tree
+        of the IDs would use. Only the node layout matters for the
+        comparison, so the nodes are kept in a list instead of being linked.
+    :param ids (list): The IDs stored in the nodes
+    :return (list): The dictionary based tree nodes
+    """
+    return [dictTreeNode(value) for value in ids]
+
+def getProbingTableSize(count):
+    """
+    Finds the smallest prime table size that holds a number of IDs
+        without going over the default maximum load factor
+    :param count (int): The number of IDs stored in the table
+    :return (int): The number of buckets
+    """
+    return nextPrime(int(count / DEFAULT_MAX_LOAD_FACTOR_PROBING) + 1)
+
+def buildListProbingTable(lines):
+    """
+    Builds a list backed probing hash table sized to the lines of an ID file
+    :param lines (list): The lines of text holding the IDs stored in the table
+    :return (HashTableProbing): The populated hash table
+    """
+    table = HashTableProbing(getProbingTableSize(len(lines)))
+    for line in lines:
+        table.insert(int(line))
+
+    return table
+
+def buildArrayProbingTable(lines):
+    """
+    Builds an array backed probing hash table sized to the lines of an ID file
+    :param lines (list): The lines of text holding the IDs stored in the table
+    :return (HashTableProbing): The populated hash table
+    """
+    table = HashTableProbing(getProbingTableSize(len(lines)), backend="array")
+    for line in lines:
+        table.insert(int(line))
+
+    return table
+
+def printReport(fileName, ids):
+    """
+    Prints the bytes per node of the slotted and dictionary based layouts
+        for the linked list and AVL tree loaded with a file of IDs
+    :param fileName (string): The name of the file the IDs were read from
+    :param ids (list): The IDs read from the file
+    :return: None
+    """
+    count = len(ids)
+    print(f"\n{fileName}: {count} records")
+
+    comparisons = (("Linked List", buildLinkedList, buildDictList),
+                   ("AVL Tree", buildAVLTree, buildDictTree))
+
+    for name, buildSlotted, buildDict in comparisons:
+        slottedBytes = measureBytes(buildSlotted, ids) / count
+        dictBytes = measureBytes(buildDict, ids) / count
+        savings = dictBytes - slottedBytes
+
+        print(f"\t{name}: {slottedBytes:.1f} bytes per node with __slots__, "
+              f"{dictBytes:.1f} bytes per node with __dict__ "
+              f"({savings:.1f} bytes saved, {savings / dictBytes * 100:.0f}%)")
+
+    # the array tree stores raw 64-bit keys instead of node objects
+    arrayTreeBytes = measureBytes(buildArrayAVLTree, ids) / count
+    avlTreeBytes = measureBytes(buildAVLTree, ids) / count
+
+    print(f"\tAVL Tree: {arrayTreeBytes:.1f} bytes per node with typed arrays "
+          f"({avlTreeBytes / arrayTreeBytes:.1f}x smaller than slotted nodes)")
+
+    # the tables parse the IDs from text like the main program does,
+    # so the list backend pays for a boxed int per ID. they are sized to
+    # the IDs, since a mostly empty table costs the same per bucket either way
+    lines = [str(value) for value in ids]
+    listBytes = measureBytes(buildListProbingTable, lines) / count
+    arrayBytes = measureBytes(buildArrayProbingTable, lines) / count
+
+    print(f"\tProbing Hash Table ({getProbingTableSize(count)} buckets): "
+          f"{listBytes:.1f} bytes per ID with list buckets, "
+          f"{arrayBytes:.1f} bytes per ID with typed array buckets "
+          f"({listBytes / arrayBytes:.1f}x smaller)")
+
+    return
+
+def main():
+    """
+    Prints the per-node memory report for each ID file that exists
+    """
+    for fileName in REPORT_FILENAMES:
+        if os.path.exists(fileName):
+            # box the IDs up front so the structures are only charged for their nodes
+            printReport(fileName, list(loadIds(fileName)))
+        else:
+            print(f"\n{fileName}: file not found, skipping")
+
+    return
+
+if __name__ == "__main__":
+    main()
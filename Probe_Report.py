@@ -0,0 +1,111 @@
+# Creator: Aidan Scott
+# Date: 10/18/26
+# Description: Reports the average and maximum probe lengths of each
+# probing strategy of the probing hash table on the ID files, before
+# and after cycles of removing and inserting IDs
+
+from Hashing import HashTableProbing, PROBING_STRATEGIES
+from Data_Structures_Main import SHORT_LIST_FILENAME, SHORT_LOOKUP_FILENAME, MEDIUM_LIST_FILENAME, \
+    MEDIUM_LOOKUP_FILENAME, LONG_LIST_FILENAME, LONG_LOOKUP_FILENAME
+from Id_File_Loader import loadIds
+import os
+import random
+
+REPORT_FILENAMES = ((SHORT_LIST_FILENAME, SHORT_LOOKUP_FILENAME),
+                    (MEDIUM_LIST_FILENAME, MEDIUM_LOOKUP_FILENAME),
+                    (LONG_LIST_FILENAME, LONG_LOOKUP_FILENAME))
+
+# tables start small so they settle at the load factor they grow at
+STARTING_TABLE_SIZE = 101
+
+# each churn cycle removes this fraction of the IDs and inserts as many new ones
+CHURN_CYCLES = 10
+CHURN_FRACTION = 0.1
+CHURN_SEED = 0
+ID_LOWER_BOUND = 10000000
+ID_UPPER_BOUND = 99999999
+
+def churn(table, ids):
+    """
+    Removes a fraction of the IDs from a table and inserts as many new
+        unique IDs, repeated for a number of cycles
+    :param table (HashTableProbing): The table holding the IDs
+    :param ids (array): The IDs stored in the table
+    :return: None
+    """
+    generator = random.Random(CHURN_SEED)
+    liveIds = list(ids)
+    usedIds = set(ids)
+    churnCount = int(len(ids) * CHURN_FRACTION)
+
+    for cycle in range(CHURN_CYCLES):
+        # remove a random selection of the stored IDs
+        generator.shuffle(liveIds)
+        for value in liveIds[:churnCount]:
+            table.remove(value)
+        liveIds = liveIds[churnCount:]
+
+        # insert new IDs that have never been stored
+        while len(liveIds) < len(ids):
+            value = generator.randint(ID_LOWER_BOUND, ID_UPPER_BOUND)
+            if value not in usedIds:
+                usedIds.add(value)
+                liveIds.append(value)
+                table.insert(value)
+
+    return
+
+def printReport(fileName, ids, lookupIds):
+    """
+    Prints the probe lengths of a table built with each probing strategy
+        for the IDs in the table and for the lookup IDs that are missing
+    :param fileName (string): The name of the file the IDs were read from
+    :param ids (array): The IDs stored in the table
+    :param lookupIds (array): The IDs looked up in the table
+    :return: None
+    """
+    print(f"\n{fileName}: {len(ids)} records")
+
+    for probing in PROBING_STRATEGIES:
+        table = HashTableProbing(STARTING_TABLE_SIZE, backend="array", probing=probing)
+        for value in ids:
+            table.insert(value)
+
+        hitStats = table.probeStats()
+
+        # probe lengths of the lookups that are not in the table
+        missLengths = [table.probeLength(value) for value in lookupIds if table.find(value) is None]
+        if len(missLengths) > 0:
+            missAverage = sum(missLengths) / len(missLengths)
+            missMaximum = max(missLengths)
+        else:
+            missAverage = 0
+            missMaximum = 0
+
+        print(f"\t{probing} ({table.getTableSize()} buckets, load factor {len(table) / table.getTableSize():.2f}): "
+              f"hits average {hitStats['average']:.2f} max {hitStats['maximum']}, "
+              f"misses average {missAverage:.2f} max {missMaximum}")
+
+        churn(table, ids)
+        churnStats = table.probeStats()
+
+        print(f"\t\tafter {CHURN_CYCLES} cycles replacing {CHURN_FRACTION:.0%} of the IDs "
+              f"({table.getTombstoneCount()} tombstones): "
+              f"hits average {churnStats['average']:.2f} max {churnStats['maximum']}")
+
+    return
+
+def main():
+    """
+    Prints the probe length report for each pair of ID files that exists
+    """
+    for listFileName, lookupFileName in REPORT_FILENAMES:
+        if os.path.exists(listFileName) and os.path.exists(lookupFileName):
+            printReport(listFileName, loadIds(listFileName), loadIds(lookupFileName))
+        else:
+            print(f"\n{listFileName}: file not found, skipping")
+
+    return
+
+if __name__ == "__main__":
+    main()
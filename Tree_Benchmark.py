@@ -0,0 +1,153 @@
+# Creator: Aidan Scott
+# Date: 10/18/26
+# Description: Benchmarks the trees on a mixed workload of inserts,
+# removals and finds after loading the medium and long ID files
+
+from Trees import BinarySearchTree, AVLTree, ArrayAVLTree, BPlusTree
+from Data_Structures_Main import MEDIUM_LIST_FILENAME, LONG_LIST_FILENAME
+from Id_File_Loader import loadIds
+import math
+import os
+import random
+import time
+
+BENCHMARK_FILENAMES = (MEDIUM_LIST_FILENAME, LONG_LIST_FILENAME)
+
+# workload settings, each operation is equally likely to be an insert,
+# a removal or a find
+OPERATION_COUNT = 100000
+WORKLOAD_SEED = 0
+ID_LOWER_BOUND = 10000000
+ID_UPPER_BOUND = 99999999
+
+# operation codes of the workload
+INSERT = 0
+REMOVE = 1
+FIND = 2
+
+def generateWorkload(ids, operationCount, seed):
+    """
+    Generates a list of operations that insert new unique IDs, remove
+        stored IDs and find IDs that are stored about half of the time
+    :param ids (array): The IDs stored before the workload runs
+    :param operationCount (int): The number of operations
+    :param seed (int): The seed for the random choices
+    :return (list): Tuples of an operation code and the ID it uses
+    """
+    generator = random.Random(seed)
+    liveIds = list(ids)
+    usedIds = set(ids)
+    workload = []
+
+    for i in range(operationCount):
+        operation = generator.randrange(3)
+
+        if operation == INSERT or len(liveIds) == 0:
+            value = generator.randint(ID_LOWER_BOUND, ID_UPPER_BOUND)
+            while value in usedIds:
+                value = generator.randint(ID_LOWER_BOUND, ID_UPPER_BOUND)
+            usedIds.add(value)
+            liveIds.append(value)
+            workload.append((INSERT, value))
+
+        elif operation == REMOVE:
+            # swap a random stored ID to the end of the list and remove it
+            index = generator.randrange(len(liveIds))
+            liveIds[index], liveIds[-1] = liveIds[-1], liveIds[index]
+            workload.append((REMOVE, liveIds.pop()))
+
+        else:
+            if generator.random() < 0.5:
+                value = liveIds[generator.randrange(len(liveIds))]
+            else:
+                value = generator.randint(ID_LOWER_BOUND, ID_UPPER_BOUND)
+            workload.append((FIND, value))
+
+    return workload
+
+def runWorkload(tree, workload):
+    """
+    Runs a workload against a tree. AVL trees are replaced by the new
+        root their inserts and removals return.
+    :param tree (BinarySearchTree, AVLTree, ArrayAVLTree or BPlusTree): The loaded tree
+    :param workload (list): Tuples of an operation code and an ID
+    :return (tuple): The tree after the workload and the elapsed nanoseconds
+    """
+    returnsRoot = isinstance(tree, AVLTree)
+    startTime = time.perf_counter_ns()
+
+    for operation, value in workload:
+        if operation == FIND:
+            tree.find(value)
+        elif returnsRoot:
+            if operation == INSERT:
+                tree = tree.insert(value)
+            else:
+                tree = tree.remove(value)
+        elif operation == INSERT:
+            tree.insert(value)
+        else:
+            tree.remove(value)
+
+    endTime = time.perf_counter_ns()
+
+    return tree, endTime - startTime
+
+def buildTree(treeClass, ids):
+    """
+    Builds a tree by inserting a list of IDs one at a time
+    :param treeClass (class): BinarySearchTree, AVLTree, ArrayAVLTree or BPlusTree
+    :param ids (array): The IDs stored in the tree
+    :return (BinarySearchTree, AVLTree, ArrayAVLTree or BPlusTree): The root of the loaded tree
+    """
+    tree = treeClass()
+    for value in ids:
+        if isinstance(tree, AVLTree):
+            tree = tree.insert(value)
+        else:
+            tree.insert(value)
+
+    return tree
+
+def printBenchmark(fileName, ids):
+    """
+    Prints the time per operation of the mixed workload for each tree
+        loaded with a file of IDs, along with the time per level of a
+        perfectly balanced tree of the same size
+    :param fileName (string): The name of the file the IDs were read from
+    :param ids (array): The IDs read from the file
+    :return: None
+    """
+    print(f"\n{fileName}: {len(ids)} records, {OPERATION_COUNT} mixed inserts, removals and finds")
+
+    workload = generateWorkload(ids, OPERATION_COUNT, WORKLOAD_SEED)
+    levels = math.log2(len(ids))
+
+    trees = (("Binary Search Tree", BinarySearchTree), ("AVL Tree", AVLTree),
+             ("Array AVL Tree", ArrayAVLTree), ("B+ Tree", BPlusTree))
+
+    for name, treeClass in trees:
+        tree = buildTree(treeClass, ids)
+        tree, elapsed = runWorkload(tree, workload)
+        perOperation = elapsed / OPERATION_COUNT / 1000
+
+        print(f"\t{name}: {perOperation:.2f} us per operation, "
+              f"{perOperation / levels:.3f} us per level (log2 n = {levels:.1f}), "
+              f"final height {tree.getHeight()}")
+
+    return
+
+def main():
+    """
+    Prints the mixed workload benchmark for each ID file that exists
+    """
+    for fileName in BENCHMARK_FILENAMES:
+        if os.path.exists(fileName):
+            printBenchmark(fileName, loadIds(fileName))
+        else:
+            print(f"\n{fileName}: file not found, skipping")
+
+    return
+
+if __name__ == "__main__":
+    main()
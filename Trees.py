@@ -1,9 +1,22 @@
 # Creator: Aidan Scott
 # Date: 6/11/24
 # Description: Implements and tests Binary Tree,
-# Binary Search Tree, and AVL Tree classes
+# Binary Search Tree, AVL Tree, and B+ Tree classes
+
+from array import array
+from bisect import bisect_left, bisect_right
+import sys
+
+# marks a missing child or an empty free list in an ArrayAVLTree
+NO_NODE = -1
+
+# most children an internal node of a BPlusTree has by default
+DEFAULT_BPLUS_TREE_ORDER = 64
 
 class BinaryTree:
+    # fixed attribute layout so nodes do not carry a per-instance __dict__
+    __slots__ = ("__payload", "__leftChild", "__rightChild")
+
     def __init__(self, payload=None, leftChild=None, rightChild=None):
         """
         Constructor:
@@ -68,77 +81,144 @@ class BinaryTree:
 
         return
 
-    def preorderTraversal(self):
+    def iterPreorderNodes(self):
         """
-        Processes the tree into a string using a pre-order traversal
-        :return: A string representation of the tree using pre-order traversal
+        Iterates over the nodes of the tree in pre-order using an explicit
+            stack, so the tree is never recursed through or copied
+        :return: A generator of the non-empty nodes of the tree
         """
-        result = ""
-
         if self.isEmpty():
-            return result
+            return
 
-        else:
-            # root node
-            result += str(self.getPayload()) + " "
+        stack = [self]
+        while len(stack) > 0:
+            node = stack.pop()
+            yield node
 
-            # left side
-            if self.getLeftChild() is not None:
-                result += self.getLeftChild().preorderTraversal()
+            # the left side is pushed last so it is visited first
+            right = node.getRightChild()
+            if right is not None and not right.isEmpty():
+                stack.append(right)
 
-            # right side
-            if self.getRightChild() is not None:
-                result += self.getRightChild().preorderTraversal()
+            left = node.getLeftChild()
+            if left is not None and not left.isEmpty():
+                stack.append(left)
 
-        return result
+        return
 
-    def inorderTraversal(self):
+    def iterInorderNodes(self):
         """
-        Processes the tree into a string using an in-order traversal
-        :return: A string representation of the tree using in-order traversal
+        Iterates over the nodes of the tree in-order using an explicit
+            stack, so the tree is never recursed through or copied
+        :return: A generator of the non-empty nodes of the tree
         """
-        result = ""
+        if self.isEmpty():
+            return
+
+        stack = []
+        current = self
+        while len(stack) > 0 or current is not None:
+            # walk down the left side, saving each node to come back to
+            while current is not None and not current.isEmpty():
+                stack.append(current)
+                current = current.getLeftChild()
 
+            current = stack.pop()
+            yield current
+
+            current = current.getRightChild()
+
+        return
+
+    def iterPostorderNodes(self):
+        """
+        Iterates over the nodes of the tree in post-order using an explicit
+            stack, so the tree is never recursed through or copied
+        :return: A generator of the non-empty nodes of the tree
+        """
         if self.isEmpty():
-            return result
+            return
 
-        else:
-            # left side
-            if self.getLeftChild() is not None:
-                result += self.getLeftChild().inorderTraversal()
+        stack = []
+        current = self
+        lastVisited = None
+        while len(stack) > 0 or current is not None:
+            # walk down the left side, saving each node to come back to
+            if current is not None and not current.isEmpty():
+                stack.append(current)
+                current = current.getLeftChild()
 
-            # root node
-            result += str(self.getPayload()) + " "
+            else:
+                node = stack[-1]
+                right = node.getRightChild()
 
-            # right side
-            if self.getRightChild() is not None:
-                result += self.getRightChild().inorderTraversal()
+                # visit the right side before the node itself
+                if right is not None and not right.isEmpty() and right is not lastVisited:
+                    current = right
+                else:
+                    yield node
+                    lastVisited = stack.pop()
+                    current = None
 
-        return result
+        return
 
-    def postorderTraversal(self):
+    def iterPreorder(self):
         """
-        Processes the tree into a string using a post-order Traversal
-        :return: A string representation of the tree using post-order traversal
+        Iterates over the payloads of the tree in pre-order
+        :return: A generator of the values stored in the tree
         """
-        result = ""
+        for node in self.iterPreorderNodes():
+            yield node.getPayload()
 
-        if self.isEmpty():
-            return result
+        return
 
-        else:
-            # left side
-            if self.getLeftChild() is not None:
-                result +=  self.getLeftChild().postorderTraversal()
+    def iterInorder(self):
+        """
+        Iterates over the payloads of the tree in-order
+        :return: A generator of the values stored in the tree
+        """
+        for node in self.iterInorderNodes():
+            yield node.getPayload()
+
+        return
 
-            # right side
-            if self.getRightChild() is not None:
-                result += self.getRightChild().postorderTraversal()
+    def iterPostorder(self):
+        """
+        Iterates over the payloads of the tree in post-order
+        :return: A generator of the values stored in the tree
+        """
+        for node in self.iterPostorderNodes():
+            yield node.getPayload()
 
-            # root node
-            result += str(self.getPayload()) + " "
+        return
 
-        return result
+    def __iter__(self):
+        """
+        Iterates over the payloads of the tree in-order
+        :return: A generator of the values stored in the tree
+        """
+        return self.iterInorder()
+
+    def preorderTraversal(self):
+        """
+        Processes the tree into a string using a pre-order traversal
+        :return: A string representation of the tree using pre-order traversal
+        """
+        return "".join(str(payload) + " " for payload in self.iterPreorder())
+
+    def inorderTraversal(self):
+        """
+        Processes the tree into a string using an in-order traversal
+        :return: A string representation of the tree using in-order traversal
+        """
+        return "".join(str(payload) + " " for payload in self.iterInorder())
+
+    def postorderTraversal(self):
+        """
+        Processes the tree into a string using a post-order Traversal
+        :return: A string representation of the tree using post-order traversal
+        """
+        return "".join(str(payload) + " " for payload in self.iterPostorder())
 
     def __str__(self):
         """
@@ -157,7 +237,31 @@ class BinaryTree:
         # object that does not exist.
         return self is None or self.getPayload() is None
 
+    def memoryUsage(self):
+        """
+        Adds up the bytes used by every node of the tree, including empty
+            nodes, and the values they hold, walking the tree with an
+            explicit stack
+        :return (int): The number of bytes used by the tree
+        """
+        total = 0
+
+        stack = [self]
+        while len(stack) > 0:
+            node = stack.pop()
+            total += sys.getsizeof(node)
+            if not node.isEmpty():
+                total += sys.getsizeof(node.getPayload())
+
+            for child in (node.getLeftChild(), node.getRightChild()):
+                if child is not None:
+                    stack.append(child)
+
+        return total
+
 class BinarySearchTree(BinaryTree):
+    __slots__ = ("__height",)
+
     def __init__(self, payload=None, leftChild=None, rightChild=None):
         """
         Constructor:
@@ -190,6 +294,11 @@ class BinarySearchTree(BinaryTree):
         of the heights of its children plus one
         :return: None
         """
+        # an empty tree has no nodes
+        if self.isEmpty():
+            self.__height = -1
+            return
+
         # height of a leaf as a default value
         height = -1
 
@@ -214,28 +323,176 @@ class BinarySearchTree(BinaryTree):
         if self.isEmpty():
             self.setPayload(x)
             self.computeHeight()
+            return
+
+        # walk down to the empty spot for the value, remembering the path
+        path = []
+        current = self
+        while current is not None:
+            path.append(current)
+
+            # left side of tree
+            if x < current.getPayload():
+                # insertion step
+                if current.getLeftChild() is None:
+                    current.setLeftChild(BinarySearchTree(x))
+                    current = None
+                else:
+                    current = current.getLeftChild()
+
+            # right side of tree
+            else:
+                # insertion step
+                if current.getRightChild() is None:
+                    current.setRightChild(BinarySearchTree(x))
+                    current = None
+                else:
+                    current = current.getRightChild()
 
-        # left side of tree
-        elif x < self.getPayload():
-            # insertion step
-            if self.getLeftChild() is None:
-                self.setLeftChild(BinarySearchTree(x))
-                self.computeHeight()
-            # recursively insert into right subtree otherwise
+        # recompute heights back up the path until one stops changing
+        for node in reversed(path):
+            oldHeight = node.getHeight()
+            node.computeHeight()
+
+            if node.getHeight() == oldHeight:
+                break
+
+        return
+
+    def remove(self, x):
+        """
+        Removes a value from the current Binary Search Tree. A node with two
+            children takes the value of its in-order successor, and the
+            successor's node is removed instead.
+        :param x (any comparable type): The value being removed from the tree
+        :return: The value removed from the tree, None if not found
+        """
+        if self.isEmpty():
+            return None
+
+        # walk down to the node holding the value, remembering the path
+        path = []
+        current = self
+        while current is not None and x != current.getPayload():
+            path.append(current)
+
+            if x < current.getPayload():
+                current = current.getLeftChild()
             else:
-                self.getLeftChild().insert(x)
-                self.computeHeight()
+                current = current.getRightChild()
 
-        # right side of tree
-        else:
-            # insertion step
-            if self.getRightChild() is None:
-                self.setRightChild(BinarySearchTree(x))
-                self.computeHeight()
-            # recursively insert into right subtree otherwise
+        if current is None:
+            return None
+
+        removed = current.getPayload()
+        target = BinarySearchTree.removalTarget(current, path)
+
+        # the node being removed has at most one child
+        child = target.getLeftChild()
+        if child is None:
+            child = target.getRightChild()
+
+        # the root node stays the root, so it takes over its child's contents
+        if len(path) == 0:
+            if child is None:
+                self.setPayload(None)
             else:
-                self.getRightChild().insert(x)
-                self.computeHeight()
+                self.setPayload(child.getPayload())
+                self.setLeftChild(child.getLeftChild())
+                self.setRightChild(child.getRightChild())
+            self.computeHeight()
+            return removed
+
+        BinarySearchTree.replaceChild(path[-1], target, child)
+
+        # recompute heights back up the path until one stops changing
+        for node in reversed(path):
+            oldHeight = node.getHeight()
+            node.computeHeight()
+
+            if node.getHeight() == oldHeight:
+                break
+
+        return removed
+
+    @classmethod
+    def fromSorted(cls, iterable):
+        """
+        Builds a balanced tree from some values in linear time
+            instead of inserting them one at a time. The values are sorted
+            once, which is linear for values that are already in order.
+        :param iterable (iterable): The comparable values stored in the tree
+        :return: the root of the new tree
+        """
+        values = sorted(iterable)
+
+        if len(values) == 0:
+            return cls()
+
+        return cls.__buildBalanced(values, 0, len(values) - 1)
+
+    @classmethod
+    def __buildBalanced(cls, values, low, high):
+        """
+        Builds a balanced subtree from a slice of sorted values
+        :param values (list): The sorted values
+        :param low (int): The index of the first value in the subtree
+        :param high (int): The index of the last value in the subtree
+        :return: the root of the subtree, None if the slice is empty
+        """
+        if low > high:
+            return None
+
+        # equal values may end up on either side of the root, which
+        # keeps the two halves within one value of each other
+        middle = (low + high) // 2
+
+        leftChild = cls.__buildBalanced(values, low, middle - 1)
+        rightChild = cls.__buildBalanced(values, middle + 1, high)
+
+        node = cls(values[middle], leftChild, rightChild)
+        node.computeHeight()
+
+        return node
+
+    @staticmethod
+    def removalTarget(node, path):
+        """
+        Finds the node that is unlinked when removing the value of a node.
+            A node with two children copies the value of its in-order
+            successor, and the successor is unlinked instead.
+        :param node (BinarySearchTree): The node holding the value being removed
+        :param path (list): The nodes from the root down to the parent of node,
+                            extended down to the parent of the returned node
+        :return (BinarySearchTree): The node with at most one child to unlink
+        """
+        if node.getLeftChild() is None or node.getRightChild() is None:
+            return node
+
+        # the successor is the smallest value in the right subtree
+        path.append(node)
+        successor = node.getRightChild()
+        while successor.getLeftChild() is not None:
+            path.append(successor)
+            successor = successor.getLeftChild()
+
+        node.setPayload(successor.getPayload())
+
+        return successor
+
+    @staticmethod
+    def replaceChild(parent, child, replacement):
+        """
+        Replaces whichever child of a parent node is a given node
+        :param parent (BinarySearchTree): The parent node
+        :param child (BinarySearchTree): The child node being replaced
+        :param replacement (BinarySearchTree): The node taking its place, may be None
+        :return: None
+        """
+        if parent.getLeftChild() is child:
+            parent.setLeftChild(replacement)
+        else:
+            parent.setRightChild(replacement)
 
         return
 
@@ -249,23 +506,48 @@ class BinarySearchTree(BinaryTree):
         if self.isEmpty():
             return None
 
-        # check if the value is found in the tree
-        elif x == self.getPayload():
-            return self.getPayload()
+        current = self
+        while current is not None:
+            payload = current.getPayload()
+
+            # check if the value is found in the tree
+            if x == payload:
+                return payload
 
-        # left side of the tree
-        elif x < self.getPayload():
-            if self.getLeftChild() is not None:
-                return self.getLeftChild().find(x)
+            # left side of the tree
+            elif x < payload:
+                current = current.getLeftChild()
+
+            # right side of the tree
             else:
-                return None
+                current = current.getRightChild()
 
-        # right side of the tree
-        else:
-            if self.getRightChild() is not None:
-                return self.getRightChild().find(x)
+        return None
+
+    def findDepth(self, x):
+        """
+        Counts the nodes a find for some value visits, following the
+            same path as find without changing it
+        :param x (any comparable type): the value being searched for
+        :return (int): The number of nodes visited, 0 if the tree is empty
+        """
+        if self.isEmpty():
+            return 0
+
+        depth = 0
+        current = self
+        while current is not None:
+            depth += 1
+            payload = current.getPayload()
+
+            if x == payload:
+                return depth
+            elif x < payload:
+                current = current.getLeftChild()
             else:
-                return None
+                current = current.getRightChild()
+
+        return depth
 
     def minValue(self):
         """
@@ -276,14 +558,13 @@ class BinarySearchTree(BinaryTree):
         if self.isEmpty():
             return None
 
-        # recursively progress down the left side of the tree
+        # progress down the left side of the tree
         # until the furthest left leaf node (the min) is found
-        else:
-            nextValue = self.getLeftChild()
-            if nextValue is None:
-                return self.getPayload()
-            else:
-                return nextValue.minValue()
+        current = self
+        while current.getLeftChild() is not None:
+            current = current.getLeftChild()
+
+        return current.getPayload()
 
     def maxValue(self):
         """
@@ -291,44 +572,62 @@ class BinarySearchTree(BinaryTree):
         Returns None if the tree is empty
         :return: the maximum value in the BST
         """
-        # base case
         if self.isEmpty():
             return None
 
-        # recursively progress down the right side of the tree
+        # progress down the right side of the tree
         # until the furthest right leaf node (the max) is found
-        else:
-            nextValue = self.getRightChild()
-            if nextValue is None:
-                return self.getPayload()
-            else:
-                return nextValue.maxValue()
+        current = self
+        while current.getRightChild() is not None:
+            current = current.getRightChild()
+
+        return current.getPayload()
 
     def inorderTraversal(self):
         """
         Processes the binary search tree into a string using an in-order traversal
         :return: A string representation of the BST using in-order traversal
         """
-        result = ""
+        return "".join(str(node.getPayload()) + "(" + str(node.getHeight()) + ")" + " "
+                       for node in self.iterInorderNodes())
 
-        if self.isEmpty():
-            return result
+class AVLTree(BinarySearchTree):
+    __slots__ = ("__size",)
 
-        else:
-            # left side
-            if self.getLeftChild() is not None:
-                result += self.getLeftChild().inorderTraversal()
+    def __init__(self, payload=None, leftChild=None, rightChild=None):
+        """
+        Constructor:
+        :param payload (any comparable value): the contents of the root
+        :param leftChild (AVLTree): the left subtree
+        :param rightChild (AVLTree): the right subtree
+        """
+        BinarySearchTree.__init__(self, payload, leftChild, rightChild)
 
-            # root node
-            result += str(self.getPayload()) + "(" + str(self.getHeight()) + ")" + " "
+        self.computeSize()
 
-            # right side
-            if self.getRightChild() is not None:
-                result += self.getRightChild().inorderTraversal()
+        return
 
-        return result
+    def getSize(self):
+        """
+        Gets the number of values in the tree rooted at the current node
+        :return (int): The number of values in the subtree
+        """
+        return self.__size
+
+    def computeSize(self):
+        """
+        Compute and set the number of values in the subtree based on the
+        sizes of the children. The size is 0 for an empty tree, 1 for a
+        leaf, or the sizes of its children plus one
+        :return: None
+        """
+        if self.isEmpty():
+            self.__size = 0
+        else:
+            self.__size = 1 + AVLTree.__sizeOf(self.getLeftChild()) + AVLTree.__sizeOf(self.getRightChild())
+
+        return
 
-class AVLTree(BinarySearchTree):
     def balance(self):
         """
         Returns true if tree is unbalanced
@@ -358,55 +657,324 @@ class AVLTree(BinarySearchTree):
         if self.isEmpty():
             self.setPayload(x)
             self.computeHeight()
+            self.computeSize()
             return self
 
-        # left side of tree
-        elif x < self.getPayload():
-            # insertion step
-            if self.getLeftChild() is None:
-                self.setLeftChild(AVLTree(x))
-                self.computeHeight()
-                return self
+        # walk down to the empty spot for the value, remembering the path
+        path = []
+        current = self
+        while current is not None:
+            path.append(current)
+
+            # left side of tree
+            if x < current.getPayload():
+                # insertion step
+                if current.getLeftChild() is None:
+                    current.setLeftChild(AVLTree(x))
+                    current = None
+                else:
+                    current = current.getLeftChild()
+
+            # right side of tree
+            else:
+                # insertion step
+                if current.getRightChild() is None:
+                    current.setRightChild(AVLTree(x))
+                    current = None
+                else:
+                    current = current.getRightChild()
+
+        return self.__rebalancePath(path, 1)
+
+    def remove(self, x):
+        """
+        Remove a value from the AVL Tree, rebalancing every node on the path
+            back up to the root
+        :param x (any comparable type): the value being removed
+        :return: the new root of the tree
+        """
+        if self.isEmpty():
+            return self
 
-            # recursively insert into right subtree otherwise
+        # walk down to the node holding the value, remembering the path
+        path = []
+        current = self
+        while current is not None and x != current.getPayload():
+            path.append(current)
+
+            if x < current.getPayload():
+                current = current.getLeftChild()
             else:
-                self.setLeftChild(self.getLeftChild().insert(x))
-                if not self.balance():
-                    # Case 1:
-                    if x < self.getLeftChild().getPayload():
-                        return self.rotateWithLeftChild()
+                current = current.getRightChild()
+
+        # value not in the tree
+        if current is None:
+            return self
+
+        target = BinarySearchTree.removalTarget(current, path)
 
-                    # Case 2:
-                    else:
-                        self.setLeftChild(self.getLeftChild().rotateWithRightChild())
-                        return self.rotateWithLeftChild()
+        # the node being removed has at most one child
+        child = target.getLeftChild()
+        if child is None:
+            child = target.getRightChild()
 
+        # removing the root, its only child becomes the new root
+        if len(path) == 0:
+            if child is None:
+                self.setPayload(None)
                 self.computeHeight()
+                self.computeSize()
                 return self
+            return child
+
+        BinarySearchTree.replaceChild(path[-1], target, child)
+
+        return self.__rebalancePath(path, -1)
+
+    def __rebalancePath(self, path, sizeChange):
+        """
+        Rebalances the nodes on a path from the root, starting at the
+            bottom, and links each rotated subtree back to its parent.
+            The walk stops at the first subtree whose height is unchanged.
+        :param path (list): The nodes from the root down to the lowest changed node
+        :param sizeChange (int): 1 after an insert and -1 after a removal
+        :return: the new root of the tree
+        """
+        root = path[0]
+
+        # every node on the path gained or lost the one value, so the sizes
+        # are adjusted before any rotation recomputes them from the children
+        for node in path:
+            node.__size += sizeChange
+
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            oldHeight = node.getHeight()
+            subtree = node.__rebalance()
+
+            # link the new root of the subtree to the parent
+            if i == 0:
+                root = subtree
+            elif subtree is not node:
+                parent = path[i - 1]
+                if parent.getLeftChild() is node:
+                    parent.setLeftChild(subtree)
+                else:
+                    parent.setRightChild(subtree)
+
+            # the nodes above only depend on the height of this subtree, so
+            # once it is unchanged they are already balanced. An insert stops
+            # here after at most one rotation.
+            if subtree.getHeight() == oldHeight:
+                break
+
+        return root
+
+    def __rebalance(self):
+        """
+        Recomputes the height of the node and rotates it if it is unbalanced
+        :return: the new root of the subtree
+        """
+        self.computeHeight()
+
+        if self.balance():
+            return self
+
+        left = self.getLeftChild()
+        right = self.getRightChild()
 
-        # right side of tree
+        # left side of tree is too tall
+        if AVLTree.__heightOf(left) > AVLTree.__heightOf(right):
+            # Case 2: the left subtree leans right
+            if AVLTree.__heightOf(left.getRightChild()) > AVLTree.__heightOf(left.getLeftChild()):
+                self.setLeftChild(left.rotateWithRightChild())
+
+            # Case 1:
+            return self.rotateWithLeftChild()
+
+        # right side of tree is too tall
         else:
-            # insertion step
-            if self.getRightChild() is None:
-                self.setRightChild(AVLTree(x))
-                self.computeHeight()
-                return self
+            # Case 4: the right subtree leans left
+            if AVLTree.__heightOf(right.getLeftChild()) > AVLTree.__heightOf(right.getRightChild()):
+                self.setRightChild(right.rotateWithLeftChild())
+
+            # Case 3:
+            return self.rotateWithRightChild()
+
+    @staticmethod
+    def __heightOf(tree):
+        """
+        Gets the height of a subtree where a missing subtree has a height of -1
+        :param tree (AVLTree): The subtree, may be None
+        :return (int): The height of the subtree
+        """
+        if tree is None:
+            return -1
+        else:
+            return tree.getHeight()
+
+    @staticmethod
+    def __sizeOf(tree):
+        """
+        Gets the number of values in a subtree where a missing subtree has none
+        :param tree (AVLTree): The subtree, may be None
+        :return (int): The number of values in the subtree
+        """
+        if tree is None:
+            return 0
+        else:
+            return tree.getSize()
+
+    def range(self, lo, hi):
+        """
+        Iterates in order over the values in the tree between two bounds,
+            skipping every subtree that is outside the bounds
+        :param lo (any comparable type): The smallest value to include
+        :param hi (any comparable type): The largest value to include
+        :return: A generator of the values x where lo <= x <= hi
+        """
+        if self.isEmpty():
+            return
+
+        stack = []
+        current = self
+        while len(stack) > 0 or current is not None:
+            # walk down the left side, skipping nodes below the range
+            while current is not None:
+                if current.getPayload() < lo:
+                    current = current.getRightChild()
+                else:
+                    stack.append(current)
+                    current = current.getLeftChild()
+
+            if len(stack) == 0:
+                return
+
+            node = stack.pop()
+
+            # every value after this one is above the range
+            if node.getPayload() > hi:
+                return
+
+            yield node.getPayload()
+            current = node.getRightChild()
+
+        return
+
+    def __countBelow(self, x, inclusive):
+        """
+        Counts the values in the tree less than, or less than or equal to, x
+        :param x (any comparable type): The bound being counted up to
+        :param inclusive (bool): True to count values equal to x as well
+        :return (int): The number of values below the bound
+        """
+        if self.isEmpty():
+            return 0
 
-            # recursively insert into right subtree otherwise
+        count = 0
+        current = self
+        while current is not None:
+            payload = current.getPayload()
+
+            # the node and its left subtree are all below the bound
+            if payload < x or (inclusive and payload == x):
+                count += AVLTree.__sizeOf(current.getLeftChild()) + 1
+                current = current.getRightChild()
             else:
-                self.setRightChild(self.getRightChild().insert(x))
-                if not self.balance():
-                    # Case 3:
-                    if x >= self.getRightChild().getPayload():
-                        return self.rotateWithRightChild()
+                current = current.getLeftChild()
 
-                    # Case 4:
-                    else:
-                        self.setRightChild(self.getRightChild().rotateWithLeftChild())
-                        return self.rotateWithRightChild()
+        return count
 
-                self.computeHeight()
-                return self
+    def rank(self, x):
+        """
+        Counts the values in the tree that are less than x
+        :param x (any comparable type): The value being ranked
+        :return (int): The number of values less than x
+        """
+        return self.__countBelow(x, False)
+
+    def countRange(self, lo, hi):
+        """
+        Counts the values in the tree between two bounds
+        :param lo (any comparable type): The smallest value to count
+        :param hi (any comparable type): The largest value to count
+        :return (int): The number of values x where lo <= x <= hi
+        """
+        if hi < lo:
+            return 0
+
+        return self.__countBelow(hi, True) - self.__countBelow(lo, False)
+
+    def select(self, k):
+        """
+        Finds the value at position k of the tree in sorted order,
+            where the smallest value is at position zero
+        :param k (int): The position of the value
+        :return: The kth smallest value in the tree
+        :raises: IndexError if k is not a position in the tree
+        """
+        if k < 0 or k >= self.getSize():
+            raise IndexError("Tree index out of range")
+
+        current = self
+        while True:
+            leftSize = AVLTree.__sizeOf(current.getLeftChild())
+
+            if k < leftSize:
+                current = current.getLeftChild()
+            elif k == leftSize:
+                return current.getPayload()
+            else:
+                k -= leftSize + 1
+                current = current.getRightChild()
+
+    def floor(self, x):
+        """
+        Finds the largest value in the tree that is less than or equal to x
+        :param x (any comparable type): The upper bound
+        :return: The largest value <= x, None if there is no such value
+        """
+        if self.isEmpty():
+            return None
+
+        result = None
+        current = self
+        while current is not None:
+            payload = current.getPayload()
+
+            if payload == x:
+                return payload
+            elif payload < x:
+                result = payload
+                current = current.getRightChild()
+            else:
+                current = current.getLeftChild()
+
+        return result
+
+    def ceiling(self, x):
+        """
+        Finds the smallest value in the tree that is greater than or equal to x
+        :param x (any comparable type): The lower bound
+        :return: The smallest value >= x, None if there is no such value
+        """
+        if self.isEmpty():
+            return None
+
+        result = None
+        current = self
+        while current is not None:
+            payload = current.getPayload()
+
+            if payload == x:
+                return payload
+            elif payload > x:
+                result = payload
+                current = current.getLeftChild()
+            else:
+                current = current.getRightChild()
+
+        return result
 
     def rotateWithLeftChild(self):
         """
@@ -421,9 +989,11 @@ class AVLTree(BinarySearchTree):
         # attach self to k1
         k1.setRightChild(self)
 
-        # recalculate heights
+        # recalculate heights and sizes
         self.computeHeight()
+        self.computeSize()
         k1.computeHeight()
+        k1.computeSize()
 
         return k1
 
@@ -440,25 +1010,1047 @@ class AVLTree(BinarySearchTree):
         # attach self to k1
         k2.setLeftChild(self)
 
-        # recalculate heights
+        # recalculate heights and sizes
         self.computeHeight()
+        self.computeSize()
         k2.computeHeight()
+        k2.computeSize()
 
         return k2
 
-def main():
-    # test the Binary Tree class
-    print("Binary Tree Testing:\n")
+class ArrayAVLTree:
+    def __init__(self):
+        """
+        Constructor: an AVL tree of 64-bit int keys that keeps its nodes in
+            parallel typed arrays instead of node objects. A node is an index
+            into the arrays of keys, left and right child indices and heights.
+            The slots of removed nodes are kept on a free list, linked through
+            the left child array, and reused by later inserts.
+        """
+        self.__keys = array("q")
+        self.__lefts = array("i")
+        self.__rights = array("i")
+        self.__heights = array("b")
 
-    # create a new Binary Tree
-    BT = BinaryTree()
+        self.__root = NO_NODE
+        self.__free = NO_NODE
+        self.__count = 0
 
-    # test methods
-    print("isEmpty() = " + str(BT.isEmpty()))
-    print(BT)
+        return
 
-    # add a value to the tree
-    BT.setPayload(101)
+    def __len__(self):
+        """
+        Gets the number of values stored in the tree
+        :return (int): The number of values in the tree
+        """
+        return self.__count
+
+    def isEmpty(self):
+        """
+        Checks if the tree has no values
+        :return (bool): True if the tree is empty, False otherwise
+        """
+        return self.__root == NO_NODE
+
+    def getHeight(self):
+        """
+        Gets the height of the tree
+        :return (int): The height of the root, -1 for an empty tree
+        """
+        return self.__heightOf(self.__root)
+
+    def getCapacity(self):
+        """
+        Gets the number of node slots in the arrays, including free ones
+        :return (int): The length of the parallel arrays
+        """
+        return len(self.__keys)
+
+    def memoryUsage(self):
+        """
+        Adds up the bytes used by the tree object and its parallel arrays,
+            including the free slots and the spare capacity of the arrays.
+            The keys are stored unboxed, so there are no value objects to add.
+        :return (int): The number of bytes used by the tree
+        """
+        return sys.getsizeof(self) + sys.getsizeof(self.__keys) + sys.getsizeof(self.__lefts) + \
+            sys.getsizeof(self.__rights) + sys.getsizeof(self.__heights)
+
+    def __heightOf(self, node):
+        """
+        Gets the height of a subtree where a missing subtree has a height of -1
+        :param node (int): The index of the subtree root, may be NO_NODE
+        :return (int): The height of the subtree
+        """
+        if node == NO_NODE:
+            return -1
+        else:
+            return self.__heights[node]
+
+    def __newNode(self, x):
+        """
+        Stores a value in a new leaf node, reusing a free slot if there is one
+        :param x (int): The value stored in the node
+        :return (int): The index of the new node
+        """
+        if self.__free == NO_NODE:
+            node = len(self.__keys)
+            self.__keys.append(x)
+            self.__lefts.append(NO_NODE)
+            self.__rights.append(NO_NODE)
+            self.__heights.append(0)
+        else:
+            node = self.__free
+            self.__free = self.__lefts[node]
+            self.__keys[node] = x
+            self.__lefts[node] = NO_NODE
+            self.__rights[node] = NO_NODE
+            self.__heights[node] = 0
+
+        self.__count += 1
+
+        return node
+
+    def __freeNode(self, node):
+        """
+        Puts the slot of a removed node on the free list
+        :param node (int): The index of the removed node
+        :return: None
+        """
+        self.__lefts[node] = self.__free
+        self.__free = node
+        self.__count -= 1
+
+        return
+
+    def __computeHeight(self, node):
+        """
+        Compute and set the height of a node from the heights of its children
+        :param node (int): The index of the node
+        :return: None
+        """
+        self.__heights[node] = 1 + max(self.__heightOf(self.__lefts[node]),
+                                       self.__heightOf(self.__rights[node]))
+
+        return
+
+    def __rotateWithLeftChild(self, node):
+        """
+        Rotates a node with its left child
+        :param node (int): The index of the node
+        :return (int): The index of the new root of the subtree
+        """
+        k1 = self.__lefts[node]
+
+        # move right child of k1 to node, then attach node to k1
+        self.__lefts[node] = self.__rights[k1]
+        self.__rights[k1] = node
+
+        self.__computeHeight(node)
+        self.__computeHeight(k1)
+
+        return k1
+
+    def __rotateWithRightChild(self, node):
+        """
+        Rotates a node with its right child
+        :param node (int): The index of the node
+        :return (int): The index of the new root of the subtree
+        """
+        k2 = self.__rights[node]
+
+        # move left child of k2 to node, then attach node to k2
+        self.__rights[node] = self.__lefts[k2]
+        self.__lefts[k2] = node
+
+        self.__computeHeight(node)
+        self.__computeHeight(k2)
+
+        return k2
+
+    def __rebalance(self, node):
+        """
+        Recomputes the height of a node and rotates it if it is unbalanced
+        :param node (int): The index of the node
+        :return (int): The index of the new root of the subtree
+        """
+        self.__computeHeight(node)
+
+        left = self.__lefts[node]
+        right = self.__rights[node]
+        leftHeight = self.__heightOf(left)
+        rightHeight = self.__heightOf(right)
+
+        # left side of tree is too tall
+        if leftHeight - rightHeight > 1:
+            # the left subtree leans right
+            if self.__heightOf(self.__rights[left]) > self.__heightOf(self.__lefts[left]):
+                self.__lefts[node] = self.__rotateWithRightChild(left)
+
+            return self.__rotateWithLeftChild(node)
+
+        # right side of tree is too tall
+        elif rightHeight - leftHeight > 1:
+            # the right subtree leans left
+            if self.__heightOf(self.__lefts[right]) > self.__heightOf(self.__rights[right]):
+                self.__rights[node] = self.__rotateWithLeftChild(right)
+
+            return self.__rotateWithRightChild(node)
+
+        return node
+
+    def __rebalancePath(self, path):
+        """
+        Rebalances every node on a path from the root, starting at the
+            bottom, and links each rotated subtree back to its parent.
+            Stops early once a subtree keeps its height since the
+            nodes above it are then unchanged.
+        :param path (list): The node indices from the root down to the lowest changed node
+        :return: None
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            oldHeight = self.__heights[node]
+            subtree = self.__rebalance(node)
+
+            # link the new root of the subtree to the parent
+            if i == 0:
+                self.__root = subtree
+            elif subtree != node:
+                self.__replaceChild(path[i - 1], node, subtree)
+
+            if self.__heights[subtree] == oldHeight:
+                break
+
+        return
+
+    def __replaceChild(self, parent, child, replacement):
+        """
+        Replaces whichever child of a parent node is a given node
+        :param parent (int): The index of the parent node
+        :param child (int): The index of the child being replaced
+        :param replacement (int): The index taking its place, may be NO_NODE
+        :return: None
+        """
+        if self.__lefts[parent] == child:
+            self.__lefts[parent] = replacement
+        else:
+            self.__rights[parent] = replacement
+
+        return
+
+    def insert(self, x):
+        """
+        Insert a value into the AVL Tree
+        :param x (int): The value being inserted, must fit in a 64-bit int
+        :return: the tree, so it can be used like AVLTree.insert
+        """
+        # empty AVL Tree
+        if self.__root == NO_NODE:
+            self.__root = self.__newNode(x)
+            return self
+
+        keys = self.__keys
+
+        # walk down to the empty spot for the value, remembering the path
+        path = []
+        current = self.__root
+        while current != NO_NODE:
+            path.append(current)
+
+            # left side of tree
+            if x < keys[current]:
+                # insertion step
+                if self.__lefts[current] == NO_NODE:
+                    self.__lefts[current] = self.__newNode(x)
+                    current = NO_NODE
+                else:
+                    current = self.__lefts[current]
+
+            # right side of tree
+            else:
+                # insertion step
+                if self.__rights[current] == NO_NODE:
+                    self.__rights[current] = self.__newNode(x)
+                    current = NO_NODE
+                else:
+                    current = self.__rights[current]
+
+        self.__rebalancePath(path)
+
+        return self
+
+    def remove(self, x):
+        """
+        Removes a value from the AVL Tree, rebalancing the nodes above it
+        :param x (int): The value being removed
+        :return: the tree, so it can be used like AVLTree.remove
+        """
+        keys = self.__keys
+
+        # walk down to the value, remembering the path
+        path = []
+        current = self.__root
+        while current != NO_NODE and x != keys[current]:
+            path.append(current)
+
+            if x < keys[current]:
+                current = self.__lefts[current]
+            else:
+                current = self.__rights[current]
+
+        # value not in the tree
+        if current == NO_NODE:
+            return self
+
+        # a node with two children takes the value of its successor,
+        # which is unlinked instead
+        if self.__lefts[current] != NO_NODE and self.__rights[current] != NO_NODE:
+            path.append(current)
+            successor = self.__rights[current]
+            while self.__lefts[successor] != NO_NODE:
+                path.append(successor)
+                successor = self.__lefts[successor]
+
+            keys[current] = keys[successor]
+            current = successor
+
+        # link the only child of the node, if any, to its parent
+        if self.__lefts[current] != NO_NODE:
+            replacement = self.__lefts[current]
+        else:
+            replacement = self.__rights[current]
+
+        if len(path) == 0:
+            self.__root = replacement
+        else:
+            self.__replaceChild(path[-1], current, replacement)
+
+        self.__freeNode(current)
+
+        if len(path) > 0:
+            self.__rebalancePath(path)
+
+        return self
+
+    def find(self, x):
+        """
+        Finds some value in the AVL Tree
+        :param x (int): The value being searched for
+        :return: The value stored in the tree, None if not found
+        """
+        keys = self.__keys
+        lefts = self.__lefts
+        rights = self.__rights
+
+        current = self.__root
+        while current != NO_NODE:
+            key = keys[current]
+
+            # check if the value is found in the tree
+            if x == key:
+                return key
+
+            # left side of the tree
+            elif x < key:
+                current = lefts[current]
+
+            # right side of the tree
+            else:
+                current = rights[current]
+
+        return None
+
+    def findDepth(self, x):
+        """
+        Counts the nodes a find for some value visits, following the
+            same path as find without changing it
+        :param x (int): The value being searched for
+        :return (int): The number of nodes visited, 0 if the tree is empty
+        """
+        keys = self.__keys
+
+        depth = 0
+        current = self.__root
+        while current != NO_NODE:
+            depth += 1
+
+            if x == keys[current]:
+                return depth
+            elif x < keys[current]:
+                current = self.__lefts[current]
+            else:
+                current = self.__rights[current]
+
+        return depth
+
+    def minValue(self):
+        """
+        Returns the minimum value in the tree.
+        Returns None if the tree is empty
+        :return: the minimum value in the tree
+        """
+        if self.__root == NO_NODE:
+            return None
+
+        # progress down the left side of the tree
+        current = self.__root
+        while self.__lefts[current] != NO_NODE:
+            current = self.__lefts[current]
+
+        return self.__keys[current]
+
+    def maxValue(self):
+        """
+        Returns the maximum value in the tree.
+        Returns None if the tree is empty
+        :return: the maximum value in the tree
+        """
+        if self.__root == NO_NODE:
+            return None
+
+        # progress down the right side of the tree
+        current = self.__root
+        while self.__rights[current] != NO_NODE:
+            current = self.__rights[current]
+
+        return self.__keys[current]
+
+    def iterInorderNodes(self):
+        """
+        Iterates over the node indices of the tree using an in-order traversal
+        :return (generator): The index of each node from smallest to largest value
+        """
+        stack = []
+        current = self.__root
+
+        while current != NO_NODE or len(stack) > 0:
+            # walk as far left as possible
+            while current != NO_NODE:
+                stack.append(current)
+                current = self.__lefts[current]
+
+            current = stack.pop()
+            yield current
+            current = self.__rights[current]
+
+        return
+
+    def __iter__(self):
+        """
+        Iterates over the values of the tree from smallest to largest
+        :return (generator): The values in order
+        """
+        keys = self.__keys
+        for node in self.iterInorderNodes():
+            yield keys[node]
+
+        return
+
+    def __str__(self):
+        """
+        Processes the tree into a string using an in-order traversal
+        :return: A string of each value with its height in brackets
+        """
+        return "".join(str(self.__keys[node]) + "(" + str(self.__heights[node]) + ")" + " "
+                       for node in self.iterInorderNodes())
+
+    @classmethod
+    def fromSorted(cls, iterable):
+        """
+        Builds a balanced tree from some values in linear time,
+            laying the nodes out in order in the arrays
+        :param iterable (iterable): The int values stored in the tree
+        :return (ArrayAVLTree): The new tree
+        """
+        tree = cls()
+        keys = array("q", sorted(iterable))
+        count = len(keys)
+
+        tree.__keys = keys
+        tree.__lefts = array("i", [NO_NODE]) * count
+        tree.__rights = array("i", [NO_NODE]) * count
+        tree.__heights = array("b", [0]) * count
+        tree.__count = count
+        tree.__root = tree.__buildBalanced(0, count - 1)
+
+        return tree
+
+    def __buildBalanced(self, low, high):
+        """
+        Links the nodes of a slice of the sorted keys into a balanced subtree
+        :param low (int): The index of the first node in the subtree
+        :param high (int): The index of the last node in the subtree
+        :return (int): The index of the subtree root, NO_NODE if the slice is empty
+        """
+        if low > high:
+            return NO_NODE
+
+        # equal values may end up on either side of the root, which
+        # keeps the two halves within one value of each other
+        middle = (low + high) // 2
+
+        self.__lefts[middle] = self.__buildBalanced(low, middle - 1)
+        self.__rights[middle] = self.__buildBalanced(middle + 1, high)
+        self.__computeHeight(middle)
+
+        return middle
+
+    def toBytes(self):
+        """
+        Serializes the tree by dumping its arrays, in the byte order of
+            the machine, after a header of the root, free list and counts
+        :return (bytes): The serialized tree
+        """
+        header = array("q", [self.__root, self.__free, self.__count, len(self.__keys)])
+
+        return b"".join([header.tobytes(), self.__keys.tobytes(), self.__lefts.tobytes(),
+                         self.__rights.tobytes(), self.__heights.tobytes()])
+
+    @classmethod
+    def fromBytes(cls, data):
+        """
+        Rebuilds a tree from the bytes made by toBytes on a machine with the same byte order
+        :param data (bytes-like): The serialized tree
+        :return (ArrayAVLTree): The rebuilt tree
+        :raises: ValueError if the data is not the size the header describes
+        """
+        tree = cls()
+        view = memoryview(data)
+
+        header = array("q")
+        offset = 4 * header.itemsize
+        if len(view) < offset:
+            raise ValueError("Serialized tree is truncated")
+
+        header.frombytes(view[:offset])
+        tree.__root, tree.__free, tree.__count, capacity = header
+
+        # the keys, left children, right children and heights follow in order
+        arrays = []
+        for typeCode in ("q", "i", "i", "b"):
+            values = array(typeCode)
+            end = offset + capacity * values.itemsize
+            if end > len(view):
+                raise ValueError("Serialized tree is truncated")
+
+            values.frombytes(view[offset:end])
+            arrays.append(values)
+            offset = end
+
+        tree.__keys, tree.__lefts, tree.__rights, tree.__heights = arrays
+
+        if offset != len(view):
+            raise ValueError("Serialized tree has extra bytes")
+
+        return tree
+
+class bPlusTreeNode:
+    # fixed attribute layout so nodes do not carry a per-instance __dict__
+    __slots__ = ("__keys", "__children", "__next")
+
+    def __init__(self, keys=None, children=None, next=None):
+        """
+        Constructor: creates a leaf node when there are no children
+        :param keys (list): the sorted keys of a leaf, or the separator
+                            keys between the children of an internal node
+        :param children (list): the child nodes of an internal node,
+                                None for a leaf
+        :param next (bPlusTreeNode): the leaf after the current leaf,
+                                     None for the last leaf or an internal node
+        """
+        if keys is None:
+            keys = []
+
+        self.__keys = keys
+        self.__children = children
+        self.__next = next
+
+        return
+
+    def getKeys(self):
+        """
+        Gets the list of keys of the node, which is changed in place
+        :return (list): The keys of the node
+        """
+        return self.__keys
+
+    def getChildren(self):
+        """
+        Gets the list of children of the node, which is changed in place
+        :return (list): The child nodes, None for a leaf
+        """
+        return self.__children
+
+    def getNext(self):
+        """
+        Gets the leaf after the current leaf
+        :return (bPlusTreeNode): The next leaf, None if there is none
+        """
+        return self.__next
+
+    def setNext(self, next):
+        """
+        Sets the leaf after the current leaf
+        :param next (bPlusTreeNode): The next leaf
+        :return: None
+        """
+        self.__next = next
+
+        return
+
+    def isLeaf(self):
+        """
+        Checks if the node is a leaf
+        :return (bool): True if the node has no children, False otherwise
+        """
+        return self.__children is None
+
+class BPlusTree:
+    def __init__(self, order=DEFAULT_BPLUS_TREE_ORDER):
+        """
+        Constructor: a B+ tree of unique keys where every node holds up to
+            order - 1 sorted keys and an internal node has up to order
+            children. The keys are only stored in the leaves, which are
+            linked from smallest to largest for range scans.
+        :param order (int): The most children an internal node can have
+        :raises: ValueError if the order is less than 3
+        """
+        if order < 3:
+            raise ValueError("B+ tree order must be at least 3")
+
+        self.__order = order
+        self.__root = bPlusTreeNode()
+        self.__firstLeaf = self.__root
+        self.__count = 0
+
+        return
+
+    def __len__(self):
+        """
+        Gets the number of keys stored in the tree
+        :return (int): The number of keys in the tree
+        """
+        return self.__count
+
+    def isEmpty(self):
+        """
+        Checks if the tree has no keys
+        :return (bool): True if the tree is empty, False otherwise
+        """
+        return self.__count == 0
+
+    def memoryUsage(self):
+        """
+        Adds up the bytes used by the tree object, every node and its key
+            and child lists, and the keys in the leaves. The separator keys
+            of internal nodes are copied references to leaf keys, so their
+            values are only counted once.
+        :return (int): The number of bytes used by the tree
+        """
+        total = sys.getsizeof(self)
+
+        stack = [self.__root]
+        while len(stack) > 0:
+            node = stack.pop()
+            total += sys.getsizeof(node) + sys.getsizeof(node.getKeys())
+
+            if node.isLeaf():
+                for key in node.getKeys():
+                    total += sys.getsizeof(key)
+            else:
+                total += sys.getsizeof(node.getChildren())
+                stack.extend(node.getChildren())
+
+        return total
+
+    def getOrder(self):
+        """
+        Gets the most children an internal node can have
+        :return (int): The order of the tree
+        """
+        return self.__order
+
+    def getHeight(self):
+        """
+        Gets the height of the tree, where a tree of only a leaf has a height of 0
+        :return (int): The number of levels below the root, -1 for an empty tree
+        """
+        if self.__count == 0:
+            return -1
+
+        height = 0
+        node = self.__root
+        while not node.isLeaf():
+            node = node.getChildren()[0]
+            height += 1
+
+        return height
+
+    def __findLeaf(self, x, path=None):
+        """
+        Walks down from the root to the leaf where a key belongs
+        :param x (any comparable type): The key being searched for
+        :param path (list): When given, filled with a tuple of each
+                            internal node and the index of the child taken
+        :return (bPlusTreeNode): The leaf where the key belongs
+        """
+        node = self.__root
+        while not node.isLeaf():
+            index = bisect_right(node.getKeys(), x)
+            if path is not None:
+                path.append((node, index))
+            node = node.getChildren()[index]
+
+        return node
+
+    def insert(self, x):
+        """
+        Inserts a key into the tree, splitting every node on the way
+            back up that has too many keys. A key that is already
+            stored leaves the tree unchanged.
+        :param x (any comparable type): The key being inserted
+        :return: the tree, so it can be used like AVLTree.insert
+        """
+        path = []
+        leaf = self.__findLeaf(x, path)
+        keys = leaf.getKeys()
+
+        index = bisect_left(keys, x)
+        if index < len(keys) and keys[index] == x:
+            return self
+
+        keys.insert(index, x)
+        self.__count += 1
+
+        # split the leaf in half, copying the first key of the new leaf up
+        if len(keys) < self.__order:
+            return self
+
+        middle = len(keys) // 2
+        newNode = bPlusTreeNode(keys[middle:], None, leaf.getNext())
+        del keys[middle:]
+        leaf.setNext(newNode)
+        separator = newNode.getKeys()[0]
+
+        # insert the separator into each parent, splitting them in turn
+        # and moving their middle key up
+        while len(path) > 0:
+            parent, index = path.pop()
+            parentKeys = parent.getKeys()
+            parentChildren = parent.getChildren()
+            parentKeys.insert(index, separator)
+            parentChildren.insert(index + 1, newNode)
+
+            if len(parentKeys) < self.__order:
+                return self
+
+            middle = len(parentKeys) // 2
+            separator = parentKeys[middle]
+            newNode = bPlusTreeNode(parentKeys[middle + 1:], parentChildren[middle + 1:])
+            del parentKeys[middle:]
+            del parentChildren[middle + 1:]
+
+        # the root was split, so the tree grows a level
+        self.__root = bPlusTreeNode([separator], [self.__root, newNode])
+
+        return self
+
+    def remove(self, x):
+        """
+        Removes a key from the tree, refilling every node on the way back
+            up that has too few keys by borrowing from or merging with a
+            sibling
+        :param x (any comparable type): The key being removed
+        :return: the tree, so it can be used like AVLTree.remove
+        """
+        path = []
+        node = self.__findLeaf(x, path)
+        keys = node.getKeys()
+
+        index = bisect_left(keys, x)
+        if index == len(keys) or keys[index] != x:
+            return self
+
+        del keys[index]
+        self.__count -= 1
+
+        # nodes other than the root keep at least half of their keys
+        minKeys = (self.__order - 1) // 2
+
+        while len(path) > 0 and len(node.getKeys()) < minKeys:
+            parent, index = path.pop()
+            if node.isLeaf():
+                self.__refillLeaf(parent, index, minKeys)
+            else:
+                self.__refillInternal(parent, index, minKeys)
+            node = parent
+
+        # the root lost its last separator, so the tree shrinks a level
+        if not self.__root.isLeaf() and len(self.__root.getChildren()) == 1:
+            self.__root = self.__root.getChildren()[0]
+
+        return self
+
+    @staticmethod
+    def __refillLeaf(parent, index, minKeys):
+        """
+        Refills a leaf with too few keys from its left or right sibling
+        :param parent (bPlusTreeNode): The parent of the leaf
+        :param index (int): The index of the leaf in the children of the parent
+        :param minKeys (int): The fewest keys a leaf can hold
+        :return: None
+        """
+        parentKeys = parent.getKeys()
+        children = parent.getChildren()
+        leaf = children[index]
+
+        # borrow the largest key of the left sibling
+        if index > 0 and len(children[index - 1].getKeys()) > minKeys:
+            leaf.getKeys().insert(0, children[index - 1].getKeys().pop())
+            parentKeys[index - 1] = leaf.getKeys()[0]
+
+        # borrow the smallest key of the right sibling
+        elif index < len(children) - 1 and len(children[index + 1].getKeys()) > minKeys:
+            right = children[index + 1]
+            leaf.getKeys().append(right.getKeys().pop(0))
+            parentKeys[index] = right.getKeys()[0]
+
+        # merge into the left sibling
+        elif index > 0:
+            left = children[index - 1]
+            left.getKeys().extend(leaf.getKeys())
+            left.setNext(leaf.getNext())
+            del parentKeys[index - 1]
+            del children[index]
+
+        # merge the right sibling into the leaf
+        else:
+            right = children[index + 1]
+            leaf.getKeys().extend(right.getKeys())
+            leaf.setNext(right.getNext())
+            del parentKeys[index]
+            del children[index + 1]
+
+        return
+
+    @staticmethod
+    def __refillInternal(parent, index, minKeys):
+        """
+        Refills an internal node with too few keys from its left or right
+            sibling, rotating the separator in the parent through it
+        :param parent (bPlusTreeNode): The parent of the node
+        :param index (int): The index of the node in the children of the parent
+        :param minKeys (int): The fewest keys an internal node can hold
+        :return: None
+        """
+        parentKeys = parent.getKeys()
+        children = parent.getChildren()
+        node = children[index]
+
+        # borrow the last child of the left sibling
+        if index > 0 and len(children[index - 1].getKeys()) > minKeys:
+            left = children[index - 1]
+            node.getKeys().insert(0, parentKeys[index - 1])
+            node.getChildren().insert(0, left.getChildren().pop())
+            parentKeys[index - 1] = left.getKeys().pop()
+
+        # borrow the first child of the right sibling
+        elif index < len(children) - 1 and len(children[index + 1].getKeys()) > minKeys:
+            right = children[index + 1]
+            node.getKeys().append(parentKeys[index])
+            node.getChildren().append(right.getChildren().pop(0))
+            parentKeys[index] = right.getKeys().pop(0)
+
+        # merge into the left sibling, pulling the separator down
+        elif index > 0:
+            left = children[index - 1]
+            left.getKeys().append(parentKeys[index - 1])
+            left.getKeys().extend(node.getKeys())
+            left.getChildren().extend(node.getChildren())
+            del parentKeys[index - 1]
+            del children[index]
+
+        # merge the right sibling into the node, pulling the separator down
+        else:
+            right = children[index + 1]
+            node.getKeys().append(parentKeys[index])
+            node.getKeys().extend(right.getKeys())
+            node.getChildren().extend(right.getChildren())
+            del parentKeys[index]
+            del children[index + 1]
+
+        return
+
+    def find(self, x):
+        """
+        Finds some key in the B+ Tree
+        :param x (any comparable type): The key being searched for
+        :return: The key stored in the tree, None if not found
+        """
+        keys = self.__findLeaf(x).getKeys()
+
+        index = bisect_left(keys, x)
+        if index < len(keys) and keys[index] == x:
+            return keys[index]
+
+        return None
+
+    def minValue(self):
+        """
+        Returns the minimum key in the tree.
+        Returns None if the tree is empty
+        :return: the minimum key in the tree
+        """
+        if self.__count == 0:
+            return None
+
+        return self.__firstLeaf.getKeys()[0]
+
+    def maxValue(self):
+        """
+        Returns the maximum key in the tree.
+        Returns None if the tree is empty
+        :return: the maximum key in the tree
+        """
+        if self.__count == 0:
+            return None
+
+        # progress down the right side of the tree
+        node = self.__root
+        while not node.isLeaf():
+            node = node.getChildren()[-1]
+
+        return node.getKeys()[-1]
+
+    def range(self, lo, hi):
+        """
+        Iterates in order over the keys in the tree between two bounds by
+            finding the leaf of the lower bound and following the leaf links
+        :param lo (any comparable type): The smallest key to include
+        :param hi (any comparable type): The largest key to include
+        :return: A generator of the keys x where lo <= x <= hi
+        """
+        leaf = self.__findLeaf(lo)
+        index = bisect_left(leaf.getKeys(), lo)
+
+        while leaf is not None:
+            keys = leaf.getKeys()
+            for i in range(index, len(keys)):
+                # every key after this one is above the range
+                if keys[i] > hi:
+                    return
+                yield keys[i]
+
+            leaf = leaf.getNext()
+            index = 0
+
+        return
+
+    def iterLeaves(self):
+        """
+        Iterates over the leaves of the tree from smallest to largest keys
+        :return (generator): Each leaf node in order
+        """
+        leaf = self.__firstLeaf
+        while leaf is not None:
+            yield leaf
+            leaf = leaf.getNext()
+
+        return
+
+    def __iter__(self):
+        """
+        Iterates over the keys of the tree from smallest to largest
+        :return (generator): The keys in order
+        """
+        for leaf in self.iterLeaves():
+            yield from leaf.getKeys()
+
+        return
+
+    def __str__(self):
+        """
+        Processes the tree into a string of its leaves from left to right
+        :return: A string of the keys of each leaf in brackets
+        """
+        return "".join("[" + " ".join(str(key) for key in leaf.getKeys()) + "] "
+                       for leaf in self.iterLeaves())
+
+    @classmethod
+    def fromSorted(cls, iterable, order=DEFAULT_BPLUS_TREE_ORDER):
+        """
+        Builds a tree from some keys in linear time by packing the sorted
+            keys into leaves and building each level of internal nodes
+            from the level below it. Repeated keys are stored once.
+        :param iterable (iterable): The comparable keys stored in the tree
+        :param order (int): The most children an internal node can have
+        :return (BPlusTree): The new tree
+        """
+        tree = cls(order)
+        keys = sorted(set(iterable))
+
+        if len(keys) == 0:
+            return tree
+
+        # pack the keys into leaves of about the same size
+        level = []
+        previous = None
+        for chunk in BPlusTree.__split(keys, order - 1):
+            leaf = bPlusTreeNode(chunk)
+            if previous is not None:
+                previous.setNext(leaf)
+            level.append((leaf, chunk[0]))
+            previous = leaf
+        firstLeaf = level[0][0]
+
+        # group each level under parents until only the root is left
+        while len(level) > 1:
+            parents = []
+            for chunk in BPlusTree.__split(level, order):
+                separators = [smallest for node, smallest in chunk[1:]]
+                children = [node for node, smallest in chunk]
+                parents.append((bPlusTreeNode(separators, children), chunk[0][1]))
+            level = parents
+
+        tree.__root = level[0][0]
+        tree.__firstLeaf = firstLeaf
+        tree.__count = len(keys)
+
+        return tree
+
+    @staticmethod
+    def __split(items, most):
+        """
+        Splits a list into the fewest slices of at most a given length,
+            keeping the slices within one item of the same length
+        :param items (list): The items being split
+        :param most (int): The longest a slice can be
+        :return (list): The slices in order
+        """
+        count = -(-len(items) // most)
+        slices = []
+        start = 0
+        for i in range(count):
+            end = start + (len(items) - start) // (count - i)
+            slices.append(items[start:end])
+            start = end
+
+        return slices
+
+def main():
+    # test the Binary Tree class
+    print("Binary Tree Testing:\n")
+
+    # create a new Binary Tree
+    BT = BinaryTree()
+
+    # test methods
+    print("isEmpty() = " + str(BT.isEmpty()))
+    print(BT)
+
+    # add a value to the tree
+    BT.setPayload(101)
     print("isEmpty() = " + str(BT.isEmpty()))
 
     # populate tree
@@ -474,6 +2066,11 @@ def main():
     print("Preorder traversal: " + BT.preorderTraversal())
     print("Postorder traversal: " + BT.postorderTraversal())
 
+    # stream the payloads one at a time instead of building a string
+    print("Inorder iteration: " + str(list(BT.iterInorder())))
+    print("Preorder iteration: " + str(list(BT.iterPreorder())))
+    print("Postorder iteration: " + str(list(BT.iterPostorder())))
+
     # test the Binary Search Tree class
     print("\nBinary Search Tree Testing:\n")
 
@@ -509,6 +2106,11 @@ def main():
     print(f"\nThe minimum value in the BST is {BST.minValue()}")
     print(f"The maximum value in the BST is {BST.maxValue()}")
 
+    # remove a leaf, a node with one child and the root with two children
+    print(f"\nRemoved {BST.remove(315)}, {BST.remove(42)} and {BST.remove(101)} from the BST")
+    print(f"Removing 30 from the BST returns {BST.remove(30)}")
+    print(BST)
+
     # test the AVL Tree class
     print("\nAVL Tree Testing:\n")
 
@@ -540,6 +2142,69 @@ def main():
     print(f"The minimum value in the BST is {myTree.minValue()}")
     print(f"The maximum value in the BST is {myTree.maxValue()}")
 
+    # use the subtree sizes to answer questions about the order of the values
+    print()
+    print(f"The AVL Tree holds {myTree.getSize()} values")
+    print(f"The values from 0 to 50 are {list(myTree.range(0, 50))}")
+    print(f"There are {myTree.countRange(0, 50)} values from 0 to 50")
+    print(f"There are {myTree.rank(20)} values less than 20")
+    print(f"The value at position 5 is {myTree.select(5)}")
+    print(f"The floor of 50 is {myTree.floor(50)} and the ceiling of 50 is {myTree.ceiling(50)}")
+
+    # remove values, rebalancing the tree as it shrinks
+    print()
+    for value in [63, 2, 4, 6, 93]:
+        myTree = myTree.remove(value)
+        print(myTree)
+
+    print(f"10 was found in the AVL Tree == {myTree.find(10) is not None}")
+    print(f"63 was found in the AVL Tree == {myTree.find(63) is not None}")
+
+    # test the AVL Tree that keeps its nodes in typed arrays
+    print("\nArray AVL Tree Testing:\n")
+
+    arrayTree = ArrayAVLTree()
+    print("isEmpty() = " + str(arrayTree.isEmpty()))
+
+    for value in [63] + values:
+        arrayTree.insert(value)
+    print(arrayTree)
+
+    # removed slots are reused by the next inserts
+    arrayTree.remove(63)
+    arrayTree.remove(2)
+    arrayTree.insert(50)
+    print(arrayTree)
+    print(f"The tree holds {len(arrayTree)} values in {arrayTree.getCapacity()} array slots")
+
+    print(f"The minimum value is {arrayTree.minValue()} and the maximum value is {arrayTree.maxValue()}")
+    print(f"50 was found in the Array AVL Tree == {arrayTree.find(50) is not None}")
+
+    # the tree serializes to a plain dump of its arrays
+    copiedTree = ArrayAVLTree.fromBytes(arrayTree.toBytes())
+    print(f"The copy read back from {len(arrayTree.toBytes())} bytes is {copiedTree}")
+
+    # test the B+ Tree class with a small order so the leaves split
+    print("\nB+ Tree Testing:\n")
+
+    bPlusTree = BPlusTree(4)
+    print("isEmpty() = " + str(bPlusTree.isEmpty()))
+
+    for value in [63] + values:
+        bPlusTree.insert(value)
+    print(bPlusTree)
+    print(f"The B+ Tree holds {len(bPlusTree)} keys with a height of {bPlusTree.getHeight()}")
+
+    print(f"The minimum value is {bPlusTree.minValue()} and the maximum value is {bPlusTree.maxValue()}")
+    print(f"17 was found in the B+ Tree == {bPlusTree.find(17) is not None}")
+    print(f"The values from 0 to 50 are {list(bPlusTree.range(0, 50))}")
+
+    # removing keys borrows from or merges the leaves
+    for value in [2, 4, 6, 10, 12]:
+        bPlusTree.remove(value)
+    print(bPlusTree)
+    print(f"12 was found in the B+ Tree == {bPlusTree.find(12) is not None}")
+
     return
 
 if __name__ == "__main__":
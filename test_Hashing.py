@@ -0,0 +1,65 @@
+# Creator: Aidan Scott
+# Date: 10/18/26
+# Description: Checks the batch inserts of the hash tables on empty batches
+# and on batches that do not fit in a fixed-size table, and removing values
+# from probing tables while an incremental rehash is running
+
+from Hashing import HashTableChaining, HashTableProbing, PROBING_STRATEGIES
+import unittest
+
+class InsertManyTest(unittest.TestCase):
+    def testChainingEmptyBatch(self):
+        table = HashTableChaining(11)
+        table.insertMany([])
+        self.assertEqual(len(table), 0)
+
+        table.insertMany([4, 15])
+        table.insertMany([])
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.find(15), 15)
+
+    def testProbingEmptyBatch(self):
+        for backend in ("list", "array"):
+            table = HashTableProbing(11, backend=backend)
+            table.insertMany([])
+            self.assertEqual(len(table), 0)
+
+    def testProbingFullBatchKeepsCount(self):
+        # quadratic probing only reaches half the buckets of a prime table,
+        # so a batch landing on one home bucket runs out of buckets
+        table = HashTableProbing(11, backend="array", maxLoadFactor=None, probing="quadratic")
+        with self.assertRaises(Exception):
+            table.insertMany([11 * i for i in range(11)])
+
+        self.assertEqual(len(table), len(list(table)))
+        self.assertEqual(table.stats()["count"], len(table))
+
+class IncrementalRemoveTest(unittest.TestCase):
+    def testRemoveDuringRehash(self):
+        for probing in PROBING_STRATEGIES:
+            for backend in ("list", "array"):
+                table = HashTableProbing(11, backend=backend, incremental=True, migrationStep=1,
+                                         probing=probing)
+                values = list(range(1, 200, 3))
+                for value in values:
+                    table.insert(value)
+
+                # the table grew while inserting, so most values are still in the old table
+                self.assertTrue(table.isMigrating())
+                removed = values[::2]
+                for value in removed:
+                    self.assertEqual(table.remove(value), value)
+                    self.assertIsNone(table.find(value))
+
+                # each remove only moves a few buckets instead of finishing the rehash
+                self.assertTrue(table.isMigrating())
+                self.assertIsNone(table.remove(values[0]))
+
+                kept = values[1::2]
+                self.assertEqual(len(table), len(kept))
+                self.assertEqual(sorted(table), kept)
+                for value in kept:
+                    self.assertEqual(table.find(value), value)
+
+if __name__ == "__main__":
+    unittest.main()
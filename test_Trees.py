@@ -0,0 +1,69 @@
+# Creator: Aidan Scott
+# Date: 10/18/26
+# Description: Checks that building the trees from sorted values keeps them
+# balanced when the values repeat
+
+from Trees import BinarySearchTree, AVLTree, ArrayAVLTree
+import unittest
+
+def maxHeight(n):
+    """
+    Finds the height of a tree of n values built from sorted values
+    :param n (int): The number of values
+    :return (int): The height, -1 for no values
+    """
+    return n.bit_length() - 1
+
+def isBalanced(node):
+    """
+    Checks that every node of a node based tree is balanced
+    :param node (BinarySearchTree): The root of the subtree
+    :return (bool): True if no node has subtrees more than one apart in height
+    """
+    if node is None:
+        return True
+
+    heights = [-1 if child is None else child.getHeight() for child in (node.getLeftChild(), node.getRightChild())]
+    if abs(heights[0] - heights[1]) > 1:
+        return False
+
+    return isBalanced(node.getLeftChild()) and isBalanced(node.getRightChild())
+
+class FromSortedDuplicatesTest(unittest.TestCase):
+    def checkTree(self, tree, values):
+        """
+        Checks the height, contents and finds of a tree built from values
+        :param tree: The tree built from the values
+        :param values (list): The values the tree was built from
+        :return: None
+        """
+        self.assertLessEqual(tree.getHeight(), maxHeight(len(values)))
+        self.assertEqual(list(tree), sorted(values))
+        for value in set(values):
+            self.assertEqual(tree.find(value), value)
+
+        return
+
+    def testBinarySearchTree(self):
+        for values in ([5] * 3000, [1] * 7 + [2], [3, 1, 2, 2, 2, 4, 2, 1] * 50):
+            tree = BinarySearchTree.fromSorted(values)
+            self.checkTree(tree, values)
+            self.assertTrue(isBalanced(tree))
+
+    def testAVLTree(self):
+        for values in ([5] * 3000, [1] * 7 + [2], [3, 1, 2, 2, 2, 4, 2, 1] * 50):
+            tree = AVLTree.fromSorted(values)
+            self.checkTree(tree, values)
+            self.assertTrue(isBalanced(tree))
+            self.assertEqual(tree.getSize(), len(values))
+            self.assertEqual(tree.countRange(2, 2), values.count(2))
+            self.assertEqual(tree.rank(2), sum(1 for value in values if value < 2))
+
+    def testArrayAVLTree(self):
+        for values in ([5] * 300, [1] * 7 + [2], [3, 1, 2, 2, 2, 4, 2, 1] * 50):
+            tree = ArrayAVLTree.fromSorted(values)
+            self.checkTree(tree, values)
+            self.assertEqual(len(tree), len(values))
+
+if __name__ == "__main__":
+    unittest.main()